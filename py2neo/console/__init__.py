@@ -20,6 +20,7 @@ from __future__ import division, print_function
 
 import shlex
 from datetime import datetime
+from itertools import islice
 from os import makedirs
 from os.path import expanduser, join as path_join
 from subprocess import call
@@ -237,7 +238,8 @@ class Console(object):
             elif statement.upper() == "ROLLBACK":
                 self.rollback_transaction()
             elif self.tx is None:
-                self.run_cypher(self.graph.run, statement, {})
+                tx = self.graph.begin(autocommit=True, stream=True)
+                self.run_cypher(tx.run, statement, {})
             else:
                 self.run_cypher(self.tx.run, statement, {}, line_no=self.tx_counter)
                 self.tx_counter += 1
@@ -260,12 +262,30 @@ class Console(object):
             self.echo(u"({})".format(status), err=True, fg=self.meta_colour, bold=True)
 
     def write_result(self, result, page_size=50):
-        table = Table(result)
-        table_size = len(table)
-        for skip in range(0, table_size, page_size):
-            self.result_writer(table, file=self.output_file, header={"fg": "cyan", "bold": True}, skip=skip, limit=page_size)
-            self.echo("\r\n", nl=False)
-        return table_size
+        """ Write records to the output page by page as they arrive,
+        with column widths taken from each page. If interrupted, the
+        remainder of the result is discarded without being read; a
+        further interrupt while discarding is ignored.
+
+        :return: the number of records written
+        """
+        record_count = 0
+        try:
+            keys = result.keys()
+            while True:
+                page = list(islice(result, page_size))
+                if not page:
+                    break
+                self.result_writer(Table(page, keys), file=self.output_file, header={"fg": "cyan", "bold": True})
+                self.echo("\r\n", nl=False)
+                record_count += len(page)
+        except KeyboardInterrupt:
+            self.echo(u"Interrupted; discarding remaining records", err=True, fg=self.err_colour)
+            try:
+                result.close()
+            except KeyboardInterrupt:
+                pass
+        return record_count
 
     def run_command(self, source):
         source = source.lstrip()
@@ -19,6 +19,7 @@
 from io import StringIO
 from itertools import chain
 from uuid import uuid4
+from warnings import warn
 
 from py2neo.cypher.writing import LabelSetView, cypher_repr, cypher_str
 from py2neo.internal.collections import is_collection
@@ -28,6 +29,19 @@ from py2neo.internal.operations import create_subgraph, merge_subgraph, delete_s
 from py2neo.storage import PropertyDict
 
 
+_relationship_types = {}
+
+
+def new_uuid():
+    """ Generate a UUID string whose seventh-from-last character is
+    not a digit.
+    """
+    uuid = str(uuid4())
+    while "0" <= uuid[-7] <= "9":
+        uuid = str(uuid4())
+    return uuid
+
+
 def html_escape(s):
     return (s.replace(u"&", u"&amp;")
              .replace(u"<", u"&lt;")
@@ -168,7 +182,7 @@ class Subgraph(object):
         merge_subgraph(tx, self, primary_label, primary_key)
 
     def __db_pull__(self, tx):
-        pull_subgraph(tx, self)
+        return pull_subgraph(tx, self)
 
     def __db_push__(self, tx):
         push_subgraph(tx, self)
@@ -305,16 +319,57 @@ class Entity(PropertyDict, Walkable):
     identity = None
 
     def __init__(self, iterable, properties):
+        # Keys of properties set or removed since the entity was last
+        # synchronised with its remote counterpart
+        self._dirty = set()
         Walkable.__init__(self, iterable)
         PropertyDict.__init__(self, properties)
-        uuid = str(uuid4())
-        while "0" <= uuid[-7] <= "9":
-            uuid = str(uuid4())
-        self.__uuid__ = uuid
 
     def __repr__(self):
         return Walkable.__repr__(self)
 
+    @property
+    def __uuid__(self):
+        try:
+            return self.__dict__["_uuid"]
+        except KeyError:
+            uuid = self.__dict__["_uuid"] = new_uuid()
+            return uuid
+
+    def __setitem__(self, key, value):
+        PropertyDict.__setitem__(self, key, value)
+        self._dirty.add(key)
+
+    def __delitem__(self, key):
+        PropertyDict.__delitem__(self, key)
+        self._dirty.add(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self and default is not None:
+            self._dirty.add(key)
+        return PropertyDict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        value = PropertyDict.pop(self, key, *default)
+        self._dirty.add(key)
+        return value
+
+    def popitem(self):
+        key, value = PropertyDict.popitem(self)
+        self._dirty.add(key)
+        return key, value
+
+    def clear(self):
+        self._dirty.update(self.keys())
+        PropertyDict.clear(self)
+
+    def dirty_keys(self):
+        """ Return the set of property keys that have been set or
+        removed locally since this entity was last created, pulled or
+        pushed.
+        """
+        return frozenset(self._dirty)
+
     def __bool__(self):
         return len(self) > 0
 
@@ -346,6 +401,8 @@ class Node(Entity):
 
     """
 
+    _stale_set = None
+
     @classmethod
     def cast(cls, obj):
         """ Cast an arbitrary object to a :class:`Node`. This method
@@ -397,12 +454,20 @@ class Node(Entity):
 
     def __getitem__(self, item):
         if self.graph is not None and self.identity is not None and "properties" in self._stale:
-            self.graph.pull(self)
+            self.__pull_stale()
         return Entity.__getitem__(self, item)
 
+    def __pull_stale(self):
+        # Stale nodes hydrated from the same result are pulled together
+        stale_set = self._stale_set
+        if stale_set is None:
+            self.graph.pull(self)
+        else:
+            stale_set.pull(self)
+
     def __ensure_labels(self):
         if self.graph is not None and self.identity is not None and "labels" in self._stale:
-            self.graph.pull(self)
+            self.__pull_stale()
 
     @property
     def labels(self):
@@ -462,10 +527,16 @@ class Relationship(Entity):
         :param name: relationship type name
         :returns: `type` object
         """
-        for s in Relationship.__subclasses__():
-            if s.__name__ == name:
-                return s
-        return type(xstr(name), (Relationship,), {})
+        try:
+            return _relationship_types[name]
+        except KeyError:
+            for s in Relationship.__subclasses__():
+                if s.__name__ == name:
+                    break
+            else:
+                s = type(xstr(name), (Relationship,), {})
+            _relationship_types[name] = s
+            return s
 
     @classmethod
     def cast(cls, obj, entities=None):
@@ -625,10 +696,117 @@ class Path(Walkable):
         Walkable.__init__(self, walk(*entities))
 
 
+class LiteEntity(object):
+    """ Base class for compact, read-only snapshots of remote entities.
+
+    Lite entities are not held in the entity cache and carry no local
+    state beyond their identity and properties, so they are much
+    cheaper to create in bulk than full :class:`.Entity` objects.
+    """
+
+    __slots__ = ["graph", "identity", "_properties", "_uuid"]
+
+    def __init__(self, graph, identity, properties=None):
+        self.graph = graph
+        self.identity = identity
+        self._properties = properties or {}
+        self._uuid = None
+
+    def __eq__(self, other):
+        try:
+            return type(self) is type(other) and self.graph == other.graph and self.identity == other.identity
+        except (AttributeError, TypeError):
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.identity)
+
+    def __len__(self):
+        return len(self._properties)
+
+    def __iter__(self):
+        return iter(self._properties)
+
+    def __contains__(self, key):
+        return key in self._properties
+
+    def __getitem__(self, key):
+        return self._properties.get(key)
+
+    @property
+    def __uuid__(self):
+        if self._uuid is None:
+            self._uuid = new_uuid()
+        return self._uuid
+
+    def get(self, key, default=None):
+        return self._properties.get(key, default)
+
+    def keys(self):
+        return self._properties.keys()
+
+    def values(self):
+        return self._properties.values()
+
+    def items(self):
+        return self._properties.items()
+
+
+class LiteNode(LiteEntity):
+    """ Lite counterpart of :class:`.Node`, returned by transactions
+    begun with ``lite=True``. Nodes seen only as relationship endpoints
+    have no labels or properties.
+    """
+
+    __slots__ = ["labels"]
+
+    def __init__(self, graph, identity, labels=frozenset(), properties=None):
+        LiteEntity.__init__(self, graph, identity, properties)
+        self.labels = labels
+
+    def __repr__(self):
+        return "<LiteNode identity=%r labels=%r properties=%r>" % (self.identity, set(self.labels), self._properties)
+
+    def has_label(self, label):
+        return label in self.labels
+
+
+class LiteRelationship(LiteEntity):
+    """ Lite counterpart of :class:`.Relationship`, returned by
+    transactions begun with ``lite=True``.
+    """
+
+    __slots__ = ["type", "start_node", "end_node"]
+
+    def __init__(self, graph, identity, type, start_node, end_node, properties=None):
+        LiteEntity.__init__(self, graph, identity, properties)
+        self.type = type
+        self.start_node = start_node
+        self.end_node = end_node
+
+    def __repr__(self):
+        return "<LiteRelationship identity=%r type=%r start=%r end=%r properties=%r>" % (
+            self.identity, self.type, self.start_node.identity, self.end_node.identity, self._properties)
+
+    @property
+    def nodes(self):
+        return self.start_node, self.end_node
+
+
 class Table(list):
     """ Immutable list of records.
+
+    Field metadata is computed lazily, one field at a time, on first
+    request. The text and HTML representations of a long table show
+    only its first and last few rows, along with a total row count.
     """
 
+    #: Maximum number of rows shown by the text and HTML representations.
+    repr_rows = 20
+
     def __init__(self, records, keys=None):
         super(Table, self).__init__(map(tuple, records))
         if keys is None:
@@ -638,35 +816,33 @@ class Table(list):
                 raise ValueError("Missing keys")
         else:
             k = list(map(ustr, keys))
-        width = len(k)
-        t = [set() for _ in range(width)]
-        o = [False] * width
-        for record in self:
-            for i, value in enumerate(record):
-                if value is None:
-                    o[i] = True
-                else:
-                    t[i].add(type(value))
-        f = []
-        for i, _ in enumerate(k):
-            f.append({
-                "type": t[i].copy().pop() if len(t[i]) == 1 else tuple(t[i]),
-                "numeric": all(t_ in numeric_types for t_ in t[i]),
-                "optional": o[i],
-            })
         self._keys = k
-        self._fields = f
+        self._fields = [None] * len(k)
 
     def __repr__(self):
         s = StringIO()
-        self.write(file=s, header=True)
+        rows, ellipsis_at = self._repr_rows()
+        self._write_text(s, True, rows, ellipsis_at)
+        if ellipsis_at is not None:
+            s.write(u"({} rows)\r\n".format(len(self)))
         return s.getvalue()
 
     def _repr_html_(self):
         s = StringIO()
-        self.write_html(file=s, header=True)
+        rows, ellipsis_at = self._repr_rows()
+        self._write_html(s, True, rows, ellipsis_at)
+        if ellipsis_at is not None:
+            s.write(u"<p>{} rows</p>".format(len(self)))
         return s.getvalue()
 
+    def _repr_rows(self):
+        size = len(self)
+        if size <= self.repr_rows:
+            return self, None
+        head = self.repr_rows // 2
+        tail = self.repr_rows - head
+        return self[:head] + self[size - tail:], head
+
     def keys(self):
         """ The list of field names for this table.
 
@@ -681,16 +857,41 @@ class Table(list):
         :return:
         """
         if isinstance(key, integer_types):
-            return self._fields[key]
+            index = key
         elif isinstance(key, string_types):
             try:
                 index = self._keys.index(key)
             except ValueError:
                 raise KeyError(key)
-            else:
-                return self._fields[index]
         else:
             raise TypeError(key)
+        field = self._fields[index]
+        if field is None:
+            types = set()
+            optional = False
+            for record in self:
+                value = record[index]
+                if value is None:
+                    optional = True
+                else:
+                    types.add(type(value))
+            field = self._fields[index] = {
+                "type": types.copy().pop() if len(types) == 1 else tuple(types),
+                "numeric": all(t in numeric_types for t in types),
+                "optional": optional,
+            }
+        return field
+
+    def _numeric_fields(self, rows):
+        """ Determine which fields hold only numeric values within a
+        selection of rows, for alignment purposes.
+        """
+        numeric = [True] * len(self._keys)
+        for row in rows:
+            for i, value in enumerate(row):
+                if value is not None and type(value) not in numeric_types:
+                    numeric[i] = False
+        return numeric
 
     def _range(self, skip, limit):
         if skip is None:
@@ -700,10 +901,17 @@ class Table(list):
         else:
             return range(skip, skip + limit)
 
+    def _rows(self, skip, limit):
+        start = skip or 0
+        return self[start:] if limit is None else self[start:start + limit]
+
     def write(self, file=None, header=None, skip=None, limit=None, auto_align=True,
               padding=1, separator=u"|", newline=u"\r\n"):
         """ Write data to a human-readable table.
 
+        Column widths and alignment are determined only from the rows
+        selected by `skip` and `limit`.
+
         :param file:
         :param header:
         :param skip:
@@ -714,10 +922,16 @@ class Table(list):
         :param newline:
         :return:
         """
+        return self._write_text(file, header, self._rows(skip, limit), None,
+                                auto_align, padding, separator, newline)
+
+    def _write_text(self, file, header, rows, ellipsis_at, auto_align=True,
+                    padding=1, separator=u"|", newline=u"\r\n"):
         from click import secho
 
         space = u" " * padding
         widths = [3 if header else 0] * len(self._keys)
+        numeric = self._numeric_fields(rows) if auto_align else None
 
         def calc_widths(values, **_):
             strings = [cypher_str(value).splitlines(False) for value in values]
@@ -737,7 +951,7 @@ class Table(list):
                         text = strings[x][y]
                     except IndexError:
                         text = u""
-                    if auto_align and self._fields[x]["numeric"]:
+                    if auto_align and numeric[x]:
                         text = space + text.rjust(widths[x]) + space
                         u_text = underline * len(text)
                     else:
@@ -754,16 +968,21 @@ class Table(list):
                 secho(line_text, file, nl=False, **styles)
 
         def apply(f):
-            count = 0
-            for count, index in enumerate(self._range(skip, limit), start=1):
-                if count == 1 and header:
-                    f(self.keys(), underline=u"-")
-                f(self[index])
-            return count
+            return self._apply(f, header, rows, ellipsis_at, underline=u"-")
 
         apply(calc_widths)
         return apply(write_line)
 
+    def _apply(self, f, header, rows, ellipsis_at, **header_styles):
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            if count == 1 and header:
+                f(self.keys(), **header_styles)
+            if count - 1 == ellipsis_at:
+                f([u"..."] * len(self._keys))
+            f(row)
+        return count
+
     def write_html(self, file=None, header=None, skip=None, limit=None, auto_align=True):
         """ Write data to an HTML table.
 
@@ -774,24 +993,25 @@ class Table(list):
         :param auto_align:
         :return:
         """
+        return self._write_html(file, header, self._rows(skip, limit), None, auto_align)
+
+    def _write_html(self, file, header, rows, ellipsis_at, auto_align=True):
         from click import echo
 
-        def write_tr(values, tag):
+        numeric = self._numeric_fields(rows) if auto_align else None
+
+        def write_tr(values, tag=u"td"):
             echo(u"<tr>", file, nl=False)
             for i, value in enumerate(values):
-                if auto_align and self._fields[i]["numeric"]:
+                if auto_align and numeric[i]:
                     template = u'<{} style="text-align:right">{}</{}>'
                 else:
                     template = u'<{} style="text-align:left">{}</{}>'
                 echo(template.format(tag, html_escape(cypher_str(value)), tag), file, nl=False)
             echo(u"</tr>", file, nl=False)
 
-        count = 0
         echo(u"<table>", file, nl=False)
-        for count, index in enumerate(self._range(skip, limit), start=1):
-            if count == 1 and header:
-                write_tr(self.keys(), u"th")
-            write_tr(self[index], u"td")
+        count = self._apply(write_tr, header, rows, ellipsis_at, tag=u"th")
         echo(u"</table>", file, nl=False)
         return count
 
@@ -865,3 +1085,40 @@ class Table(list):
         :return:
         """
         return self.write_separated_values(u"\t", file, header, skip, limit)
+
+    def to_arrow(self, batch_size=65536, schema=None):
+        """ Return the data as a stream of `pyarrow.RecordBatch`
+        objects, each holding at most `batch_size` records. Columns are
+        laid out as for :meth:`.Cursor.to_arrow`.
+
+        :param batch_size:
+        :param schema:
+        :warns: If `pyarrow` is not installed
+        :return: iterator of `RecordBatch` objects
+        """
+        try:
+            from py2neo.internal.arrow import iter_record_batches
+        except ImportError:
+            warn("Pyarrow is not installed. This can be installed directly or via the [arrow] extra.")
+            raise
+        else:
+            return iter_record_batches(self._keys, self, batch_size, schema)
+
+    def write_parquet(self, path, batch_size=65536, schema=None, **options):
+        """ Write the data to a Parquet file, with one row group per
+        batch of at most `batch_size` records.
+
+        :param path:
+        :param batch_size:
+        :param schema:
+        :param options:
+        :warns: If `pyarrow` is not installed
+        :return: number of records written
+        """
+        try:
+            from py2neo.internal.arrow import write_parquet
+        except ImportError:
+            warn("Pyarrow is not installed. This can be installed directly or via the [arrow] extra.")
+            raise
+        else:
+            return write_parquet(path, self._keys, self, batch_size, schema, **options)
@@ -20,15 +20,20 @@ from __future__ import absolute_import
 
 from collections import deque
 from datetime import datetime
+from importlib import import_module
+from itertools import islice
+from re import compile as re_compile, escape as re_escape
 from time import sleep
 from warnings import warn
 
-from py2neo.cypher.writing import cypher_escape
+from py2neo.cypher.writing import CypherEncoder, cypher_escape
 from py2neo.data import Table
 from py2neo.internal.addressing import get_connection_data
-from py2neo.internal.caching import ThreadLocalEntityCache
-from py2neo.internal.compat import string_types, xstr
-from py2neo.storage import Record
+from py2neo.internal.caching import EntityCache
+from py2neo.internal.columns import Column, ColumnSet, iter_data_frames
+from py2neo.internal.compat import string_types, ustr, xstr
+from py2neo.internal.pooling import SessionPool
+from py2neo.storage import record_zipper
 from py2neo.internal.util import version_tuple, title_case, snake_case
 from py2neo.matching import NodeMatcher, RelationshipMatcher
 
@@ -78,6 +83,8 @@ class Database(object):
         """ Forget all cached :class:`.Database` details.
         """
         for _, db in cls._instances.items():
+            for graph in db._graphs.values():
+                graph.session_pool.close()
             db._driver.close()
             db._driver = None
         cls._instances.clear()
@@ -94,7 +101,14 @@ class Database(object):
             inst._driver = Driver(connection_data["uri"],
                                   auth=connection_data["auth"],
                                   encrypted=connection_data["secure"],
-                                  user_agent=connection_data["user_agent"])
+                                  user_agent=connection_data["user_agent"],
+                                  compression=connection_data["compression"],
+                                  http_pool_size=connection_data["http_pool_size"],
+                                  http_pool_block=connection_data["http_pool_block"],
+                                  http_connect_timeout=connection_data["http_connect_timeout"],
+                                  http_read_timeout=connection_data["http_read_timeout"],
+                                  http_retries=connection_data["http_retries"],
+                                  http_keep_alive=connection_data["http_keep_alive"])
             inst._graphs = {}
             cls._instances[key] = inst
         return inst
@@ -135,6 +149,24 @@ class Database(object):
     def driver(self):
         return self._driver
 
+    def http_pool_stats(self, reset=False):
+        """ Return usage statistics for the HTTP connection pool shared
+        by all threads using this database. These include the maximum
+        and peak number of connections in use, the number of
+        connections created, expired and discarded, and the total time
+        spent waiting for a connection.
+
+        :param reset: if :py:const:`True`, reset all counters to zero
+                      after reading them
+        :returns: dictionary of statistics, or :py:const:`None` if this
+                  database is not connected over HTTP
+        """
+        try:
+            http = self._driver._http
+        except AttributeError:
+            return None
+        return http.pool_stats(reset)
+
     @property
     def uri(self):
         """ The URI to which this `Database` is connected.
@@ -152,6 +184,13 @@ class Database(object):
     def keys(self):
         return list(self)
 
+    def cache_stats(self, reset=False):
+        """ Return entity cache statistics for each graph in this
+        database that has been used, keyed by graph name. See
+        :meth:`.Graph.cache_stats`.
+        """
+        return {name: graph.cache_stats(reset) for name, graph in self._graphs.items()}
+
     def query_jmx(self, namespace, instance=None, name=None, type=None):
         """ Query the JMX service attached to this database.
         """
@@ -265,20 +304,34 @@ class Graph(object):
 
     The full set of `settings` supported are:
 
-    auth user_agent secure scheme user password host port
-
-    ==============  =============================================  ==============  =============
-    Keyword         Description                                    Type            Default
-    ==============  =============================================  ==============  =============
-    ``auth``        A 2-tuple of (user, password)                  tuple           ``('neo4j', 'password')``
-    ``host``        Database server host name                      str             ``'localhost'``
-    ``password``    Password to use for authentication             str             ``'password'``
-    ``port``        Database server port                           int             ``7687``
-    ``scheme``      Use a specific URI scheme                      str             ``'bolt'``
-    ``secure``      Use a secure connection (TLS)                  bool            ``False``
-    ``user``        User to authenticate as                        str             ``'neo4j'``
-    ``user_agent``  User agent to send for all connections         str             `(depends on URI scheme)`
-    ==============  =============================================  ==============  =============
+    auth user_agent secure scheme user password host port compression http_pool_size http_pool_block
+    http_connect_timeout http_read_timeout http_retries http_keep_alive session_pool_size session_idle_timeout
+    entity_cache_size
+
+    ========================  =============================================  ==============  =============
+    Keyword                   Description                                    Type            Default
+    ========================  =============================================  ==============  =============
+    ``auth``                  A 2-tuple of (user, password)                  tuple           ``('neo4j', 'password')``
+    ``host``                  Database server host name                      str             ``'localhost'``
+    ``password``              Password to use for authentication             str             ``'password'``
+    ``port``                  Database server port                           int             ``7687``
+    ``scheme``                Use a specific URI scheme                      str             ``'bolt'``
+    ``secure``                Use a secure connection (TLS)                  bool            ``False``
+    ``user``                  User to authenticate as                        str             ``'neo4j'``
+    ``user_agent``            User agent to send for all connections         str             `(depends on URI scheme)`
+    ``compression``           Use gzip compression (HTTP only)               bool            ``False``
+    ``http_pool_size``        Maximum number of pooled HTTP connections      int             ``10``
+    ``http_pool_block``       Wait for a free HTTP connection when all are   bool            ``False``
+                              in use, rather than opening an extra one
+    ``http_connect_timeout``  Seconds allowed to open an HTTP connection     float           ``None``
+    ``http_read_timeout``     Seconds allowed between reads of a response    float           ``None``
+    ``http_retries``          Number of times to retry a failed connection   int             ``3``
+    ``http_keep_alive``       Seconds before an idle HTTP connection is      float           ``None``
+                              closed instead of being reused
+    ``session_pool_size``     Maximum number of idle sessions to keep        int             ``8``
+    ``session_idle_timeout``  Seconds before an idle session is discarded    float           ``60.0``
+    ``entity_cache_size``     Number of recent entities held strongly        int             ``0``
+    ========================  =============================================  ==============  =============
 
     Each setting can be provided as a keyword argument or as part of
     an ``http:``, ``https:``, ``bolt:`` or ``bolt+routing:`` URI. Therefore, the examples
@@ -321,11 +374,20 @@ class Graph(object):
     #: The :class:`.Schema` resource for this :class:`.Graph`.
     schema = None
 
-    node_cache = ThreadLocalEntityCache()
-    relationship_cache = ThreadLocalEntityCache()
+    #: The pool of sessions borrowed by each :class:`.Transaction`.
+    session_pool = None
+
+    #: Identity map of :class:`.Node` objects hydrated from this graph.
+    node_cache = None
+
+    #: Identity map of :class:`.Relationship` objects hydrated from this graph.
+    relationship_cache = None
 
     def __new__(cls, uri=None, **settings):
         name = settings.pop("name", "data")
+        pool_size = settings.pop("session_pool_size", None)
+        idle_timeout = settings.pop("session_idle_timeout", None)
+        cache_size = settings.pop("entity_cache_size", None)
         database = Database(uri, **settings)
         if name in database:
             inst = database[name]
@@ -333,8 +395,18 @@ class Graph(object):
             inst = object.__new__(cls)
             inst.database = database
             inst.schema = Schema(inst)
+            inst.session_pool = SessionPool(database.driver)
+            inst.node_cache = EntityCache()
+            inst.relationship_cache = EntityCache()
             inst.__name__ = name
             database[name] = inst
+        if pool_size is not None:
+            inst.session_pool.max_size = pool_size
+        if idle_timeout is not None:
+            inst.session_pool.idle_timeout = idle_timeout
+        if cache_size is not None:
+            inst.node_cache.max_size = cache_size
+            inst.relationship_cache.max_size = cache_size
         return inst
 
     def __repr__(self):
@@ -363,13 +435,22 @@ class Graph(object):
 
     __nonzero__ = __bool__
 
-    def begin(self, autocommit=False):
+    def begin(self, autocommit=False, stream=False, lite=False):
         """ Begin a new :class:`.Transaction`.
 
         :param autocommit: if :py:const:`True`, the transaction will
                          automatically commit after the first operation
-        """
-        return Transaction(self, autocommit)
+        :param stream: if :py:const:`True` (and `autocommit` is also
+                       :py:const:`True`), the :class:`.Cursor` returned
+                       by the first operation will pull records lazily
+                       from the server instead of buffering the entire
+                       result up front
+        :param lite: if :py:const:`True`, nodes and relationships are
+                     returned as read-only :class:`.LiteNode` and
+                     :class:`.LiteRelationship` snapshots, and paths
+                     as tuples of these, instead of full entities
+        """
+        return Transaction(self, autocommit, stream, lite)
 
     def create(self, subgraph):
         """ Run a :meth:`.Transaction.create` operation within a
@@ -381,6 +462,20 @@ class Graph(object):
         with self.begin() as tx:
             tx.create(subgraph)
 
+    def cache_stats(self, reset=False):
+        """ Return usage statistics for the node and relationship
+        caches of this graph. Each contains counts of cache hits, misses,
+        inserts, explicit removals and evictions from the strong tier,
+        as well as the current number of cached entities and a rough
+        estimate of the memory that they occupy.
+
+        :param reset: if :py:const:`True`, reset all counters to zero
+                      after reading them
+        :returns: dictionary with ``nodes`` and ``relationships`` keys
+        """
+        return {"nodes": self.node_cache.stats(reset),
+                "relationships": self.relationship_cache.stats(reset)}
+
     def delete(self, subgraph):
         """ Run a :meth:`.Transaction.delete` operation within an
         `autocommit` :class:`.Transaction`. To delete only the
@@ -491,9 +586,10 @@ class Graph(object):
         """ Pull data to one or more entities from their remote counterparts.
 
         :param subgraph: the collection of nodes and relationships to pull
+        :returns: list of entities whose remote counterparts no longer exist
         """
         with self.begin() as tx:
-            tx.pull(subgraph)
+            return tx.pull(subgraph)
 
     def push(self, subgraph):
         """ Push data from one or more entities to their remote counterparts.
@@ -520,6 +616,26 @@ class Graph(object):
         """
         return self.begin(autocommit=True).run(cypher, parameters, **kwparameters)
 
+    def run_batch(self, statements):
+        """ Run a sequence of Cypher statements within a single
+        :class:`.Transaction`, sending them to the server together
+        through a :class:`.Pipeline`.
+
+        :param statements: iterable of Cypher statements, each of which
+                           may be either a string or a 2-item sequence
+                           of statement and parameter dictionary
+        :return: list of :class:`.Cursor` objects, in statement order
+        """
+        with self.begin() as tx:
+            with tx.pipeline() as pipeline:
+                for statement in statements:
+                    if isinstance(statement, string_types):
+                        pipeline.run(statement)
+                    else:
+                        cypher, parameters = statement
+                        pipeline.run(cypher, parameters)
+        return pipeline.cursors
+
     def separate(self, subgraph):
         """ Run a :meth:`.Transaction.separate` operation within an
         `autocommit` :class:`.Transaction`.
@@ -626,11 +742,22 @@ class Schema(object):
         return self._get_indexes(label, "node_unique_property")
 
 
+def _ignore(*args):
+    """ Response handler that ignores whatever it is passed.
+    """
+
+
 class Result(object):
     """ Wraps a BoltStatementResult
     """
 
-    def __init__(self, graph, entities, result):
+    _finish = None
+
+    #: Whether a network round trip was made to wait for the result
+    #: header, rather than leaving it to arrive with the records.
+    awaited_header = False
+
+    def __init__(self, graph, entities, result, finish=None, pipelined=False, lite=False):
         from neo4j.v1 import BoltStatementResult
         from py2neo.internal.http import HTTPStatementResult
         from py2neo.internal.packstream import PackStreamHydrator
@@ -639,12 +766,22 @@ class Result(object):
         # TODO: un-yuk this
         if isinstance(result, HTTPStatementResult):
             self.result._hydrant.entities = entities
+            self.result._hydrant.lite = lite
             self.result_iterator = iter(self.result)
         elif isinstance(result, BoltStatementResult):
-            self.result._hydrant = PackStreamHydrator(graph, result.keys(), entities)
-            self.result_iterator = iter(map(Record, self.result))
+            # Waiting for the result header costs a round trip, so a
+            # pipelined result only does so if keys are needed to map
+            # pre-bound entities.
+            # Records are zipped straight into py2neo Records as they
+            # arrive, so the zipper must be in place before any fetch.
+            self.result.zipper = record_zipper()
+            self.awaited_header = bool(entities) or not pipelined
+            keys = result.keys() if self.awaited_header else ()
+            self.result._hydrant = PackStreamHydrator(graph, keys, entities, lite)
+            self.result_iterator = iter(self.result)
         else:
             raise RuntimeError("Unexpected statement result class %r" % result.__class__.__name__)
+        self._finish = finish
 
     def keys(self):
         """ Return the keys for the whole data set.
@@ -702,8 +839,74 @@ class Result(object):
         try:
             return next(self.result_iterator)
         except StopIteration:
+            self.close()
             return None
 
+    def prefetch_endpoints(self):
+        """ Buffer all remaining records, then pull every stale node
+        hydrated from them in a single batch.
+        """
+        self.result_iterator = iter(list(self.result_iterator))
+        return self.result._hydrant.stale_nodes.pull()
+
+    def close(self):
+        """ Discard any records not yet fetched and, for a streamed
+        result, finish the transaction that produced it.
+        """
+        self._close(reset=True)
+
+    def _close(self, reset):
+        finish, self._finish = self._finish, None
+        if finish is not None:
+            try:
+                self._discard(reset)
+            finally:
+                finish()
+
+    def _discard(self, reset):
+        """ Abandon the remainder of a streamed result without reading
+        it. Over Bolt, the connection is reset, which asks the server to
+        stop streaming, or if `reset` is false, simply closed; over HTTP,
+        the response is closed unread.
+        """
+        from neo4j.exceptions import ProtocolError, ServiceUnavailable
+        from py2neo.internal.http import HTTPStatementResult
+        result = self.result
+        self.result_iterator = iter(())
+        result._records.clear()
+        session, result._session = result.session, None
+        if session is None:
+            return
+        if isinstance(result, HTTPStatementResult):
+            session.discard()
+            return
+        connection = session._connection
+        if connection is None:
+            return
+        for response in connection.responses:
+            # Drop anything still in flight rather than hydrating it
+            response.on_records = response.on_success = response.on_failure = response.on_ignored = _ignore
+        try:
+            if reset:
+                connection.reset()
+            else:
+                connection.close()
+        except (ProtocolError, ServiceUnavailable):
+            connection.close()
+        except BaseException:
+            # A reset cut short, by a second interrupt for instance,
+            # leaves a response half read, so the connection cannot be
+            # used again.
+            connection.close()
+            raise
+        finally:
+            session._disconnect(sync=False)
+
+    def __del__(self):
+        # Garbage collection closes the connection rather than resetting
+        # it, so that no network round trip is made from a finalizer.
+        self._close(reset=False)
+
 
 class GraphError(Exception):
     """
@@ -814,12 +1017,18 @@ class Transaction(object):
 
     _finished = False
 
-    def __init__(self, graph, autocommit=False):
+    _streaming = False
+
+    _pipelined = False
+
+    def __init__(self, graph, autocommit=False, stream=False, lite=False):
         self.graph = graph
         self.autocommit = autocommit
+        self.stream = stream
+        self.lite = lite
         self.entities = deque()
-        self.driver = driver = self.graph.database.driver
-        self.session = driver.session()
+        self.driver = self.graph.database.driver
+        self.session = self.graph.session_pool.acquire()
         self.results = []
         if autocommit:
             self.transaction = None
@@ -860,6 +1069,8 @@ class Transaction(object):
         from neo4j.v1 import CypherError
 
         self._assert_unfinished()
+        if self._streaming:
+            raise TransactionFinished(self)
         try:
             entities = self.entities.popleft()
         except IndexError:
@@ -873,11 +1084,18 @@ class Transaction(object):
         except CypherError as error:
             raise GraphError.hydrate({"code": error.code, "message": error.message})
         else:
-            r = Result(self.graph, entities, result)
-            self.results.append(r)
+            if self.stream and not self.transaction:
+                # The session is held until the cursor is exhausted,
+                # closed or garbage collected, at which point the
+                # result finishes this transaction.
+                r = Result(self.graph, entities, result, finish=self.finish, lite=self.lite)
+                self._streaming = True
+            else:
+                r = Result(self.graph, entities, result, pipelined=self._pipelined, lite=self.lite)
+                self.results.append(r)
             return Cursor(r)
         finally:
-            if not self.transaction:
+            if not self.transaction and not self._streaming:
                 self.finish()
 
     def process(self):
@@ -886,13 +1104,33 @@ class Transaction(object):
         self._assert_unfinished()
         self.session.sync()
 
+    def pipeline(self):
+        """ Begin a :class:`.Pipeline` for queuing statements within
+        this transaction and sending them to the server together.
+        Pipelines are not available for `autocommit` transactions.
+
+            >>> with graph.begin() as tx:
+            ...     with tx.pipeline() as pipeline:
+            ...         for name in names:
+            ...             pipeline.run("CREATE (a:Person {name:$x})", x=name)
+
+        :returns: :class:`.Pipeline` object
+        """
+        self._assert_unfinished()
+        if not self.transaction:
+            raise TypeError("Pipelines are not available for autocommit transactions")
+        return Pipeline(self)
+
     def finish(self):
-        self.process()
         if self.transaction:
+            # Closing the transaction sends any pending statements,
+            # together with the commit where the transport allows.
             self.transaction.close()
+        else:
+            self.process()
         self._assert_unfinished()
         self._finished = True
-        self.session.close()
+        self.graph.session_pool.release(self.session)
         self.session = None
 
     def commit(self):
@@ -1032,10 +1270,17 @@ class Transaction(object):
             merge(self, primary_label, primary_key)
 
     def pull(self, subgraph):
-        """ TODO
+        """ Update local entities from their remote counterparts.
+
+        For any nodes and relationships that exist in both the local
+        :class:`.Subgraph` and the remote :class:`.Graph`, pull properties
+        and node labels into the local copies. This operation does not
+        create or delete any entities. Entities whose remote counterparts
+        have been deleted are left unchanged and are instead returned.
 
         :param subgraph: a :class:`.Node`, :class:`.Relationship` or other
                        :class:`.Subgraph`
+        :returns: list of entities whose remote counterparts no longer exist
         """
         try:
             pull = subgraph.__db_pull__
@@ -1072,6 +1317,86 @@ class Transaction(object):
             separate(self)
 
 
+class Pipeline(object):
+    """ A queue of Cypher statements that are sent to the server
+    together, in a single network round trip, when the pipeline is
+    flushed. While a pipeline is open, all statements run within its
+    :class:`.Transaction` are queued in this way, whether or not they
+    are run through the pipeline itself.
+
+    The :class:`.Cursor` returned for each statement can only be
+    navigated once the pipeline has been flushed. This happens
+    automatically on leaving a `with` block.
+    """
+
+    def __init__(self, transaction):
+        self.transaction = transaction
+        transaction._pipelined = True
+        #: All cursors obtained through this pipeline, in statement order.
+        self.cursors = []
+        #: Network round trips made to flush queued statements,
+        #: including any spent waiting for result headers.
+        self.round_trips = 0
+        #: Network round trips saved, compared with sending each
+        #: statement individually.
+        self.round_trips_saved = 0
+        self._queued = 0
+        self._awaited = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.transaction._pipelined = False
+
+    def __len__(self):
+        return self._queued
+
+    def run(self, cypher, parameters=None, **kwparameters):
+        """ Queue a Cypher statement for execution.
+
+        :param cypher: Cypher statement
+        :param parameters: dictionary of parameters
+        :returns: :py:class:`.Cursor` object
+        """
+        cursor = self.transaction.run(cypher, parameters, **kwparameters)
+        self.cursors.append(cursor)
+        self._queued += 1
+        if cursor._result.awaited_header:
+            # Mapping pre-bound entities onto the result needs its keys,
+            # which costs a round trip of its own
+            self._awaited += 1
+        return cursor
+
+    def flush(self):
+        """ Send all queued statements to the server and receive their
+        results.
+
+        :returns: list of cursors for the statements flushed
+        """
+        queued = self._queued
+        if queued:
+            self.transaction.process()
+            round_trips = self._awaited + 1
+            self.round_trips += round_trips
+            self.round_trips_saved += max(queued - round_trips, 0)
+            self._queued = 0
+            self._awaited = 0
+            return self.cursors[-queued:]
+        return []
+
+    def close(self):
+        """ Flush any remaining statements and leave pipeline mode.
+        """
+        try:
+            self.flush()
+        finally:
+            self.transaction._pipelined = False
+
+
 class Cursor(object):
     """ A `Cursor` is a navigator for a stream of records.
 
@@ -1148,7 +1473,10 @@ class Cursor(object):
 
     def close(self):
         """ Close this cursor and free up all associated resources.
+        Any records not yet consumed are discarded.
         """
+        if self._result is not None:
+            self._result.close()
         self._result = None
         self._current = None
 
@@ -1170,6 +1498,17 @@ class Cursor(object):
         s["contains_updates"] = bool(sum(s.get(k, 0) for k in update_stats_keys))
         return s
 
+    def prefetch_endpoints(self):
+        """ Read all remaining records into memory and pull, in a
+        single query, the details of every node that appears in them
+        only as a relationship endpoint. Without this, such nodes are
+        still loaded as one batch, but only on first access to any of
+        them.
+
+        :returns: the number of nodes pulled
+        """
+        return self._result.prefetch_endpoints()
+
     def forward(self, amount=1):
         """ Attempt to move the cursor one position forward (or by
         another amount if explicitly specified). The cursor will move
@@ -1279,18 +1618,24 @@ class Cursor(object):
         .. note::
            This method requires `numpy` to be installed, which can be done directly or via the `sci` extra.
 
+        Values are accumulated column by column as records arrive, with
+        integer and float columns held in compact typed buffers.
+
         :param dtype:
         :param order:
         :warns: If `numpy` is not installed
         :returns: `ndarray <https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html>`__ object.
         """
         try:
-            from numpy import array
+            # Only an availability check, made before the result is consumed
+            import_module("numpy")
         except ImportError:
             warn("Numpy is not installed. This can be installed directly or via the [sci] extra.")
             raise
         else:
-            return array(list(map(list, self)), dtype=dtype, order=order)
+            columns = ColumnSet(self.keys())
+            columns.extend(self)
+            return columns.to_ndarray(dtype=dtype, order=order)
 
     def to_series(self, field=0, index=None, dtype=None):
         """ Consume and extract one field of the entire result as a
@@ -1306,14 +1651,18 @@ class Cursor(object):
         :returns: `Series <http://pandas.pydata.org/pandas-docs/stable/dsintro.html#series>`__ object.
         """
         try:
-            from pandas import Series
+            # Only an availability check, made before the result is consumed
+            import_module("pandas")
         except ImportError:
             warn("Pandas is not installed. This can be installed directly or via the [sci] extra.")
             raise
         else:
-            return Series([record[field] for record in self], index=index, dtype=dtype)
+            column = Column()
+            for record in self:
+                column.append(record[field])
+            return column.to_series(index=index, dtype=dtype)
 
-    def to_data_frame(self, index=None, columns=None, dtype=None):
+    def to_data_frame(self, index=None, columns=None, dtype=None, chunk_size=None):
         """ Consume and extract the entire result as a
         `pandas.DataFrame <http://pandas.pydata.org/pandas-docs/stable/dsintro.html#dataframe>`_.
 
@@ -1328,22 +1677,42 @@ class Cursor(object):
             2    1961  Laurence Fishburne
             3    1960        Hugo Weaving
 
+        Values are accumulated column by column as records arrive, so no
+        intermediate dictionary is built per row. For results too large
+        to hold in memory at once, a `chunk_size` can be given, in which
+        case an iterator of frames of at most that many rows is returned
+        instead::
+
+            >>> for frame in graph.run("MATCH (a:Person) RETURN a.name, a.born").to_data_frame(chunk_size=1000):
+            ...     process(frame)
+
         .. note::
            This method requires `pandas` to be installed, which can be done directly or via the `sci` extra.
 
         :param index: Index to use for resulting frame.
         :param columns: Column labels to use for resulting frame.
-        :param dtype: Data type to force.
+        :param dtype: Data type to force, or a dictionary of data types keyed by column.
+        :param chunk_size: Maximum number of rows per frame, if an iterator of frames is required.
         :warns: If `pandas` is not installed
-        :returns: `DataFrame <http://pandas.pydata.org/pandas-docs/stable/dsintro.html#series>`__ object.
+        :returns: `DataFrame <http://pandas.pydata.org/pandas-docs/stable/dsintro.html#series>`__ object,
+                  or an iterator of such objects if `chunk_size` is given.
         """
         try:
-            from pandas import DataFrame
+            # Only an availability check, made before the result is consumed
+            import_module("pandas")
         except ImportError:
             warn("Pandas is not installed. This can be installed directly or via the [sci] extra.")
             raise
         else:
-            return DataFrame(list(map(dict, self)), index=index, columns=columns, dtype=dtype)
+            if chunk_size is not None:
+                if chunk_size < 1:
+                    raise ValueError("Chunk size must be a positive integer")
+                if index is not None:
+                    raise ValueError("An index cannot be applied to chunked data frames")
+                return iter_data_frames(self.keys(), self, chunk_size, columns=columns, dtype=dtype)
+            column_set = ColumnSet(self.keys())
+            column_set.extend(self)
+            return column_set.to_data_frame(index=index, columns=columns, dtype=dtype)
 
     def to_matrix(self, mutable=False):
         """ Consume and extract the entire result as a
@@ -1365,3 +1734,138 @@ class Cursor(object):
                 return MutableMatrix(list(map(list, self)))
             else:
                 return ImmutableMatrix(list(map(list, self)))
+
+    def write_separated_values(self, separator, file=None, header=None, skip=None, limit=None,
+                               newline=u"\r\n", quote=u"\"", buffer_size=1024):
+        """ Consume the result, writing each record to a
+        delimiter-separated file as it arrives.
+
+        The output is identical to that of
+        :meth:`.Table.write_separated_values`, but no :class:`.Table`
+        is built; records are encoded a whole line at a time and
+        written out in blocks of `buffer_size` lines.
+
+        :param separator:
+        :param file:
+        :param header:
+        :param skip:
+        :param limit:
+        :param newline:
+        :param quote:
+        :param buffer_size:
+        :return: number of records written
+        """
+        from click import echo, secho
+
+        escaped_quote = quote + quote
+        needs_quotes = re_compile(u"[%s]" % re_escape(separator + newline + quote)).search
+        # Everything other than strings, numbers included, is encoded
+        # exactly as by cypher_repr, which is what Table uses
+        encode_other = CypherEncoder().encode_value
+        header_styles = {}
+        if header and isinstance(header, dict):
+            header_styles.update(header)
+
+        def encode(value):
+            if value is None:
+                return u""
+            if isinstance(value, string_types):
+                value = ustr(value)
+                if needs_quotes(value):
+                    value = quote + value.replace(quote, escaped_quote) + quote
+                return value
+            return encode_other(value)
+
+        records = iter(self)
+        if skip or limit is not None:
+            skip = skip or 0
+            records = islice(records, skip, None if limit is None else skip + limit)
+        lines = []
+        count = 0
+        for count, record in enumerate(records, start=1):
+            if count == 1 and header:
+                secho(separator.join(map(encode, self.keys())) + newline, file, nl=False,
+                      underline=u"-", **header_styles)
+            lines.append(separator.join(map(encode, record)) + newline)
+            if len(lines) >= buffer_size:
+                echo(u"".join(lines), file, nl=False)
+                del lines[:]
+        if lines:
+            echo(u"".join(lines), file, nl=False)
+        return count
+
+    def write_csv(self, file=None, header=None, skip=None, limit=None):
+        """ Consume the result, writing it as RFC4180-compatible
+        comma-separated values.
+
+        :param file:
+        :param header:
+        :param skip:
+        :param limit:
+        :return: number of records written
+        """
+        return self.write_separated_values(u",", file, header, skip, limit)
+
+    def write_tsv(self, file=None, header=None, skip=None, limit=None):
+        """ Consume the result, writing it as tab-separated values.
+
+        :param file:
+        :param header:
+        :param skip:
+        :param limit:
+        :return: number of records written
+        """
+        return self.write_separated_values(u"\t", file, header, skip, limit)
+
+    def to_arrow(self, batch_size=65536, schema=None):
+        """ Consume the result as a stream of
+        `pyarrow.RecordBatch <https://arrow.apache.org/docs/python/generated/pyarrow.RecordBatch.html>`_
+        objects, each holding at most `batch_size` records. Only one
+        batch is held in memory at a time.
+
+        Node, relationship and path values are flattened into separate
+        columns; for example, a node column ``a`` is returned as
+        ``a.id``, ``a.labels`` and ``a.properties``, the last of which
+        holds the properties of each node as JSON text. Unless a
+        `schema` is given, this is inferred from the first batch. Maps,
+        lists, columns of mixed types and any column holding only nulls
+        in that batch are returned as JSON text.
+
+        .. note::
+           This method requires `pyarrow` to be installed, which can be done directly or via the `arrow` extra.
+
+        :param batch_size: maximum number of records per batch
+        :param schema: `pyarrow.Schema` to apply to all batches
+        :warns: If `pyarrow` is not installed
+        :returns: iterator of `RecordBatch` objects
+        """
+        try:
+            from py2neo.internal.arrow import iter_record_batches
+        except ImportError:
+            warn("Pyarrow is not installed. This can be installed directly or via the [arrow] extra.")
+            raise
+        else:
+            return iter_record_batches(self.keys(), self, batch_size, schema)
+
+    def write_parquet(self, path, batch_size=65536, schema=None, **options):
+        """ Consume the result, writing it incrementally to a Parquet
+        file with one row group per batch of at most `batch_size`
+        records. Columns are laid out as for :meth:`.to_arrow`.
+
+        .. note::
+           This method requires `pyarrow` to be installed, which can be done directly or via the `arrow` extra.
+
+        :param path: file path or writable file object
+        :param batch_size: maximum number of records per row group
+        :param schema: `pyarrow.Schema` to apply to all row groups
+        :param options: further options for `pyarrow.parquet.ParquetWriter`
+        :warns: If `pyarrow` is not installed
+        :returns: number of records written
+        """
+        try:
+            from py2neo.internal.arrow import write_parquet
+        except ImportError:
+            warn("Pyarrow is not installed. This can be installed directly or via the [arrow] extra.")
+            raise
+        else:
+            return write_parquet(path, self.keys(), self, batch_size, schema, **options)
@@ -0,0 +1,772 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Experimental asyncio interface, mirroring the core of :class:`.Graph`.
+
+Over HTTP and HTTPS, requests are carried by a small non-blocking
+HTTP/1.1 client running on the event loop itself, so that hundreds of
+queries can be in flight on a single thread. Bolt connections are not
+yet available in non-blocking form, so for those, the blocking API is
+driven from the loop's default executor instead.
+
+This module requires Python 3.5 or above.
+
+    >>> from py2neo.experimental.aio import AsyncGraph
+    >>> graph = AsyncGraph("http://localhost:7474")
+    >>> cursor = await graph.run("UNWIND range(1, 3) AS n RETURN n")
+    >>> async for record in cursor:
+    ...     print(record["n"])
+
+"""
+
+
+from asyncio import IncompleteReadError, Semaphore, get_event_loop, open_connection
+from collections import OrderedDict, deque
+from itertools import islice
+
+from py2neo.database import Graph, GraphError, TransactionFinished, update_stats_keys
+from py2neo.internal.addressing import get_connection_data
+from py2neo.internal.compat import urlsplit, ustr
+from py2neo.internal.http import HTTP, fix_parameters
+from py2neo.internal.hydration import bind_node, bind_relationship
+from py2neo.internal.json import JSONDehydrator, JSONHydrator, ResultDataFormat, get_json_codec
+from py2neo.internal.operations import node_dict, node_merge_dict, relationship_dict, \
+    create_nodes_query, merge_nodes_query, merge_relationships_query
+from py2neo.matching import NodeMatch, NodeMatcher
+from py2neo.storage import RecordSchema
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_FETCH_SIZE = 1000
+
+OK = 200
+CREATED = 201
+NOT_FOUND = 404
+UNAUTHORIZED = 401
+FORBIDDEN = 403
+
+
+def fix_stats(stats):
+    stats = dict(stats)
+    # fix broken key
+    if "relationship_deleted" in stats:
+        stats["relationships_deleted"] = stats.pop("relationship_deleted")
+    stats.pop("contains_updates", None)
+    return stats
+
+
+class AsyncHTTP(object):
+    """ Minimal non-blocking HTTP/1.1 client, holding a pool of idle
+    keep-alive connections to a single server. JSON bodies are encoded
+    and decoded by the same codec as used by the blocking client.
+    """
+
+    def __init__(self, uri, headers, verified, max_connections=DEFAULT_MAX_CONNECTIONS, json_codec=None):
+        parts = urlsplit(uri)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError("Unsupported scheme %r" % parts.scheme)
+        self.uri = uri
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path
+        self.ssl = None
+        if parts.scheme == "https":
+            from ssl import create_default_context, CERT_NONE
+            if verified:
+                from certifi import where
+                self.ssl = create_default_context(cafile=where())
+            else:
+                self.ssl = create_default_context()
+                self.ssl.check_hostname = False
+                self.ssl.verify_mode = CERT_NONE
+        self.headers = headers
+        self.json_codec = json_codec or get_json_codec()
+        self.dehydrator = JSONDehydrator()
+        self.result_format = ResultDataFormat()
+        self._idle = []
+        self._semaphore = Semaphore(max_connections)
+
+    async def _open(self):
+        return await open_connection(self.host, self.port, ssl=self.ssl)
+
+    @classmethod
+    async def _read_response(cls, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by server")
+        _, status, _ = status_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            # Body is delimited by the end of the connection
+            data = await reader.read()
+            headers["connection"] = "close"
+        return int(status), headers, data
+
+    async def request(self, method, ref, body=None):
+        """ Send a request and return a 3-tuple of status code, header
+        dictionary and body.
+        """
+        lines = ["%s %s%s HTTP/1.1" % (method, self.path, ref), "Host: %s:%d" % (self.host, self.port)]
+        lines.extend("%s: %s" % item for item in self.headers.items())
+        if body is None:
+            payload = b""
+        else:
+            payload = self.json_codec.dumps(body, default=self.dehydrator.default)
+            lines.append("Content-Type: application/json")
+        lines.append("Content-Length: %d" % len(payload))
+        message = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+        async with self._semaphore:
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._open()
+                try:
+                    writer.write(message)
+                    status, headers, data = await self._read_response(reader)
+                except (ConnectionError, IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # The server may have dropped an idle connection,
+                        # so try again on another.
+                        continue
+                    raise
+                except:
+                    writer.close()
+                    raise
+                if headers.get("connection", "").lower() == "close":
+                    writer.close()
+                else:
+                    self._idle.append((reader, writer))
+                return status, headers, data
+
+    async def post(self, ref, json, expected):
+        """ Perform an HTTP POST to this resource and return the status
+        code, headers and decoded JSON content.
+        """
+        status, headers, data = await self.request("POST", ref, json)
+        if status not in expected:
+            self.raise_error(status, data)
+        return status, headers, self.json_codec.loads(data)
+
+    async def delete(self, ref, expected):
+        """ Perform an HTTP DELETE to this resource.
+        """
+        status, headers, data = await self.request("DELETE", ref)
+        if status not in expected:
+            self.raise_error(status, data)
+        return status
+
+    def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    def raise_error(self, status_code, data):
+        from neo4j.exceptions import AuthError, Forbidden
+        if status_code == UNAUTHORIZED:
+            raise AuthError(self.uri)
+        if status_code == FORBIDDEN:
+            raise Forbidden(self.uri)
+        if data:
+            content = self.json_codec.loads(data)
+        else:
+            content = {}
+        message = content.pop("message", "HTTP request to <%s> returned unexpected status code %s" % (self.uri, status_code))
+        error = GraphError(message, **content)
+        error.http_status_code = status_code
+        raise error
+
+
+class BufferedRecordSource(object):
+    """ Source of records that have already been received in full.
+    """
+
+    def __init__(self, keys, records, stats):
+        self._keys = keys
+        self._records = records
+        self._stats = stats
+
+    def keys(self):
+        return list(self._keys)
+
+    async def fetch(self):
+        records, self._records = self._records, []
+        return records
+
+    async def stats(self):
+        return self._stats
+
+    async def close(self):
+        self._records = []
+
+
+class HTTPRecordSource(object):
+    """ Source of records for a statement carried over HTTP. A statement
+    queued within a transaction is sent, together with any others queued
+    alongside it, the first time that its records are needed.
+    """
+
+    def __init__(self, connector, entities):
+        self._connector = connector
+        self._entities = entities
+        self._keys = None
+        self._records = []
+        self._stats = {}
+        self._received = False
+
+    def keys(self):
+        if self._keys is None:
+            return None
+        return list(self._keys)
+
+    def load(self, graph, result):
+        keys = self._keys = tuple(result["columns"])
+        hydrator = JSONHydrator(graph, keys, self._entities)
+        hydrate = self._connector.http.result_format.hydrate
+        schema = RecordSchema.get(keys)
+        self._records = [schema.record(hydrate(hydrator, data)) for data in result["data"]]
+        self._stats = fix_stats(result["stats"])
+        self._received = True
+
+    def fail(self):
+        self._received = True
+
+    async def _receive(self):
+        if not self._received:
+            await self._connector.send()
+
+    async def fetch(self):
+        await self._receive()
+        records, self._records = self._records, []
+        return records
+
+    async def stats(self):
+        await self._receive()
+        return self._stats
+
+    async def close(self):
+        self._records = []
+
+
+class ExecutorRecordSource(object):
+    """ Source of records pulled, in batches, from a blocking
+    :class:`.Cursor` via the event loop's default executor.
+    """
+
+    def __init__(self, cursor, fetch_size=DEFAULT_FETCH_SIZE):
+        self._cursor = cursor
+        self._fetch_size = fetch_size
+
+    def keys(self):
+        return self._cursor.keys()
+
+    async def fetch(self):
+        return await get_event_loop().run_in_executor(None, lambda: list(islice(self._cursor, self._fetch_size)))
+
+    async def stats(self):
+        return await get_event_loop().run_in_executor(None, self._cursor.stats)
+
+    async def close(self):
+        await get_event_loop().run_in_executor(None, self._cursor.close)
+
+
+class AsyncCursor(object):
+    """ Asynchronous counterpart of :class:`.Cursor`, supporting
+    ``async for`` iteration over the records in a result::
+
+        async for record in cursor:
+            print(record["name"])
+
+    """
+
+    def __init__(self, source):
+        self._source = source
+        self._buffer = deque()
+        self._current = None
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if await self.forward():
+            return self._current
+        else:
+            raise StopAsyncIteration()
+
+    def current(self):
+        """ Returns the current record or :py:const:`None` if no record
+        has yet been selected.
+        """
+        return self._current
+
+    def keys(self):
+        """ Return the field names for the records in the stream. For a
+        statement still queued within a transaction, keys only become
+        available once the statement has been sent, and :const:`None`
+        is returned until then.
+        """
+        return self._source.keys()
+
+    async def stats(self):
+        """ Return the query statistics.
+        """
+        s = dict.fromkeys(update_stats_keys, 0)
+        s.update(await self._source.stats())
+        s["contains_updates"] = bool(sum(s.get(k, 0) for k in update_stats_keys))
+        return s
+
+    async def forward(self, amount=1):
+        """ Attempt to move the cursor forward by up to `amount`
+        records, returning the number of records actually moved.
+        """
+        moved = 0
+        buffer = self._buffer
+        while moved != amount:
+            if not buffer:
+                if self._exhausted:
+                    break
+                records = await self._source.fetch()
+                if not records:
+                    self._exhausted = True
+                    break
+                buffer.extend(records)
+            self._current = buffer.popleft()
+            moved += 1
+        return moved
+
+    async def evaluate(self, field=0):
+        """ Return the value of the first field from the next record
+        (or the value of another field if explicitly specified).
+        """
+        if await self.forward():
+            try:
+                return self._current[field]
+            except IndexError:
+                return None
+        else:
+            return None
+
+    async def data(self):
+        """ Consume and extract the entire result as a list of
+        dictionaries.
+        """
+        data = []
+        while await self.forward():
+            data.append(self._current.data())
+        return data
+
+    async def close(self):
+        """ Close this cursor and free up all associated resources.
+        """
+        self._buffer.clear()
+        self._exhausted = True
+        self._current = None
+        await self._source.close()
+
+
+class HTTPTransactionConnector(object):
+    """ Carries the statements of a single :class:`.AsyncTransaction`
+    over the transactional HTTP endpoint, without blocking.
+
+    As for the blocking :class:`.HTTPSession`, statements are queued
+    until their results are needed, and are then sent together in a
+    single request. Statements still queued on commit are sent along
+    with the commit itself, so a transaction whose results are not read
+    until it ends costs only one request.
+    """
+
+    begin_ref = "transaction"
+
+    autocommit_ref = "transaction/commit"
+
+    def __init__(self, graph, autocommit):
+        self.graph = graph
+        self.http = graph.http
+        self.autocommit = autocommit
+        self.transaction_ref = None
+        self._statements = []
+        self._sources = []
+
+    async def run(self, cypher, parameters, entities):
+        self._statements.append(OrderedDict([
+            ("statement", ustr(cypher)),
+            ("parameters", fix_parameters(parameters)),
+            ("resultDataContents", self.http.result_format.contents()),
+            ("includeStats", True),
+        ]))
+        source = HTTPRecordSource(self, entities)
+        self._sources.append(source)
+        if self.autocommit:
+            await self._send(self.autocommit_ref)
+        return AsyncCursor(source)
+
+    async def send(self):
+        """ Send all queued statements in a single request, opening the
+        transaction on the server if this has not already happened.
+        """
+        if self._statements:
+            await self._send(self.transaction_ref or self.begin_ref)
+
+    async def _send(self, ref):
+        statements, self._statements = self._statements, []
+        sources, self._sources = self._sources, []
+        try:
+            status, headers, content = await self.http.post(ref, {"statements": statements},
+                                                            expected=(OK, CREATED))
+            if status == CREATED:
+                location_path = urlsplit(headers["location"]).path
+                self.transaction_ref = "".join(location_path.rpartition("transaction")[1:])
+            graph = self.graph.graph
+            for source, result in zip(sources, content["results"]):
+                source.load(graph, result)
+            errors = content["errors"]
+            if errors:
+                raise GraphError.hydrate(errors[0])
+        finally:
+            # Results not received, because of an error, are left empty
+            for source in sources:
+                source.fail()
+
+    async def commit(self):
+        if self.transaction_ref is None:
+            if self._statements:
+                await self._send(self.autocommit_ref)
+        else:
+            ref, self.transaction_ref = "%s/commit" % self.transaction_ref, None
+            await self._send(ref)
+
+    async def rollback(self):
+        for source in self._sources:
+            source.fail()
+        self._statements[:] = ()
+        self._sources[:] = ()
+        if self.transaction_ref is not None:
+            ref, self.transaction_ref = self.transaction_ref, None
+            await self.http.delete(ref, expected=(OK, NOT_FOUND))
+
+
+class ExecutorTransactionConnector(object):
+    """ Carries the statements of a single :class:`.AsyncTransaction`
+    through a blocking :class:`.Transaction`, driven from the event
+    loop's default executor.
+    """
+
+    def __init__(self, graph, autocommit):
+        self.graph = graph.graph
+        self.autocommit = autocommit
+        self.tx = None
+
+    async def run(self, cypher, parameters, entities):
+
+        def run_():
+            if self.tx is None:
+                self.tx = self.graph.begin(autocommit=self.autocommit, stream=self.autocommit)
+            if entities:
+                self.tx.entities.appendleft(entities)
+            return self.tx.run(cypher, parameters)
+
+        cursor = await get_event_loop().run_in_executor(None, run_)
+        return AsyncCursor(ExecutorRecordSource(cursor))
+
+    async def commit(self):
+        if self.tx is not None and not self.autocommit:
+            await get_event_loop().run_in_executor(None, self.tx.commit)
+
+    async def rollback(self):
+        if self.tx is not None and not self.autocommit:
+            await get_event_loop().run_in_executor(None, self.tx.rollback)
+
+
+class AsyncTransaction(object):
+    """ Asynchronous counterpart of :class:`.Transaction`. This can be
+    used as an asynchronous context manager, committing on successful
+    exit and rolling back otherwise::
+
+        async with graph.begin() as tx:
+            await tx.create(subgraph)
+
+    """
+
+    _finished = False
+
+    def __init__(self, graph, autocommit=False):
+        self.graph = graph
+        self.autocommit = autocommit
+        self.entities = deque()
+        self._connector = graph.connector_class(graph, autocommit)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    def _assert_unfinished(self):
+        if self._finished:
+            raise TransactionFinished(self)
+
+    def finished(self):
+        """ Indicates whether or not this transaction has been completed
+        or is still open.
+        """
+        return self._finished
+
+    async def run(self, cypher, parameters=None, **kwparameters):
+        """ Send a Cypher statement to the server for execution and return
+        an :py:class:`.AsyncCursor` for navigating its result.
+
+        :param cypher: Cypher statement
+        :param parameters: dictionary of parameters
+        :returns: :py:class:`.AsyncCursor` object
+        """
+        self._assert_unfinished()
+        try:
+            entities = self.entities.popleft()
+        except IndexError:
+            entities = {}
+        try:
+            return await self._connector.run(cypher, dict(parameters or {}, **kwparameters), entities)
+        finally:
+            if self.autocommit:
+                self._finished = True
+
+    async def evaluate(self, cypher, parameters=None, **kwparameters):
+        """ Execute a single Cypher statement and return the value from
+        the first column of the first record.
+        """
+        cursor = await self.run(cypher, parameters, **kwparameters)
+        return await cursor.evaluate(0)
+
+    async def commit(self):
+        """ Commit the transaction.
+        """
+        self._assert_unfinished()
+        self._finished = True
+        await self._connector.commit()
+
+    async def rollback(self):
+        """ Roll back the current transaction, undoing all actions previously taken.
+        """
+        self._assert_unfinished()
+        self._finished = True
+        await self._connector.rollback()
+
+    async def _ids(self, cypher, data):
+        cursor = await self.run(cypher, x=data)
+        identities = []
+        while await cursor.forward():
+            identities.append(cursor.current()[0])
+        return identities
+
+    async def _merge_relationships(self, relationships):
+        graph = self.graph.graph
+        for r_type, relationships in relationship_dict(r for r in relationships if r.graph is None).items():
+            identities = await self._ids(merge_relationships_query(r_type), [
+                [r.start_node.identity, r.end_node.identity, dict(r)] for r in relationships])
+            for i, identity in enumerate(identities):
+                bind_relationship(graph, relationships[i], identity)
+
+    async def create(self, subgraph):
+        """ Create remote nodes and relationships that correspond to those
+        in a local subgraph, as for :meth:`.Transaction.create`.
+        """
+        graph = self.graph.graph
+        for labels, nodes in node_dict(n for n in subgraph.nodes if n.graph is None).items():
+            identities = await self._ids(create_nodes_query(labels), list(map(dict, nodes)))
+            for i, identity in enumerate(identities):
+                bind_node(graph, nodes[i], identity, labels)
+        await self._merge_relationships(subgraph.relationships)
+
+    async def merge(self, subgraph, primary_label=None, primary_key=None):
+        """ Merge nodes and relationships from a local subgraph into the
+        database, as for :meth:`.Transaction.merge`.
+        """
+        graph = self.graph.graph
+        nodes_to_merge = (n for n in subgraph.nodes if n.graph is None)
+        for (pl, pk, labels), nodes in node_merge_dict(primary_label, primary_key, nodes_to_merge).items():
+            if pl is None or pk is None:
+                raise ValueError("Primary label and primary key are required for MERGE operation")
+            identities = await self._ids(merge_nodes_query(pl, pk, labels), [[n.get(pk), dict(n)] for n in nodes])
+            for i, identity in enumerate(identities):
+                bind_node(graph, nodes[i], identity, labels)
+        await self._merge_relationships(subgraph.relationships)
+
+
+class AsyncNodeMatch(NodeMatch):
+    """ Asynchronous counterpart of :class:`.NodeMatch`. Matched nodes
+    are obtained using ``async for`` rather than plain iteration.
+    """
+
+    def __len__(self):
+        raise TypeError("Use 'await match.count()' to count matching nodes")
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate through matching nodes")
+
+    def __aiter__(self):
+        return AsyncNodeMatchIterator(self.graph, self._query_and_parameters())
+
+    async def count(self):
+        """ Count matching nodes.
+        """
+        return await self.graph.evaluate(*self._query_and_parameters(count=True))
+
+    async def first(self):
+        """ Evaluate the match and return the first :class:`.Node`
+        matched or :const:`None` if no matching nodes are found.
+        """
+        return await self.graph.evaluate(*self._query_and_parameters())
+
+
+class AsyncNodeMatchIterator(object):
+
+    def __init__(self, graph, query_and_parameters):
+        self._graph = graph
+        self._query_and_parameters = query_and_parameters
+        self._cursor = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._cursor is None:
+            self._cursor = await self._graph.run(*self._query_and_parameters)
+        record = await self._cursor.__anext__()
+        return record[0]
+
+
+class AsyncNodeMatcher(NodeMatcher):
+    """ Asynchronous counterpart of :class:`.NodeMatcher`.
+    """
+
+    _match_class = AsyncNodeMatch
+
+    def __getitem__(self, identity):
+        raise TypeError("Use 'await matcher.get(identity)' to get a node by identity")
+
+    async def get(self, identity):
+        """ Return the :class:`.Node` with a given identity, or
+        :py:const:`None` if no such node exists.
+        """
+        try:
+            return self.graph.node_cache[identity]
+        except KeyError:
+            return await self.match().where("id(_) = %d" % identity).first()
+
+
+class AsyncGraph(object):
+    """ Asynchronous counterpart of :class:`.Graph`, accepting the same
+    URI and settings. Nodes and relationships returned are bound to the
+    equivalent blocking :class:`.Graph`, available as :attr:`.graph`.
+    """
+
+    def __init__(self, uri=None, **settings):
+        max_connections = settings.pop("max_connections", DEFAULT_MAX_CONNECTIONS)
+        #: The blocking :class:`.Graph` to which entities are bound.
+        self.graph = Graph(uri, **settings)
+        connection_data = get_connection_data(uri, **settings)
+        if connection_data["scheme"] in ("http", "https"):
+            self.http = AsyncHTTP(connection_data["uri"] + "/db/data/", {
+                "Authorization": HTTP.authorization(connection_data["user"], connection_data["password"]),
+                "User-Agent": connection_data["user_agent"],
+                "X-Stream": "true",
+            }, connection_data["verified"], max_connections)
+            self.connector_class = HTTPTransactionConnector
+        else:
+            self.http = None
+            self.connector_class = ExecutorTransactionConnector
+
+    def __repr__(self):
+        return "<AsyncGraph database=%r name=%r>" % (self.graph.database, self.graph.name)
+
+    @property
+    def node_cache(self):
+        return self.graph.node_cache
+
+    @property
+    def relationship_cache(self):
+        return self.graph.relationship_cache
+
+    def begin(self, autocommit=False):
+        """ Begin a new :class:`.AsyncTransaction`.
+
+        :param autocommit: if :py:const:`True`, the transaction will
+                         automatically commit after the first operation
+        """
+        return AsyncTransaction(self, autocommit)
+
+    async def run(self, cypher, parameters=None, **kwparameters):
+        """ Run an :meth:`.AsyncTransaction.run` operation within an
+        `autocommit` :class:`.AsyncTransaction`.
+        """
+        return await self.begin(autocommit=True).run(cypher, parameters, **kwparameters)
+
+    async def evaluate(self, cypher, parameters=None, **kwparameters):
+        """ Run an :meth:`.AsyncTransaction.evaluate` operation within an
+        `autocommit` :class:`.AsyncTransaction`.
+        """
+        return await self.begin(autocommit=True).evaluate(cypher, parameters, **kwparameters)
+
+    async def create(self, subgraph):
+        """ Run an :meth:`.AsyncTransaction.create` operation within an
+        :class:`.AsyncTransaction`.
+        """
+        async with self.begin() as tx:
+            await tx.create(subgraph)
+
+    async def merge(self, subgraph, label=None, *property_keys):
+        """ Run an :meth:`.AsyncTransaction.merge` operation within an
+        :class:`.AsyncTransaction`.
+        """
+        async with self.begin() as tx:
+            await tx.merge(subgraph, label, *property_keys)
+
+    @property
+    def nodes(self):
+        """ Obtain an :class:`.AsyncNodeMatcher` for this graph.
+        """
+        return AsyncNodeMatcher(self)
+
+    def close(self):
+        """ Close any idle network connections held by this graph.
+        """
+        if self.http:
+            self.http.close()
@@ -45,6 +45,10 @@ DEFAULT_HOST = "localhost"
 DEFAULT_BOLT_PORT = 7687
 DEFAULT_HTTP_PORT = 7474
 DEFAULT_HTTPS_PORT = 7473
+DEFAULT_COMPRESSION = False
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_POOL_BLOCK = False
+DEFAULT_HTTP_RETRIES = 3
 
 
 def address_str(address):
@@ -63,7 +67,14 @@ def get_connection_data(uri=None, **settings):
     :return:
     """
     data = {
+        "compression": None,
         "host": None,
+        "http_connect_timeout": None,
+        "http_keep_alive": None,
+        "http_pool_block": None,
+        "http_pool_size": None,
+        "http_read_timeout": None,
+        "http_retries": None,
         "password": None,
         "port": None,
         "scheme": None,
@@ -100,6 +111,13 @@ def get_connection_data(uri=None, **settings):
     data["password"] = coalesce(settings.get("password"), data["password"])
     data["host"] = coalesce(settings.get("host"), data["host"])
     data["port"] = coalesce(settings.get("port"), data["port"])
+    data["compression"] = coalesce(settings.get("compression"), data["compression"])
+    data["http_pool_size"] = coalesce(settings.get("http_pool_size"), data["http_pool_size"])
+    data["http_pool_block"] = coalesce(settings.get("http_pool_block"), data["http_pool_block"])
+    data["http_connect_timeout"] = coalesce(settings.get("http_connect_timeout"), data["http_connect_timeout"])
+    data["http_read_timeout"] = coalesce(settings.get("http_read_timeout"), data["http_read_timeout"])
+    data["http_retries"] = coalesce(settings.get("http_retries"), data["http_retries"])
+    data["http_keep_alive"] = coalesce(settings.get("http_keep_alive"), data["http_keep_alive"])
     # apply correct scheme for security
     if data["secure"] is True and data["scheme"] == "http":
         data["scheme"] = "https"
@@ -120,6 +138,14 @@ def get_connection_data(uri=None, **settings):
         data["secure"] = DEFAULT_SECURE
     if data["verified"] is None:
         data["verified"] = DEFAULT_VERIFIED
+    if data["compression"] is None:
+        data["compression"] = DEFAULT_COMPRESSION
+    if data["http_pool_size"] is None:
+        data["http_pool_size"] = DEFAULT_HTTP_POOL_SIZE
+    if data["http_pool_block"] is None:
+        data["http_pool_block"] = DEFAULT_HTTP_POOL_BLOCK
+    if data["http_retries"] is None:
+        data["http_retries"] = DEFAULT_HTTP_RETRIES
     if not data["scheme"]:
         data["scheme"] = DEFAULT_SCHEME
         if data["scheme"] == "http":
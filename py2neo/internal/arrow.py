@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Conversion of result records into Apache Arrow record batches and
+Parquet files, one batch at a time.
+
+Graph structures are flattened into plain columns named after the
+original key: a node column ``a`` becomes ``a.id``, ``a.labels`` and
+``a.properties``; a relationship column ``r`` becomes ``r.id``,
+``r.type``, ``r.start``, ``r.end`` and ``r.properties``; and a path
+column ``p`` becomes ``p.nodes`` and ``p.relationships``, each a list
+of identities. Properties are held as JSON text, so that entities with
+different property keys, or with values of different types under the
+same key, can share a column.
+
+Unless given explicitly, the schema is fixed by the first batch and
+applied to all subsequent batches, so that every batch (and every
+Parquet row group) has the same layout. The layout of each column is
+taken from its first non-null value in that batch, and the type of a
+scalar column from all of its values in that batch. Maps and lists, and
+columns whose values in the first batch share no single Arrow type
+(such as a mix of integers and strings, or integers beyond 64 bits),
+are stored as JSON text. So is a column holding nothing but nulls in
+the first batch, as that gives nothing to go on. A value in a later
+batch that does not fit the type of its scalar column is an error.
+"""
+
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from itertools import islice
+from json import dumps as json_dumps
+
+import pyarrow
+
+from py2neo.data import Node, Relationship, Path, LiteNode, LiteRelationship
+from py2neo.internal.compat import ustr
+
+
+DEFAULT_BATCH_SIZE = 65536
+
+
+def dumps(value):
+    """ Encode a value as JSON text, falling back to the string form of
+    any value that has no JSON equivalent, such as a date or a point.
+    """
+    return json_dumps(value, sort_keys=True, separators=(",", ":"), default=ustr)
+
+
+def relationship_type(relationship):
+    if isinstance(relationship, LiteRelationship):
+        return relationship.type
+    return type(relationship).__name__
+
+
+def flatten_node(node):
+    return node.identity, sorted(node.labels), dumps(dict(node))
+
+
+def flatten_relationship(relationship):
+    return (relationship.identity, relationship_type(relationship), relationship.start_node.identity,
+            relationship.end_node.identity, dumps(dict(relationship)))
+
+
+def flatten_path(path):
+    return ([node.identity for node in path.nodes],
+            [relationship.identity for relationship in path.relationships])
+
+
+flatteners = [
+    ((Node, LiteNode), OrderedDict([
+        ("id", pyarrow.int64()),
+        ("labels", pyarrow.list_(pyarrow.string())),
+        ("properties", pyarrow.string()),
+    ]), flatten_node),
+    ((Relationship, LiteRelationship), OrderedDict([
+        ("id", pyarrow.int64()),
+        ("type", pyarrow.string()),
+        ("start", pyarrow.int64()),
+        ("end", pyarrow.int64()),
+        ("properties", pyarrow.string()),
+    ]), flatten_relationship),
+    (Path, OrderedDict([
+        ("nodes", pyarrow.list_(pyarrow.int64())),
+        ("relationships", pyarrow.list_(pyarrow.int64())),
+    ]), flatten_path),
+]
+
+
+def jsonable(value):
+    """ Convert a value into a form that can be encoded as JSON, with
+    nodes, relationships and paths laid out as for flattened columns.
+    """
+    if isinstance(value, (Node, LiteNode)):
+        return OrderedDict(zip(("id", "labels", "properties"),
+                               (value.identity, sorted(value.labels), dict(value))))
+    elif isinstance(value, (Relationship, LiteRelationship)):
+        return OrderedDict(zip(("id", "type", "start", "end", "properties"),
+                               (value.identity, relationship_type(value), value.start_node.identity,
+                                value.end_node.identity, dict(value))))
+    elif isinstance(value, Path):
+        return OrderedDict(zip(("nodes", "relationships"), flatten_path(value)))
+    elif isinstance(value, dict):
+        return {key: jsonable(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return list(map(jsonable, value))
+    else:
+        return value
+
+
+SCALAR = "scalar"
+JSON = "json"
+
+
+class RecordBatchBuilder(object):
+    """ Builds Arrow record batches from successive lists of records
+    sharing a common set of keys.
+    """
+
+    def __init__(self, keys, schema=None):
+        self.keys = list(keys)
+        self.schema = schema
+        self._plan = None
+
+    def _make_plan(self, rows):
+        """ Decide how each column is laid out, either from the names
+        in an explicit schema or from the values in the first batch.
+        Each entry in the plan also carries the Arrow type inferred for
+        a scalar column, if there is no explicit schema.
+        """
+        plan = []
+        names = set(self.schema.names) if self.schema is not None else None
+        for i, key in enumerate(self.keys):
+            kind = JSON
+            scalar_type = None
+            if names is not None:
+                kind = SCALAR
+                for _, fields, flatten in flatteners:
+                    if all("%s.%s" % (key, field) in names for field in fields):
+                        kind = fields, flatten
+                        break
+            else:
+                for row in rows:
+                    value = row[i]
+                    if value is None:
+                        continue
+                    for types, fields, flatten in flatteners:
+                        if isinstance(value, types):
+                            kind = fields, flatten
+                            break
+                    else:
+                        if not isinstance(value, (dict, list, tuple)):
+                            kind, scalar_type = self._scalar_type([row[i] for row in rows])
+                    break
+            plan.append((i, key, kind, scalar_type))
+        return plan
+
+    @staticmethod
+    def _scalar_type(column):
+        """ Infer a single Arrow type for the values in a column, or
+        fall back to JSON if there is none.
+        """
+        try:
+            return SCALAR, pyarrow.array(column).type
+        except (pyarrow.ArrowException, OverflowError):
+            return JSON, None
+
+    def _columns(self, rows):
+        data = OrderedDict()
+        types = OrderedDict()
+        for i, key, kind, scalar_type in self._plan:
+            if kind is SCALAR:
+                data[key] = [row[i] for row in rows]
+                types[key] = scalar_type
+            elif kind is JSON:
+                data[key] = [None if row[i] is None else dumps(jsonable(row[i])) for row in rows]
+                types[key] = pyarrow.string()
+            else:
+                fields, flatten = kind
+                columns = [[] for _ in fields]
+                nulls = (None,) * len(fields)
+                for row in rows:
+                    value = row[i]
+                    for column, v in zip(columns, nulls if value is None else flatten(value)):
+                        column.append(v)
+                for (field, type_), column in zip(fields.items(), columns):
+                    name = "%s.%s" % (key, field)
+                    data[name] = column
+                    types[name] = type_
+        return data, types
+
+    def build(self, rows):
+        """ Build a record batch from a list of records.
+        """
+        if self._plan is None:
+            self._plan = self._make_plan(rows)
+        data, types = self._columns(rows)
+        if self.schema is None:
+            self.schema = pyarrow.schema([pyarrow.field(name, types[name]) for name in data])
+        return pyarrow.RecordBatch.from_pydict(data, schema=self.schema)
+
+
+def iter_record_batches(keys, records, batch_size=DEFAULT_BATCH_SIZE, schema=None):
+    """ Consume an iterable of records, yielding Arrow record batches
+    of at most `batch_size` rows each.
+    """
+    builder = RecordBatchBuilder(keys, schema)
+    records = iter(records)
+    while True:
+        rows = list(islice(records, batch_size))
+        if not rows:
+            break
+        yield builder.build(rows)
+
+
+def write_parquet(path, keys, records, batch_size=DEFAULT_BATCH_SIZE, schema=None, **options):
+    """ Consume an iterable of records, writing each batch of at most
+    `batch_size` rows as a separate row group of a Parquet file.
+
+    :return: number of records written
+    """
+    from pyarrow.parquet import ParquetWriter
+    writer = None
+    count = 0
+    try:
+        for batch in iter_record_batches(keys, records, batch_size, schema):
+            if writer is None:
+                writer = ParquetWriter(path, batch.schema, **options)
+            writer.write_table(pyarrow.Table.from_batches([batch]))
+            count += batch.num_rows
+        if writer is None:
+            if schema is None:
+                schema = pyarrow.schema([pyarrow.field(key, pyarrow.null()) for key in keys])
+            writer = ParquetWriter(path, schema, **options)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
@@ -16,27 +16,152 @@
 # limitations under the License.
 
 
-from threading import Lock, local
+from collections import OrderedDict
+from itertools import islice
+from sys import getsizeof
+from threading import Lock
 from weakref import WeakValueDictionary
 
 
-class ThreadLocalEntityCache(local):
+DEFAULT_ENTITY_CACHE_SIZE = 0
+MEMORY_SAMPLE_SIZE = 100
 
-    def __init__(self):
+
+def estimate_size(obj):
+    """ Roughly estimate the memory footprint of an object, including
+    its attributes and, for a dictionary, its keys and values.
+    """
+    size = getsizeof(obj)
+    try:
+        attributes = vars(obj)
+    except TypeError:
+        pass
+    else:
+        size += getsizeof(attributes)
+    if isinstance(obj, dict):
+        size += sum(getsizeof(key) + getsizeof(value) for key, value in dict.items(obj))
+    return size
+
+
+class EntityCache(object):
+    """ Identity map of entities keyed by identity, shared by all threads
+    using a single :class:`.Graph`.
+
+    Entities are held weakly, so that each is kept only for as long as
+    it is in use elsewhere. An optional strong tier additionally keeps
+    up to `max_size` of the most recently used entities alive, so that
+    frequently accessed entities survive garbage collection.
+
+    Plain lookups take no lock unless the strong tier is enabled, and
+    the hit and miss counts they keep are updated without one, so these
+    may slightly undercount under heavy contention. Insert, remove and
+    evict counts, and hit and miss counts for updates, are maintained
+    while the cache lock is held.
+    """
+
+    def __init__(self, max_size=DEFAULT_ENTITY_CACHE_SIZE):
         self.lock = Lock()
+        self.max_size = max_size
         self._dict = WeakValueDictionary()
+        self._recent = OrderedDict()
+        self.reset_stats()
 
     def __contains__(self, key):
         return key in self._dict
 
     def __getitem__(self, key):
-        return self._dict[key]
+        try:
+            value = self._dict[key]
+        except KeyError:
+            self._misses += 1
+            raise
+        self._hits += 1
+        if self.max_size:
+            with self.lock:
+                self._touch(key, value)
+        return value
+
+    def __len__(self):
+        return len(self._dict)
+
+    def _touch(self, key, value):
+        if self.max_size:
+            recent = self._recent
+            recent.pop(key, None)
+            recent[key] = value
+            while len(recent) > self.max_size:
+                recent.popitem(last=False)
+                self._evictions += 1
 
     def clear(self):
-        self._dict.clear()
+        with self.lock:
+            self._dict.clear()
+            self._recent.clear()
 
     def keys(self):
-        return self._dict.keys()
+        with self.lock:
+            return list(self._dict.keys())
+
+    def stats(self, reset=False):
+        """ Return a dictionary of usage statistics for this cache,
+        optionally resetting all counters to zero at the same time.
+
+        The memory estimate is extrapolated from a sample of cached
+        entities and does not include objects they refer to, such as
+        the nodes at either end of a relationship.
+        """
+        with self.lock:
+            size = len(self._dict)
+            sample = list(islice(self._dict.values(), MEMORY_SAMPLE_SIZE))
+            stats = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "inserts": self._inserts,
+                "removals": self._removals,
+                "evictions": self._evictions,
+                "size": size,
+                "strong_size": len(self._recent),
+                "max_strong_size": self.max_size,
+            }
+            if reset:
+                self.reset_stats()
+        if sample:
+            stats["estimated_memory"] = size * sum(map(estimate_size, sample)) // len(sample)
+        else:
+            stats["estimated_memory"] = 0
+        return stats
+
+    def reset_stats(self):
+        """ Reset all usage counters to zero.
+        """
+        self._hits = 0
+        self._misses = 0
+        self._inserts = 0
+        self._removals = 0
+        self._evictions = 0
+
+    def update_all(self, keys, constructor):
+        """ Extract the value for each of a sequence of keys, calling
+        `constructor` with the key to create and insert a value for any
+        key not yet cached. The lock is taken once for the whole batch.
+
+        :returns: list of values, in key order
+        """
+        values = []
+        with self.lock:
+            for key in keys:
+                try:
+                    value = self._dict[key]
+                except KeyError:
+                    self._misses += 1
+                    value = constructor(key)
+                    self._dict[key] = value
+                    self._inserts += 1
+                else:
+                    self._hits += 1
+                self._touch(key, value)
+                values.append(value)
+        return values
 
     def update(self, key, value):
         """ Extract, insert or remove a value for a given key.
@@ -44,22 +169,33 @@ class ThreadLocalEntityCache(local):
         with self.lock:
             if value is None:
                 # remove
+                self._recent.pop(key, None)
                 try:
                     del self._dict[key]
                 except KeyError:
                     pass
                 else:
+                    self._removals += 1
                     return None
             elif callable(value):
                 try:
                     # extract
-                    return self._dict[key]
+                    existing = self._dict[key]
                 except KeyError:
                     # construct and insert
+                    self._misses += 1
                     new_value = value()
                     self._dict[key] = new_value
+                    self._inserts += 1
+                    self._touch(key, new_value)
                     return new_value
+                else:
+                    self._hits += 1
+                    self._touch(key, existing)
+                    return existing
             else:
                 # insert or replace
                 self._dict[key] = value
+                self._inserts += 1
+                self._touch(key, value)
                 return value
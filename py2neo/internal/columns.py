@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Column-oriented accumulation of result records, used to feed numpy and
+pandas without building an intermediate container per row.
+"""
+
+
+from __future__ import absolute_import
+
+from array import array
+from collections import OrderedDict
+
+from py2neo.internal.compat import integer_types
+
+
+try:
+    array("q")
+except ValueError:
+    INTEGER_TYPECODE = "l"
+else:
+    INTEGER_TYPECODE = "q"
+
+FLOAT_TYPECODE = "d"
+
+
+class Column(object):
+    """ Append-only buffer for the values of a single result column.
+
+    Values are held in a compact :class:`array.array` for as long as
+    they are all integers or all floats; integer buffers are widened
+    if a float arrives. Any other value (including :const:`None`)
+    downgrades the buffer to a plain list.
+    """
+
+    __slots__ = ("buffer", "append")
+
+    def __init__(self):
+        self.buffer = None
+        self.append = self.__append_first
+
+    def __len__(self):
+        return 0 if self.buffer is None else len(self.buffer)
+
+    def __append_first(self, value):
+        if type(value) is float:
+            self.buffer = array(FLOAT_TYPECODE, [value])
+            self.append = self.__append_float
+        elif type(value) in integer_types:
+            try:
+                self.buffer = array(INTEGER_TYPECODE, [value])
+            except OverflowError:
+                self.__to_list(value)
+            else:
+                self.append = self.__append_integer
+        else:
+            self.__to_list(value)
+
+    def __append_integer(self, value):
+        if type(value) in integer_types:
+            try:
+                self.buffer.append(value)
+            except OverflowError:
+                self.__to_list(value)
+        elif type(value) is float:
+            self.buffer = array(FLOAT_TYPECODE, self.buffer)
+            self.buffer.append(value)
+            self.append = self.__append_float
+        else:
+            self.__to_list(value)
+
+    def __append_float(self, value):
+        if type(value) is float or type(value) in integer_types:
+            self.buffer.append(value)
+        else:
+            self.__to_list(value)
+
+    def __to_list(self, value):
+        self.buffer = [] if self.buffer is None else list(self.buffer)
+        self.buffer.append(value)
+        self.append = self.buffer.append
+
+    def is_typed(self):
+        """ Return true if this column is held in a typed numeric buffer.
+        """
+        return isinstance(self.buffer, array)
+
+    def values(self):
+        """ Return the values in this column as a list.
+        """
+        if self.buffer is None:
+            return []
+        elif isinstance(self.buffer, list):
+            return self.buffer
+        else:
+            return self.buffer.tolist()
+
+    def to_ndarray(self, dtype=None):
+        """ Return the values in this column as a one-dimensional numpy
+        array. Typed buffers are wrapped without copying, unless a
+        `dtype` is given that requires conversion.
+        """
+        from numpy import array as ndarray, frombuffer
+        if self.is_typed():
+            a = frombuffer(self.buffer, dtype=self.buffer.typecode)
+            if dtype is not None:
+                a = a.astype(dtype, copy=False)
+            return a
+        return ndarray(self.values(), dtype=dtype)
+
+    def to_series(self, index=None, dtype=None, name=None):
+        """ Return the values in this column as a pandas Series.
+        """
+        from pandas import Series
+        if self.is_typed():
+            return Series(self.to_ndarray(), index=index, dtype=dtype, name=name, copy=False)
+        return Series(self.values(), index=index, dtype=dtype, name=name)
+
+
+class ColumnSet(object):
+    """ A set of :class:`.Column` buffers, one per result key, into
+    which records can be appended row by row.
+    """
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.columns = [Column() for _ in self.keys]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, values):
+        """ Append one row of values, such as a :class:`.Record`.
+        """
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self.size += 1
+
+    def extend(self, records):
+        """ Append every row from an iterable of records.
+        """
+        for values in records:
+            self.append(values)
+
+    def to_ndarray(self, dtype=None, order="K"):
+        """ Return the rows in this set as a two-dimensional numpy array.
+        """
+        from numpy import array as ndarray, empty, result_type
+        if not self.size:
+            return ndarray([], dtype=dtype, order=order)
+        if all(column.is_typed() for column in self.columns):
+            arrays = [column.to_ndarray() for column in self.columns]
+            a = empty((self.size, len(arrays)), dtype=dtype or result_type(*arrays),
+                      order="F" if order == "F" else "C")
+            for i, column_array in enumerate(arrays):
+                a[:, i] = column_array
+            return a
+        # Mixed or non-numeric columns are left to numpy to reconcile,
+        # as they would be for a list of rows.
+        a = ndarray([column.values() for column in self.columns], dtype=dtype).T
+        return ndarray(a, order="F" if order == "F" else "C")
+
+    def to_data_frame(self, index=None, columns=None, dtype=None, start=0):
+        """ Return the rows in this set as a pandas DataFrame.
+
+        :param index: index to use for the resulting frame; by default,
+                      rows are numbered upwards from `start`
+        :param columns: column labels to use for the resulting frame
+        :param dtype: data type to force, or a dictionary mapping
+                      column names to data types
+        :param start: first row number for the default index
+        """
+        from pandas import DataFrame, RangeIndex
+        data = OrderedDict()
+        for key, column in zip(self.keys, self.columns):
+            if key not in data:
+                hint = dtype.get(key) if isinstance(dtype, dict) else None
+                data[key] = column.to_series(dtype=hint)
+        frame = DataFrame(data, columns=columns, dtype=None if isinstance(dtype, dict) else dtype)
+        if index is not None:
+            frame.index = index
+        elif start:
+            frame.index = RangeIndex(start, start + self.size)
+        return frame
+
+
+def iter_data_frames(keys, records, chunk_size, columns=None, dtype=None):
+    """ Accumulate records into pandas DataFrames of at most
+    `chunk_size` rows each, yielding each one as it fills. Rows are
+    numbered continuously across frames. A single empty frame is
+    yielded if there are no records at all.
+    """
+    column_set = ColumnSet(keys)
+    start = 0
+    for record in records:
+        column_set.append(record)
+        if column_set.size == chunk_size:
+            yield column_set.to_data_frame(columns=columns, dtype=dtype, start=start)
+            start += chunk_size
+            column_set = ColumnSet(keys)
+    if column_set.size or not start:
+        yield column_set.to_data_frame(columns=columns, dtype=dtype, start=start)
@@ -20,17 +20,27 @@ from __future__ import absolute_import
 
 from base64 import b64encode
 from collections import OrderedDict
-from json import dumps as json_dumps, loads as json_loads
+from threading import Lock
+from timeit import default_timer as timer
 from warnings import catch_warnings, simplefilter
+from zlib import DEFLATED, MAX_WBITS, Z_DEFAULT_COMPRESSION, compressobj
 
 from neo4j.exceptions import AuthError, Forbidden
-from neo4j.v1 import Driver, Session, StatementResult, TransactionError, SessionError
+from neo4j.v1 import Driver, Session, StatementResult, Transaction, TransactionError, SessionError
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, Timeout
+
+try:
+    from queue import Full
+except ImportError:
+    from Queue import Full
 
 from py2neo.database import GraphError
-from py2neo.internal.addressing import get_connection_data
+from py2neo.internal.addressing import get_connection_data, DEFAULT_HTTP_POOL_SIZE, DEFAULT_HTTP_POOL_BLOCK, \
+    DEFAULT_HTTP_RETRIES
 from py2neo.internal.compat import urlsplit, ustr
-from py2neo.internal.json import JSONDehydrator
-from py2neo.storage import Record
+from py2neo.internal.json import JSONDehydrator, JSONDocumentReader, JSONStreamReader, ResultDataFormat, \
+    get_json_codec
+from py2neo.storage import Record, RecordSchema
 
 
 # import logging
@@ -60,45 +70,180 @@ UNAUTHORIZED = 401
 FORBIDDEN = 403
 NOT_FOUND = 404
 
+DEFAULT_CHUNK_SIZE = 65536
+
+#: Request bodies smaller than this (in bytes) are not worth compressing.
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+COLUMNS = "columns"
+ROW = "row"
+SUMMARY = "summary"
+ERRORS = "errors"
+
+
+_dehydrator = JSONDehydrator()
+
 
 def fix_parameters(parameters):
+    """ Return parameters ready to be sent. These are not walked here;
+    values with no direct JSON equivalent are instead dehydrated by the
+    `default` hook of the JSON codec, as the request body is encoded.
+    """
     if not parameters:
         return {}
-    dehydrator = JSONDehydrator()
-    try:
-        dehydrated, = dehydrator.dehydrate([parameters])
-    except TypeError as error:
-        value = error.args[0]
-        raise TypeError("Parameters of type {} are not supported".format(type(value).__name__))
-    else:
-        return dehydrated
+    return parameters
+
+
+class ConnectionPoolMonitor(object):
+    """ Mixin for urllib3 connection pools that closes connections left
+    idle for longer than `keep_alive` seconds instead of reusing them,
+    and keeps thread-safe usage counters that can be used to size the
+    pool against the number of threads sharing it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.keep_alive = kwargs.pop("keep_alive", None)
+        super(ConnectionPoolMonitor, self).__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self._in_use = 0
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._acquisitions = 0
+        self._peak_in_use = self._in_use
+        self._created = 0
+        self._expired = 0
+        self._discarded = 0
+        self._wait_time = 0.0
+
+    def _new_conn(self):
+        with self._stats_lock:
+            self._created += 1
+        return super(ConnectionPoolMonitor, self)._new_conn()
+
+    def _get_conn(self, timeout=None):
+        t0 = timer()
+        conn = super(ConnectionPoolMonitor, self)._get_conn(timeout)
+        wait_time = timer() - t0
+        released_at = getattr(conn, "released_at", None)
+        expired = (self.keep_alive is not None and released_at is not None and
+                   t0 - released_at > self.keep_alive)
+        if expired:
+            # The connection reopens itself when next used
+            conn.close()
+        with self._stats_lock:
+            self._acquisitions += 1
+            self._in_use += 1
+            if self._in_use > self._peak_in_use:
+                self._peak_in_use = self._in_use
+            if expired:
+                self._expired += 1
+            self._wait_time += wait_time
+        return conn
+
+    def _put_conn(self, conn):
+        with self._stats_lock:
+            self._in_use -= 1
+        if conn is not None:
+            conn.released_at = timer()
+        try:
+            self.pool.put(conn, block=False)
+            return
+        except AttributeError:
+            # The pool has been closed
+            pass
+        except Full:
+            with self._stats_lock:
+                self._discarded += 1
+        if conn:
+            conn.close()
+
+    def stats(self, reset=False):
+        """ Return a dictionary of usage statistics for this pool,
+        optionally resetting all counters to zero at the same time.
+
+        A non-zero ``discarded`` count shows that more threads than
+        ``max_size`` needed connections at once, and that connections
+        were closed rather than returned to the pool. A growing
+        ``wait_time`` shows the same for a blocking pool.
+        """
+        with self._stats_lock:
+            pool = self.pool
+            stats = {
+                "max_size": pool.maxsize if pool is not None else 0,
+                "idle": sum(1 for conn in list(pool.queue) if conn is not None) if pool is not None else 0,
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "acquisitions": self._acquisitions,
+                "created": self._created,
+                "expired": self._expired,
+                "discarded": self._discarded,
+                "wait_time": self._wait_time,
+            }
+            if reset:
+                self._reset_stats()
+        return stats
+
+
+class MonitoredHTTPConnectionPool(ConnectionPoolMonitor, HTTPConnectionPool):
+    pass
+
+
+class MonitoredHTTPSConnectionPool(ConnectionPoolMonitor, HTTPSConnectionPool):
+    pass
 
 
 class HTTP(object):
     """ Wrapper for HTTP method calls.
+
+    Connections are drawn from a pool of up to `pool_size` connections,
+    shared by all threads using this object. If `pool_block` is true,
+    threads wait for a connection to become free rather than opening
+    an extra one that is discarded afterwards. Timeouts are given in
+    seconds, with :const:`None` meaning no timeout, and connections left
+    idle for longer than `keep_alive` seconds are closed instead of
+    being reused.
     """
 
     @staticmethod
     def authorization(user, password):
         return 'Basic ' + b64encode((user + ":" + password).encode("utf-8")).decode("ascii")
 
-    def __init__(self, uri, headers, verified):
+    @staticmethod
+    def gzip(data, level=Z_DEFAULT_COMPRESSION):
+        compressor = compressobj(level, DEFLATED, 16 + MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def __init__(self, uri, headers, verified, json_codec=None, compression=False,
+                 compression_threshold=DEFAULT_COMPRESSION_THRESHOLD, pool_size=DEFAULT_HTTP_POOL_SIZE,
+                 pool_block=DEFAULT_HTTP_POOL_BLOCK, connect_timeout=None, read_timeout=None,
+                 retries=DEFAULT_HTTP_RETRIES, keep_alive=None):
         self.uri = uri
         self.verified = verified
+        self.json_codec = json_codec or get_json_codec()
+        self.result_format = ResultDataFormat()
+        self.compression = compression
+        self.compression_threshold = compression_threshold
         parts = urlsplit(uri)
         scheme = parts.scheme
         host = parts.hostname
         port = parts.port
+        pool_settings = {
+            "maxsize": pool_size,
+            "block": pool_block,
+            "timeout": Timeout(connect=connect_timeout, read=read_timeout),
+            "retries": retries,
+            "keep_alive": keep_alive,
+        }
         if scheme == "http":
-            from urllib3 import HTTPConnectionPool
-            self._http = HTTPConnectionPool("%s:%d" % (host, port))
+            self._http = MonitoredHTTPConnectionPool(host, port, **pool_settings)
         elif scheme == "https":
-            from urllib3 import HTTPSConnectionPool
             if verified:
                 from certifi import where
-                self._http = HTTPSConnectionPool("%s:%d" % (host, port), cert_reqs="CERT_REQUIRED", ca_certs=where())
+                self._http = MonitoredHTTPSConnectionPool(host, port, cert_reqs="CERT_REQUIRED", ca_certs=where(),
+                                                          **pool_settings)
             else:
-                self._http = HTTPSConnectionPool("%s:%d" % (host, port))
+                self._http = MonitoredHTTPSConnectionPool(host, port, **pool_settings)
         else:
             raise ValueError("Unsupported scheme %r" % scheme)
         self.path = parts.path
@@ -106,6 +251,8 @@ class HTTP(object):
             user, password = headers.pop("auth")
             headers["Authorization"] = 'Basic ' + b64encode(
                 (ustr(user) + u":" + ustr(password)).encode("utf-8")).decode("ascii")
+        if compression:
+            headers["Accept-Encoding"] = "gzip"
         self.headers = headers
 
     def __del__(self):
@@ -139,22 +286,32 @@ class HTTP(object):
         rs = self.request("GET", self.path + ref, headers=self.headers)
         try:
             if rs.status == 200:
-                return json_loads(rs.data.decode('utf-8'))
+                return self.json_codec.loads(rs.data)
             else:
                 self.raise_error(rs.status, rs.data)
         finally:
             rs.close()
 
-    def post(self, ref, json, expected):
-        """ Perform an HTTP POST to this resource.
+    def post(self, ref, json, expected, preload_content=True):
+        """ Perform an HTTP POST to this resource. If `preload_content`
+        is false, the response body is left unread, to be streamed by
+        the caller. If compression is enabled, request bodies above
+        the compression threshold are sent gzipped; responses are
+        decompressed as they are read, whether streamed or not.
         """
         headers = dict(self.headers)
         if json is not None:
             headers["Content-Type"] = "application/json"
-            json = json_dumps(json).encode('utf-8')
-        rs = self.request("POST", self.path + ref, headers=self.headers, body=json)
+            json = self.json_codec.dumps(json, default=_dehydrator.default)
+            if self.compression and len(json) >= self.compression_threshold:
+                headers["Content-Encoding"] = "gzip"
+                json = self.gzip(json)
+        rs = self.request("POST", self.path + ref, headers=headers, body=json, preload_content=preload_content)
         if rs.status not in expected:
-            self.raise_error(rs.status, rs.data)
+            try:
+                self.raise_error(rs.status, rs.data)
+            finally:
+                rs.release_conn()
         return rs
 
     def delete(self, ref, expected):
@@ -169,13 +326,18 @@ class HTTP(object):
         if self._http and self._http.pool:
             self._http.close()
 
+    def pool_stats(self, reset=False):
+        """ Return usage statistics for the underlying connection pool.
+        """
+        return self._http.stats(reset)
+
     def raise_error(self, status_code, data):
         if status_code == UNAUTHORIZED:
             raise AuthError(self.uri)
         if status_code == FORBIDDEN:
             raise Forbidden(self.uri)
         if data:
-            content = json_loads(data.decode('utf-8'))
+            content = self.json_codec.loads(data)
         else:
             content = {}
         message = content.pop("message", "HTTP request to <%s> returned unexpected status code %s" % (self.uri, status_code))
@@ -202,14 +364,18 @@ class HTTPDriver(Driver):
             "Authorization": HTTP.authorization(connection_data["user"], connection_data["password"]),
             "User-Agent": connection_data["user_agent"],
             "X-Stream": "true",
-        }, connection_data["verified"])
+        }, connection_data["verified"], compression=connection_data["compression"],
+            pool_size=connection_data["http_pool_size"], pool_block=connection_data["http_pool_block"],
+            connect_timeout=connection_data["http_connect_timeout"],
+            read_timeout=connection_data["http_read_timeout"],
+            retries=connection_data["http_retries"], keep_alive=connection_data["http_keep_alive"])
         instance._graph = None
         return instance
 
     def session(self, access_mode=None, bookmark=None):
         if self._graph is None:
             from py2neo.database import Database
-            self._graph = Database(self._connection_data["uri"], auth=self._connection_data["auth"]).default_graph
+            self._graph = Database(**self._connection_data).default_graph
         return HTTPSession(self._graph, self._http)
 
 
@@ -231,20 +397,146 @@ class HTTPSDriver(Driver):
             "Authorization": HTTP.authorization(connection_data["user"], connection_data["password"]),
             "User-Agent": connection_data["user_agent"],
             "X-Stream": "true",
-        }, connection_data["verified"])
+        }, connection_data["verified"], compression=connection_data["compression"],
+            pool_size=connection_data["http_pool_size"], pool_block=connection_data["http_pool_block"],
+            connect_timeout=connection_data["http_connect_timeout"],
+            read_timeout=connection_data["http_read_timeout"],
+            retries=connection_data["http_retries"], keep_alive=connection_data["http_keep_alive"])
         instance._graph = None
         return instance
 
     def session(self, access_mode=None, bookmark=None):
         if self._graph is None:
             from py2neo.database import Database
-            self._graph = Database(self._connection_data["uri"], auth=self._connection_data["auth"]).default_graph
+            self._graph = Database(**self._connection_data).default_graph
         return HTTPSession(self._graph, self._http)
 
 
+def iter_result_events(reader):
+    """ Walk a response from the transactional endpoint, yielding a
+    tuple of `(event, index, data)` for each part of each result as it
+    is read. Events are `COLUMNS`, `ROW` (with the "row", "meta" and
+    "graph" data of a single row) and `SUMMARY` (with everything else in the result), each
+    carrying the index of the result to which it belongs, followed by
+    `ERRORS` with the list of errors.
+    """
+    for key in reader.iter_object():
+        if key == "results":
+            for index in reader.iter_array():
+                summary = {}
+                pending = None
+                for result_key in reader.iter_object():
+                    if result_key == "data" and COLUMNS in summary:
+                        for _ in reader.iter_array():
+                            yield ROW, index, reader.read_value()
+                    elif result_key == "data":
+                        # Columns have not yet been seen, so rows
+                        # cannot be streamed.
+                        pending = reader.read_value()
+                    else:
+                        value = summary[result_key] = reader.read_value()
+                        if result_key == COLUMNS:
+                            yield COLUMNS, index, value
+                            for row in pending or ():
+                                yield ROW, index, row
+                            pending = None
+                yield SUMMARY, index, summary
+        elif key == "errors":
+            yield ERRORS, None, reader.read_value()
+        else:
+            reader.read_value()
+
+
+class HTTPResultStream(object):
+    """ Reader for a streamed response from the transactional
+    endpoint, which passes each row to its result loader as soon as
+    the row has been decoded.
+    """
+
+    def __init__(self, response, result_loaders, chunk_size=DEFAULT_CHUNK_SIZE, json_codec=None):
+        self.response = response
+        self.result_loaders = result_loaders
+        self.chunk_size = chunk_size
+        self.json_codec = json_codec
+        self._events = None
+        self._errors = None
+        self.closed = False
+
+    def advance(self):
+        """ Read and process the next part of the response.
+
+        :returns: :const:`False` if the response has been fully read,
+                  :const:`True` otherwise
+        :raises GraphError: if the server reported an error
+        """
+        if self.closed:
+            return False
+        try:
+            if self._events is None:
+                reader = JSONStreamReader(self.response.stream(self.chunk_size))
+                self._events = iter_result_events(reader)
+            event, index, data = next(self._events)
+        except StopIteration:
+            self.close()
+            if self._errors:
+                raise GraphError.hydrate(self._errors[0])
+            return False
+        except Exception:
+            self.close(discard=True)
+            raise
+        if event == ERRORS:
+            self._errors = data
+        elif index < len(self.result_loaders):
+            result_loader = self.result_loaders[index]
+            if event == ROW:
+                result_loader.load_row(data)
+            elif event == COLUMNS:
+                result_loader.load_columns(data)
+            else:
+                result_loader.load_summary(data)
+        return True
+
+    def drain(self):
+        """ Read the remainder of the response, buffering all
+        outstanding rows in their results. If nothing has yet been
+        read, the response body is decoded in one piece by the JSON
+        codec, which is cheaper than decoding it value by value.
+        """
+        if self._events is None and self.json_codec is not None and not self.closed:
+            try:
+                document = self.json_codec.loads(self.response.data)
+            except Exception:
+                self.close(discard=True)
+                raise
+            self._events = iter_result_events(JSONDocumentReader(document))
+        while self.advance():
+            pass
+
+    def close(self, discard=False):
+        """ Detach any results still waiting for data and give up the
+        connection, closing it if the response has not been fully read.
+        """
+        if not self.closed:
+            self.closed = True
+            for result_loader in self.result_loaders:
+                result_loader.fail()
+            if discard:
+                # Closing the socket abandons the unread remainder, but
+                # the connection must still go back to the pool to free
+                # its slot; it reconnects when next used.
+                self.response.close()
+            self.response.release_conn()
+
+
 class HTTPResultLoader(object):
 
-    def load(self, result):
+    def load_columns(self, columns):
+        pass
+
+    def load_row(self, data):
+        pass
+
+    def load_summary(self, result):
         pass
 
     def fail(self):
@@ -261,10 +553,14 @@ class HTTPSession(Session):
 
     commit_ref = None           # e.g. "transaction/1/commit"
 
+    _stream = None
+
     def __init__(self, graph, http):
         self.graph = graph
         self.post = http.post
         self.delete = http.delete
+        self.json_codec = http.json_codec
+        self.result_format = http.result_format
         self.ref = self.autocommit_ref
         self._statements = []
         self._result_loaders = []
@@ -273,6 +569,9 @@ class HTTPSession(Session):
     def _connect(self, access_mode=None):
         pass
 
+    def _create_transaction(self):
+        self._transaction = HTTPTransaction(self, on_close=self._destroy_transaction)
+
     def _disconnect(self, sync):
         if sync:
             self.sync()
@@ -286,56 +585,90 @@ class HTTPSession(Session):
         self._statements.append(OrderedDict([
             ("statement", ustr(statement)),
             ("parameters", fix_parameters(dict(parameters or {}, **kwparameters))),
-            ("resultDataContents", ["REST"]),
+            ("resultDataContents", self.result_format.contents()),
             ("includeStats", True),
         ]))
         result_loader = HTTPResultLoader()
         self._result_loaders.append(result_loader)
         return HTTPStatementResult(self, result_loader)
 
-    def send(self):
-        self.sync()
-
     def fetch(self):
-        return 0
+        """ Read the next part of the streamed response, if any.
+        """
+        stream = self._stream
+        if stream is None:
+            return 0
+        if not stream.advance():
+            self._stream = None
+        return 1
+
+    def _drain(self):
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.drain()
+
+    def discard(self):
+        """ Abandon the response currently being streamed, closing its
+        connection unread instead of reading it to the end.
+        """
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close(discard=True)
 
-    def sync(self):
+    def send(self):
+        """ Send all pending statements in a single request. The
+        response is not read here, but streamed to the results by
+        subsequent calls to :meth:`.fetch`. Any previous response is
+        first read in full.
+        """
         ref = self.ref
         # Some of the transactional URIs do not support empty statement
         # lists in versions earlier than 2.3. Which doesn't really matter
         # as it's a waste sending anything anyway.
         if ref in (self.autocommit_ref, self.begin_ref, self.transaction_ref) and not self._statements:
-            return 0
-        count = 0
+            return
+        result_loaders = list(self._result_loaders)
         try:
-            response = self.post(ref, {"statements": self._statements}, expected=(OK, CREATED))
-            if response.status == 201:
-                location_path = urlsplit(response.headers["Location"]).path
-                self.transaction_ref = "".join(location_path.rpartition("transaction")[1:])
-                self.commit_ref = "%s/commit" % self.transaction_ref
-                self.ref = self.transaction_ref
-            content = json_loads(response.data.decode("utf-8"))
-            errors = content["errors"]
-            if errors:
-                from py2neo.database import GraphError
-                raise GraphError.hydrate(errors[0])
-            for i, result_loader in enumerate(self._result_loaders):
-                try:
-                    count += result_loader.load(content["results"][i])
-                except IndexError:
-                    result_loader.fail()
-            return count
+            self._drain()
+            response = self.post(ref, {"statements": self._statements}, expected=(OK, CREATED),
+                                 preload_content=False)
+        except Exception:
+            for result_loader in result_loaders:
+                result_loader.fail()
+            raise
         finally:
             self._statements[:] = ()
             self._result_loaders[:] = ()
+        if response.status == 201:
+            location_path = urlsplit(response.headers["Location"]).path
+            self.transaction_ref = "".join(location_path.rpartition("transaction")[1:])
+            self.commit_ref = "%s/commit" % self.transaction_ref
+            self.ref = self.transaction_ref
+        self._stream = HTTPResultStream(response, result_loaders, json_codec=self.json_codec)
+
+    def sync(self):
+        """ Send all pending statements and read the response in full.
+        """
+        self.send()
+        self._drain()
+        return 0
 
     def detach(self, result):
+        self.send()
+        while result.attached() and self._stream is not None:
+            self.fetch()
         return 0
 
     def last_bookmark(self):
         return None
 
     def commit_transaction(self):
+        """ Commit the current transaction, sending any pending
+        statements in the same request. If the transaction has not yet
+        been opened on the server, that is, if no results were read
+        before the commit, everything goes in a single request to the
+        autocommit endpoint.
+        """
         if not self.has_transaction():
             raise TransactionError("No transaction to commit")
         self._transaction = None
@@ -349,11 +682,20 @@ class HTTPSession(Session):
         return self._bookmark
 
     def rollback_transaction(self):
+        """ Roll back the current transaction. Pending statements are
+        discarded unsent, and if the transaction has not yet been opened
+        on the server, no request is made at all.
+        """
         if not self.has_transaction():
             raise TransactionError("No transaction to rollback")
         self._transaction = None
         self._bookmark = None
+        for result_loader in self._result_loaders:
+            result_loader.fail()
+        self._statements[:] = ()
+        self._result_loaders[:] = ()
         try:
+            self._drain()
             if self.transaction_ref:
                 self.ref = self.transaction_ref
                 self.delete(self.ref, expected=(OK, NOT_FOUND))
@@ -365,6 +707,23 @@ class HTTPSession(Session):
         self.ref = self.begin_ref
 
 
+class HTTPTransaction(Transaction):
+    """ Transaction that leaves pending statements to be sent along
+    with the commit, rather than in a separate request beforehand.
+    """
+
+    def close(self):
+        if not self.closed():
+            try:
+                if self.success:
+                    self.session.commit_transaction()
+                else:
+                    self.session.rollback_transaction()
+            finally:
+                self._closed = True
+                self.on_close()
+
+
 class HTTPStatementResult(StatementResult):
 
     zipper = Record
@@ -373,14 +732,19 @@ class HTTPStatementResult(StatementResult):
         from py2neo.internal.json import JSONHydrator
 
         super(HTTPStatementResult, self).__init__(session, JSONHydrator(session.graph, ()))
+        self._schema = None
+        result_format = session.result_format
 
-        def load(result):
-            from neo4j.v1 import BoltStatementResultSummary
+        def load_columns(columns):
+            keys = self._keys = self._hydrant.keys = tuple(columns)
+            self._schema = RecordSchema.get(keys)
 
-            keys = self._keys = self._hydrant.keys = tuple(result["columns"])
-            hydrate = self._hydrant.hydrate
-            for record in result["data"]:
-                self._records.append(Record(zip(keys, hydrate(record["rest"]))))
+        def load_row(data):
+            values = result_format.hydrate(self._hydrant, data)
+            self._records.append(self._schema.record(values))
+
+        def load_summary(result):
+            from neo4j.v1 import BoltStatementResultSummary
 
             stats = result["stats"]
             # fix broken key
@@ -396,22 +760,11 @@ class HTTPStatementResult(StatementResult):
 
             self._summary = BoltStatementResultSummary(statement=None, parameters=None, **metadata)  # TODO: statement and params
             self._session = None
-            return len(self._records)
 
         def fail():
             self._session = None
 
-        result_loader.load = load
+        result_loader.load_columns = load_columns
+        result_loader.load_row = load_row
+        result_loader.load_summary = load_summary
         result_loader.fail = fail
-
-    def records(self):
-        """ Generator for records obtained from this result.
-
-        :yields: iterable of :class:`.Record` objects
-        """
-        if self.attached():
-            self._session.send()
-        records = self._records
-        next_record = records.popleft
-        while records:
-            yield next_record()
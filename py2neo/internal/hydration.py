@@ -16,21 +16,104 @@
 # limitations under the License.
 
 
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from weakref import ref
+
 from py2neo.internal.collections import round_robin
 
 
-def hydrate_node(graph, identity, inst=None, **rest):
-    if inst is None:
+class StaleNodeSet(object):
+    """ Collection of stale nodes hydrated from a common result. The
+    first time that any one of these nodes needs to be loaded, all of
+    them are pulled together in a single batch.
+    """
 
-        def inst_constructor():
-            from py2neo.data import Node
-            new_inst = Node()
-            new_inst.graph = graph
-            new_inst.identity = identity
-            new_inst._stale.update({"labels", "properties"})
-            return new_inst
+    def __init__(self, graph):
+        self.graph = graph
+        self._refs = []
+
+    def __len__(self):
+        return len(self._refs)
+
+    def add(self, node):
+        if node._stale_set is not self:
+            node._stale_set = self
+            self._refs.append(ref(node))
+
+    def pull(self, node=None):
+        """ Pull all nodes in this set that are still stale, plus an
+        optional extra `node`, returning the number of nodes pulled.
+        """
+        from py2neo.data import Subgraph
+        refs, self._refs = self._refs, []
+        nodes = []
+        for r in refs:
+            n = r()
+            if n is not None and n._stale_set is self:
+                n._stale_set = None
+                if n._stale and n.graph is self.graph:
+                    nodes.append(n)
+        if node is not None and all(n is not node for n in nodes):
+            nodes.append(node)
+        if nodes:
+            self.graph.pull(Subgraph(nodes))
+        return len(nodes)
+
+
+def load_properties(entity, properties):
+    """ Replace the properties of an entity with those received from
+    the server, bypassing dirty key tracking.
+    """
+    dict.clear(entity)
+    dict.update(entity, properties)
+    entity._dirty.clear()
+
+
+def load_labels(node, labels):
+    """ Replace the labels of a node with those received from the
+    server, bypassing the stale checks made by the public label methods.
+    """
+    node._remote_labels = frozenset(labels)
+    node_labels = node._labels
+    node_labels.clear()
+    node_labels.update(labels)
+
+
+def bind_node(graph, node, identity, labels):
+    """ Bind a local node to the remote node created or merged from
+    it, marking its labels and properties as in sync with the server.
+    """
+    node.graph = graph
+    node.identity = identity
+    node._remote_labels = labels
+    node._dirty.clear()
+    graph.node_cache.update(identity, node)
 
-        inst = graph.node_cache.update(identity, inst_constructor)
+
+def bind_relationship(graph, relationship, identity):
+    """ Bind a local relationship to the remote relationship created or
+    merged from it, marking its properties as in sync with the server.
+    """
+    relationship.graph = graph
+    relationship.identity = identity
+    relationship._dirty.clear()
+    graph.relationship_cache.update(identity, relationship)
+
+
+def _new_node(graph, identity):
+    from py2neo.data import Node
+    node = Node()
+    node.graph = graph
+    node.identity = identity
+    node._stale.update({"labels", "properties"})
+    return node
+
+
+def hydrate_node(graph, identity, inst=None, stale_set=None, **rest):
+    if inst is None:
+        inst = graph.node_cache.update(identity, lambda: _new_node(graph, identity))
     else:
         inst.graph = graph
         inst.identity = identity
@@ -38,18 +121,39 @@ def hydrate_node(graph, identity, inst=None, **rest):
 
     if "data" in rest:
         inst._stale.discard("properties")
-        inst.clear()
-        inst.update(rest["data"])
+        load_properties(inst, rest["data"])
     if "metadata" in rest:
         inst._stale.discard("labels")
-        metadata = rest["metadata"]
-        inst._remote_labels = frozenset(metadata["labels"])
-        inst.clear_labels()
-        inst.update_labels(metadata["labels"])
+        load_labels(inst, rest["metadata"]["labels"])
+    if stale_set is not None and inst._stale:
+        stale_set.add(inst)
     return inst
 
 
-def hydrate_relationship(graph, identity, inst=None, **rest):
+def hydrate_nodes(graph, rows, stale_set=None):
+    """ Hydrate a batch of nodes, each described by a row of
+    ``(identity, labels, properties)``. Labels or properties given as
+    :const:`None` are left as they are on cached nodes, and marked as
+    stale on new ones. The node cache lock is taken only once.
+
+    :returns: list of :class:`.Node` objects, in row order
+    """
+    rows = list(rows)
+    nodes = graph.node_cache.update_all([row[0] for row in rows], lambda identity: _new_node(graph, identity))
+    for node, (_, labels, properties) in zip(nodes, rows):
+        stale = node._stale
+        if properties is not None:
+            stale.discard("properties")
+            load_properties(node, properties)
+        if labels is not None:
+            stale.discard("labels")
+            load_labels(node, labels)
+        if stale_set is not None and stale:
+            stale_set.add(node)
+    return nodes
+
+
+def hydrate_relationship(graph, identity, inst=None, stale_set=None, **rest):
     start = rest["start"]
     end = rest["end"]
 
@@ -57,38 +161,72 @@ def hydrate_relationship(graph, identity, inst=None, **rest):
 
         def inst_constructor():
             from py2neo.data import Relationship
-            new_inst = Relationship(hydrate_node(graph, start), rest.get("type"),
-                                    hydrate_node(graph, end), **rest.get("data", {}))
+            new_inst = Relationship(hydrate_node(graph, start, stale_set=stale_set), rest.get("type"),
+                                    hydrate_node(graph, end, stale_set=stale_set))
             new_inst.graph = graph
             new_inst.identity = identity
             return new_inst
 
         inst = graph.relationship_cache.update(identity, inst_constructor)
+        if "data" in rest:
+            # A cached instance may hold out-of-date properties
+            load_properties(inst, rest["data"])
     else:
         inst.graph = graph
         inst.identity = identity
-        hydrate_node(graph, start, inst=inst.start_node)
-        hydrate_node(graph, end, inst=inst.end_node)
+        hydrate_node(graph, start, inst=inst.start_node, stale_set=stale_set)
+        hydrate_node(graph, end, inst=inst.end_node, stale_set=stale_set)
         inst._type = rest.get("type")
         if "data" in rest:
-            inst.clear()
-            inst.update(rest["data"])
+            load_properties(inst, rest["data"])
         else:
             inst._stale.add("properties")
         graph.relationship_cache.update(identity, inst)
     return inst
 
 
-def hydrate_path(graph, data):
+def hydrate_relationships(graph, rows, stale_set=None):
+    """ Hydrate a batch of relationships, each described by a row of
+    ``(identity, start, end, type, properties)``, where `start` and
+    `end` are node identities. Endpoint nodes are hydrated together
+    first, and each cache lock is taken only once. Properties given as
+    :const:`None` are left as they are on cached relationships.
+
+    :returns: list of :class:`.Relationship` objects, in row order
+    """
+    from py2neo.data import Relationship
+    rows = list(rows)
+    endpoint_ids = list(OrderedDict.fromkeys(identity for row in rows for identity in row[1:3]))
+    endpoints = dict(zip(endpoint_ids, hydrate_nodes(graph, [(identity, None, None) for identity in endpoint_ids],
+                                                     stale_set=stale_set)))
+    rows_by_identity = {row[0]: row for row in rows}
+
+    def inst_constructor(identity):
+        _, start, end, type_, _ = rows_by_identity[identity]
+        new_inst = Relationship(endpoints[start], type_, endpoints[end])
+        new_inst.graph = graph
+        new_inst.identity = identity
+        return new_inst
+
+    relationships = graph.relationship_cache.update_all([row[0] for row in rows], inst_constructor)
+    for relationship, row in zip(relationships, rows):
+        properties = row[4]
+        if properties is not None:
+            # A cached instance may hold out-of-date properties
+            load_properties(relationship, properties)
+    return relationships
+
+
+def hydrate_path(graph, data, stale_set=None):
     from py2neo.data import Path
     node_ids = data["nodes"]
     relationship_ids = data["relationships"]
     offsets = [(0, 1) if direction == "->" else (1, 0) for direction in data["directions"]]
-    nodes = [hydrate_node(graph, identity) for identity in node_ids]
-    relationships = [hydrate_relationship(graph, identity,
-                                          start=node_ids[i + offsets[i][0]],
-                                          end=node_ids[i + offsets[i][1]])
-                     for i, identity in enumerate(relationship_ids)]
+    nodes = hydrate_nodes(graph, [(identity, None, None) for identity in node_ids], stale_set=stale_set)
+    relationships = hydrate_relationships(graph, [(identity, node_ids[i + offsets[i][0]], node_ids[i + offsets[i][1]],
+                                                   None, None)
+                                                  for i, identity in enumerate(relationship_ids)],
+                                          stale_set=stale_set)
     inst = Path(*round_robin(nodes, relationships))
     inst.__metadata = data
     return inst
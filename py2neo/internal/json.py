@@ -18,21 +18,32 @@
 
 from __future__ import absolute_import
 
+from codecs import getincrementaldecoder
+from json import JSONDecoder, dumps as json_dumps, loads as json_loads
+from os import getenv
+from re import compile as re_compile
+
+from py2neo.data import LiteNode, LiteRelationship
 from py2neo.internal.collections import is_collection
 from py2neo.internal.compat import integer_types, string_types, ustr, bytes_types
-from py2neo.internal.hydration import hydrate_node, hydrate_relationship, hydrate_path
+from py2neo.internal.hydration import StaleNodeSet, hydrate_node, hydrate_nodes, hydrate_relationship, \
+    hydrate_relationships, hydrate_path
 
 
 INT64_MIN = -(2 ** 63)
 INT64_MAX = (2 ** 63) - 1
 
+PY2NEO_JSON_CODEC = getenv("PY2NEO_JSON_CODEC")
+
 
 class JSONHydrator(object):
 
-    def __init__(self, graph, keys, entities=None):
+    def __init__(self, graph, keys, entities=None, lite=False):
         self.graph = graph
         self.keys = keys
         self.entities = entities or {}
+        self.lite = lite
+        self.stale_nodes = StaleNodeSet(graph)
 
     def hydrate(self, values):
         """ Hydrate values from raw JSON representations into client objects.
@@ -40,20 +51,46 @@ class JSONHydrator(object):
         graph = self.graph
         entities = self.entities
         keys = self.keys
+        stale_nodes = self.stale_nodes
+        lite = self.lite
 
         def uri_to_id(uri):
             _, _, identity = uri.rpartition("/")
             return int(identity)
 
+        def hydrate_lite(data):
+            identity = uri_to_id(data["self"])
+            if "type" in data:
+                return LiteRelationship(graph, identity, data["type"], LiteNode(graph, uri_to_id(data["start"])),
+                                        LiteNode(graph, uri_to_id(data["end"])), data.get("data"))
+            else:
+                labels = data["metadata"]["labels"] if "metadata" in data else ()
+                return LiteNode(graph, identity, frozenset(labels), data.get("data"))
+
+        def hydrate_lite_path(data):
+            nodes = [LiteNode(graph, identity) for identity in data["nodes"]]
+            steps = [nodes[0]]
+            for i, identity in enumerate(data["relationships"]):
+                if data["directions"][i] == "->":
+                    start_node, end_node = nodes[i], nodes[i + 1]
+                else:
+                    start_node, end_node = nodes[i + 1], nodes[i]
+                steps.append(LiteRelationship(graph, identity, None, start_node, end_node))
+                steps.append(nodes[i + 1])
+            return tuple(steps)
+
         def hydrate_(data, inst=None):
             if isinstance(data, dict):
                 if "self" in data:
-                    if "type" in data:
+                    if lite:
+                        return hydrate_lite(data)
+                    elif "type" in data:
                         data["start"] = uri_to_id(data["start"])
                         data["end"] = uri_to_id(data["end"])
-                        return hydrate_relationship(graph, uri_to_id(data["self"]), inst=inst, **data)
+                        return hydrate_relationship(graph, uri_to_id(data["self"]), inst=inst,
+                                                    stale_set=stale_nodes, **data)
                     else:
-                        return hydrate_node(graph, uri_to_id(data["self"]), inst=inst, **data)
+                        return hydrate_node(graph, uri_to_id(data["self"]), inst=inst, stale_set=stale_nodes, **data)
                 elif "nodes" in data and "relationships" in data:
                     data["nodes"] = list(map(uri_to_id, data["nodes"]))
                     data["relationships"] = list(map(uri_to_id, data["relationships"]))
@@ -68,7 +105,9 @@ class JSONHydrator(object):
                             else:
                                 directions.append("<-")
                         data["directions"] = directions
-                    return hydrate_path(graph, data)
+                    if lite:
+                        return hydrate_lite_path(data)
+                    return hydrate_path(graph, data, stale_set=stale_nodes)
                 else:
                     # from warnings import warn
                     # warn("Map literals returned over the Neo4j REST interface are ambiguous "
@@ -81,6 +120,179 @@ class JSONHydrator(object):
 
         return tuple(hydrate_(value, entities.get(keys[i])) for i, value in enumerate(values))
 
+    def hydrate_row(self, row, meta, graph_data=None):
+        """ Hydrate values from the compact "row" result format into
+        client objects, using the accompanying "meta" and "graph" data.
+
+        The server writes one meta entry per scalar, node or
+        relationship, flattening lists and maps but wrapping each path
+        in a list of its own, in the same order as the row values
+        themselves. Node labels, relationship types and relationship
+        endpoints are taken from the graph data, so no follow-up query
+        is needed to orient the relationships within a path.
+        """
+        graph = self.graph
+        entities = self.entities
+        keys = self.keys
+        stale_nodes = self.stale_nodes
+        lite = self.lite
+        graph_data = graph_data or {}
+        nodes = {int(node["id"]): node for node in graph_data.get("nodes", ())}
+        relationships = {int(relationship["id"]): relationship for relationship in graph_data.get("relationships", ())}
+        hydrated = {}
+        hydrated_relationships = {}
+        if not lite and nodes:
+            # Hydrate everything described by the graph data in two
+            # batches, so that each cache lock is taken only once per row
+            node_rows = [(identity, data["labels"], data["properties"]) for identity, data in nodes.items()]
+            hydrated.update(zip([row[0] for row in node_rows],
+                                hydrate_nodes(graph, node_rows, stale_set=stale_nodes)))
+        if not lite and relationships:
+            relationship_rows = [(identity, int(data["startNode"]), int(data["endNode"]),
+                                  data["type"], data["properties"])
+                                 for identity, data in relationships.items()]
+            hydrated_relationships.update(zip([row[0] for row in relationship_rows],
+                                              hydrate_relationships(graph, relationship_rows, stale_set=stale_nodes)))
+
+        def hydrate_node_(identity, inst=None):
+            data = nodes.get(identity)
+            if lite:
+                if data is None:
+                    return LiteNode(graph, identity)
+                return LiteNode(graph, identity, frozenset(data["labels"]), data["properties"])
+            if inst is None and identity in hydrated:
+                return hydrated[identity]
+            if data is None:
+                node = hydrate_node(graph, identity, inst=inst, stale_set=stale_nodes)
+            else:
+                node = hydrate_node(graph, identity, inst=inst, stale_set=stale_nodes,
+                                    data=data["properties"], metadata={"labels": data["labels"]})
+            hydrated[identity] = node
+            return node
+
+        def hydrate_relationship_(identity, inst=None, endpoints=True):
+            data = relationships[identity]
+            start = int(data["startNode"])
+            end = int(data["endNode"])
+            if lite:
+                return LiteRelationship(graph, identity, data["type"], hydrate_node_(start), hydrate_node_(end),
+                                        data["properties"])
+            if inst is None and identity in hydrated_relationships:
+                return hydrated_relationships[identity]
+            if inst is None and endpoints:
+                hydrate_node_(start)
+                hydrate_node_(end)
+            return hydrate_relationship(graph, identity, inst=inst, stale_set=stale_nodes,
+                                        start=start, end=end, type=data["type"], data=data["properties"])
+
+        def hydrate_path_(path_meta):
+            node_ids = [m["id"] for m in path_meta[0::2]]
+            relationship_ids = [m["id"] for m in path_meta[1::2]]
+            if lite:
+                steps = [hydrate_node_(node_ids[0])]
+                for i, identity in enumerate(relationship_ids):
+                    steps.append(hydrate_relationship_(identity))
+                    steps.append(hydrate_node_(node_ids[i + 1]))
+                return tuple(steps)
+            for identity in node_ids:
+                hydrate_node_(identity)
+            directions = []
+            for i, identity in enumerate(relationship_ids):
+                hydrate_relationship_(identity, endpoints=False)
+                start = int(relationships[identity]["startNode"])
+                directions.append("->" if start == node_ids[i] else "<-")
+            data = {"nodes": node_ids, "relationships": relationship_ids, "directions": directions}
+            return hydrate_path(graph, data, stale_set=stale_nodes)
+
+        def is_entity(value, m):
+            if not isinstance(value, dict) or not isinstance(m, dict):
+                return False
+            if m.get("type") == "node":
+                data = nodes.get(m["id"])
+            elif m.get("type") == "relationship":
+                data = relationships.get(m["id"])
+            else:
+                return False
+            # Property values can never be maps, so a map whose first
+            # value is an entity can never equal that entity's properties.
+            return data is None or data["properties"] == value
+
+        def is_path(value, m):
+            # A path has a meta list of its own, alternating between
+            # nodes and relationships, whereas any other list is
+            # flattened into the enclosing meta.
+            if not isinstance(m, list) or len(m) % 2 == 0 or len(m) != len(value):
+                return False
+            for i, (item, item_meta) in enumerate(zip(value, m)):
+                if not is_entity(item, item_meta):
+                    return False
+                if item_meta["type"] != ("relationship" if i % 2 else "node"):
+                    return False
+            return True
+
+        def hydrate_(value, inst=None):
+            m = meta[position[0]] if position[0] < len(meta) else None
+            if isinstance(value, dict):
+                if is_entity(value, m):
+                    position[0] += 1
+                    if m["type"] == "node":
+                        return hydrate_node_(m["id"], inst)
+                    elif m["id"] in relationships:
+                        return hydrate_relationship_(m["id"], inst)
+                    return value
+                return {key: hydrate_(item) for key, item in value.items()}
+            elif isinstance(value, list):
+                if is_path(value, m):
+                    position[0] += 1
+                    return hydrate_path_(m)
+                return [hydrate_(item) for item in value]
+            else:
+                position[0] += 1
+                return value
+
+        position = [0]
+        return tuple(hydrate_(value, entities.get(keys[i])) for i, value in enumerate(row))
+
+
+class ResultDataFormat(object):
+    """ Choice of result formats to request from the transactional
+    endpoint of one server, and the hydration of rows returned in them.
+
+    The compact "row" and "graph" formats are preferred, but older 3.x
+    servers do not describe row values with "meta" entries, without
+    which nodes, relationships and paths cannot be told apart from
+    plain maps and lists. Until a row shows whether "meta" is written,
+    the "rest" format is requested as well, and if it is not, the
+    "rest" format alone is requested from then on.
+    """
+
+    #: Whether the server writes "meta" entries for each row, or
+    #: :const:`None` if this is not yet known.
+    row_meta = None
+
+    def contents(self):
+        """ Return the "resultDataContents" to request for a statement.
+        """
+        if self.row_meta:
+            return ["row", "graph"]
+        elif self.row_meta is None:
+            return ["row", "graph", "rest"]
+        else:
+            return ["rest"]
+
+    def hydrate(self, hydrator, data):
+        """ Hydrate the values of a single row of result data using a
+        :class:`.JSONHydrator`.
+        """
+        if "row" in data:
+            self.row_meta = "meta" in data
+        if "meta" in data:
+            return hydrator.hydrate_row(data["row"], data["meta"], data.get("graph"))
+        elif "rest" in data:
+            return hydrator.hydrate(data["rest"])
+        else:
+            raise ValueError("Result data has neither row metadata nor REST values")
+
 
 class JSONDehydrator(object):
 
@@ -120,3 +332,328 @@ class JSONDehydrator(object):
                 raise TypeError(obj)
 
         return tuple(map(dehydrate_, values))
+
+    def default(self, obj):
+        """ Dehydrate a single value that has no direct JSON
+        equivalent. This is intended as the `default` hook of a JSON
+        encoder, so that parameters are dehydrated as they are encoded
+        instead of in a separate walk beforehand.
+        """
+        try:
+            f = self.dehydration_functions[type(obj)]
+        except KeyError:
+            pass
+        else:
+            return f(obj)
+        if isinstance(obj, bytes_types):
+            raise TypeError("Parameters passed over JSON do not support BYTES")
+        raise TypeError("Parameters of type {} are not supported".format(type(obj).__name__))
+
+
+class JSONCodec(object):
+    """ Base class for the encoder and decoder pair used for JSON
+    exchanged with the server. Values are encoded to, and decoded
+    from, UTF-8 bytes.
+    """
+
+    name = None
+
+    def dumps(self, value, default=None):
+        """ Encode a value, passing anything that the encoder cannot
+        represent to `default`, which should return a replacement or
+        raise :class:`TypeError`.
+        """
+        raise NotImplementedError()
+
+    def loads(self, data):
+        raise NotImplementedError()
+
+
+class StandardJSONCodec(JSONCodec):
+    """ Codec built on the :mod:`json` module from the standard library.
+    """
+
+    name = "json"
+
+    def dumps(self, value, default=None):
+        return json_dumps(value, separators=(",", ":"), default=default).encode("utf-8")
+
+    def loads(self, data):
+        if isinstance(data, bytes_types):
+            data = data.decode("utf-8")
+        return json_loads(data)
+
+
+class ORJSONCodec(JSONCodec):
+    """ Codec built on `orjson <https://github.com/ijl/orjson>`_.
+
+    Map keys that are not strings are encoded as they would be by the
+    standard library. Values that orjson cannot encode at all, such as
+    integers beyond 64 bits, are passed to a :class:`.StandardJSONCodec`
+    instead.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._error = orjson.JSONEncodeError
+        self._fallback = StandardJSONCodec()
+        self.loads = orjson.loads
+
+    def dumps(self, value, default=None):
+        try:
+            return self._dumps(value, default=default, option=self._option)
+        except self._error:
+            return self._fallback.dumps(value, default=default)
+
+
+#: Available codecs, fastest first.
+JSON_CODECS = [ORJSONCodec, StandardJSONCodec]
+
+
+def get_json_codec(name=None):
+    """ Return an instance of the named JSON codec or, if no name is
+    given, the fastest codec whose underlying library is installed.
+    The default can be overridden through the `PY2NEO_JSON_CODEC`
+    environment variable.
+    """
+    name = name or PY2NEO_JSON_CODEC
+    for codec_class in JSON_CODECS:
+        if name and codec_class.name != name:
+            continue
+        try:
+            return codec_class()
+        except ImportError:
+            if name:
+                raise
+    raise ValueError("Unknown JSON codec %r" % name)
+
+
+WHITESPACE = re_compile(r"[ \t\n\r]*")
+SCALAR_END = re_compile(r"[ \t\n\r,:\]}]")
+STRING_SPECIAL = re_compile(r'["\\]')
+STRUCTURAL = re_compile(r'["\[\]{}]')
+
+
+class JSONValueScanner(object):
+    """ Finds the end of a single JSON value whose text arrives piece by
+    piece, carrying nesting and string state from one piece to the next
+    so that no character is looked at more than once.
+    """
+
+    def __init__(self, first):
+        self.scalar = first not in u"\"[{"
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def scan(self, text, pos=0):
+        """ Scan `text` from `pos`, returning the index just past the
+        end of the value, or :const:`None` if it continues beyond `text`.
+        """
+        if self.scalar:
+            # A number or literal is only known to be complete once
+            # followed by a delimiter.
+            match = SCALAR_END.search(text, pos)
+            return None if match is None else match.start()
+        while True:
+            if self.in_string:
+                if self.escaped:
+                    if pos >= len(text):
+                        return None
+                    pos += 1
+                    self.escaped = False
+                match = STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                if match.group() == u"\\":
+                    self.escaped = True
+                else:
+                    self.in_string = False
+                    if self.depth == 0:
+                        return pos
+            else:
+                match = STRUCTURAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                ch = match.group()
+                if ch == u"\"":
+                    self.in_string = True
+                elif ch in u"[{":
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        return pos
+
+
+class JSONStreamReader(object):
+    """ Pull parser for JSON text arriving as a sequence of byte chunks.
+
+    Structure is navigated explicitly, one token at a time, while
+    individual values are decoded whole, so that only the value
+    currently being read (plus at most one chunk) needs to be held in
+    memory. The end of a value split across chunks is found by scanning
+    each chunk once, after which the value is decoded in a single pass.
+    """
+
+    def __init__(self, chunks, encoding="utf-8"):
+        self._chunks = iter(chunks)
+        self._decode = getincrementaldecoder(encoding)().decode
+        self._raw_decode = JSONDecoder().raw_decode
+        self._buffer = u""
+        self._pos = 0
+        self._eof = False
+
+    def _read_text(self):
+        """ Decode and return the text of the next chunk, or
+        :const:`None` if the end of the stream has already been reached.
+        """
+        if self._eof:
+            return None
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            return self._decode(b"", True)
+        else:
+            return self._decode(chunk)
+
+    def peek(self):
+        """ Return the next non-whitespace character without consuming it.
+        """
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            text = self._read_text()
+            if text is None:
+                raise ValueError("Unexpected end of JSON stream")
+            self._buffer, self._pos = text, 0
+
+    def read_char(self):
+        """ Consume and return the next non-whitespace character.
+        """
+        ch = self.peek()
+        self._pos += 1
+        return ch
+
+    def expect(self, ch):
+        """ Consume the next non-whitespace character, which must be `ch`.
+        """
+        found = self.read_char()
+        if found != ch:
+            raise ValueError("Expected %r in JSON stream, found %r" % (ch, found))
+
+    def read_value(self):
+        """ Consume and return one complete JSON value.
+        """
+        scanner = JSONValueScanner(self.peek())
+        start = self._pos
+        end = scanner.scan(self._buffer, start)
+        if end is None:
+            # Collect the pieces of a value that spans chunks and join
+            # them once, when the value is complete.
+            pieces = [self._buffer[start:]]
+            while end is None:
+                text = self._read_text()
+                if text is None:
+                    if not scanner.scalar:
+                        raise ValueError("Unexpected end of JSON stream")
+                    text, end = u"", 0
+                else:
+                    end = scanner.scan(text)
+                pieces.append(text if end is None else text[:end])
+            value_text = u"".join(pieces)
+            start, stop = 0, len(value_text)
+            self._buffer = text
+        else:
+            value_text, stop = self._buffer, end
+        self._pos = end
+        value, value_end = self._raw_decode(value_text, start)
+        if value_end != stop:
+            raise ValueError("Invalid JSON value %r" % value_text[start:stop])
+        return value
+
+    def iter_object(self):
+        """ Consume a JSON object, yielding each key in turn. The
+        corresponding value must be consumed by the caller before the
+        next key is requested.
+        """
+        self.expect(u"{")
+        if self.peek() == u"}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(u":")
+            yield key
+            ch = self.read_char()
+            if ch == u"}":
+                return
+            if ch != u",":
+                raise ValueError("Expected ',' or '}' in JSON stream, found %r" % ch)
+
+    def iter_array(self):
+        """ Consume a JSON array, yielding the index of each element in
+        turn. Each element must be consumed by the caller before the
+        next index is requested.
+        """
+        self.expect(u"[")
+        if self.peek() == u"]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            ch = self.read_char()
+            if ch == u"]":
+                return
+            if ch != u",":
+                raise ValueError("Expected ',' or ']' in JSON stream, found %r" % ch)
+            index += 1
+
+
+class JSONDocumentReader(object):
+    """ Reader with the same navigation interface as
+    :class:`.JSONStreamReader`, over a document that has already been
+    decoded in full.
+    """
+
+    def __init__(self, document):
+        self._next = document
+
+    def read_value(self):
+        """ Consume and return the next value.
+        """
+        value, self._next = self._next, None
+        return value
+
+    def iter_object(self):
+        """ Consume an object, yielding each key in turn. The
+        corresponding value is returned by the next call to
+        :meth:`.read_value`.
+        """
+        obj = self.read_value()
+        if not isinstance(obj, dict):
+            raise ValueError("Expected JSON object, found %r" % obj)
+        for key, value in obj.items():
+            self._next = value
+            yield key
+
+    def iter_array(self):
+        """ Consume an array, yielding the index of each element in
+        turn. The element itself is returned by the next call to
+        :meth:`.read_value`.
+        """
+        array = self.read_value()
+        if not isinstance(array, list):
+            raise ValueError("Expected JSON array, found %r" % array)
+        for index, value in enumerate(array):
+            self._next = value
+            yield index
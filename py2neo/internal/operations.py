@@ -32,6 +32,7 @@ __all__ = [
 from collections import namedtuple
 
 from py2neo.cypher.writing import cypher_escape
+from py2neo.internal.hydration import bind_node, bind_relationship
 
 
 RelationshipData = namedtuple("RelationshipData", ["nodes", "properties"])
@@ -75,14 +76,24 @@ def relationship_dict(relationships):
     return d
 
 
-def create_nodes(tx, labels, data):
+def create_nodes_query(labels):
     assert isinstance(labels, frozenset)
     label_string = "".join(":" + cypher_escape(label) for label in sorted(labels))
-    cypher = "UNWIND $x AS data CREATE (_%s) SET _ = data RETURN id(_)" % label_string
-    for record in tx.run(cypher, x=data):
+    return "UNWIND $x AS data CREATE (_%s) SET _ = data RETURN id(_)" % label_string
+
+
+def create_nodes(tx, labels, data):
+    for record in tx.run(create_nodes_query(labels), x=data):
         yield record[0]
 
 
+def merge_nodes_query(p_label, p_key, labels):
+    assert isinstance(labels, frozenset)
+    label_string = ":".join(cypher_escape(label) for label in sorted(labels))
+    return "UNWIND $x AS data MERGE (_:%s {%s:data[0]}) SET _:%s SET _ = data[1] RETURN id(_)" % (
+        cypher_escape(p_label), cypher_escape(p_key), label_string)
+
+
 def merge_nodes(tx, p_label, p_key, labels, data):
     """
 
@@ -93,14 +104,17 @@ def merge_nodes(tx, p_label, p_key, labels, data):
     :param data: list of (p_value, properties)
     :return:
     """
-    assert isinstance(labels, frozenset)
-    label_string = ":".join(cypher_escape(label) for label in sorted(labels))
-    cypher = "UNWIND $x AS data MERGE (_:%s {%s:data[0]}) SET _:%s SET _ = data[1] RETURN id(_)" % (
-        cypher_escape(p_label), cypher_escape(p_key), label_string)
-    for record in tx.run(cypher, x=data):
+    for record in tx.run(merge_nodes_query(p_label, p_key, labels), x=data):
         yield record[0]
 
 
+def merge_relationships_query(r_type):
+    return ("UNWIND $x AS data "
+            "MATCH (a) WHERE id(a) = data[0] "
+            "MATCH (b) WHERE id(b) = data[1] "
+            "MERGE (a)-[_:%s]->(b) SET _ = data[2] RETURN id(_)" % cypher_escape(r_type))
+
+
 def merge_relationships(tx, r_type, data):
     """
 
@@ -109,11 +123,7 @@ def merge_relationships(tx, r_type, data):
     :param data: list of (a_id, b_id, properties)
     :return:
     """
-    cypher = ("UNWIND $x AS data "
-              "MATCH (a) WHERE id(a) = data[0] "
-              "MATCH (b) WHERE id(b) = data[1] "
-              "MERGE (a)-[_:%s]->(b) SET _ = data[2] RETURN id(_)" % cypher_escape(r_type))
-    for record in tx.run(cypher, x=data):
+    for record in tx.run(merge_relationships_query(r_type), x=data):
         yield record[0]
 
 
@@ -122,19 +132,12 @@ def create_subgraph(tx, subgraph):
     for labels, nodes in node_dict(n for n in subgraph.nodes if n.graph is None).items():
         identities = create_nodes(tx, labels, map(dict, nodes))
         for i, identity in enumerate(identities):
-            node = nodes[i]
-            node.graph = graph
-            node.identity = identity
-            node._remote_labels = labels
-            graph.node_cache.update(identity, node)
+            bind_node(graph, nodes[i], identity, labels)
     for r_type, relationships in relationship_dict(r for r in subgraph.relationships if r.graph is None).items():
         identities = merge_relationships(tx, r_type, map(
             lambda r: [r.start_node.identity, r.end_node.identity, dict(r)], relationships))
         for i, identity in enumerate(identities):
-            relationship = relationships[i]
-            relationship.graph = graph
-            relationship.identity = identity
-            graph.relationship_cache.update(identity, relationship)
+            bind_relationship(graph, relationships[i], identity)
 
 
 def merge_subgraph(tx, subgraph, p_label, p_key):
@@ -144,19 +147,12 @@ def merge_subgraph(tx, subgraph, p_label, p_key):
             raise ValueError("Primary label and primary key are required for MERGE operation")
         identities = merge_nodes(tx, pl, pk, labels, map(lambda n: [n.get(pk), dict(n)], nodes))
         for i, identity in enumerate(identities):
-            node = nodes[i]
-            node.graph = graph
-            node.identity = identity
-            node._remote_labels = labels
-            graph.node_cache.update(identity, node)
+            bind_node(graph, nodes[i], identity, labels)
     for r_type, relationships in relationship_dict(r for r in subgraph.relationships if r.graph is None).items():
         identities = merge_relationships(tx, r_type, map(
             lambda r: [r.start_node.identity, r.end_node.identity, dict(r)], relationships))
         for i, identity in enumerate(identities):
-            relationship = relationships[i]
-            relationship.graph = graph
-            relationship.identity = identity
-            graph.relationship_cache.update(identity, relationship)
+            bind_relationship(graph, relationships[i], identity)
 
 
 def delete_subgraph(tx, subgraph):
@@ -189,42 +185,100 @@ def separate_subgraph(tx, subgraph):
 
 
 def pull_subgraph(tx, subgraph):
+    """ Refresh all bound entities in a subgraph from their remote
+    counterparts, using one query for all nodes and one for all
+    relationships.
+
+    :param tx:
+    :param subgraph:
+    :return: list of entities whose remote counterparts no longer exist
+    """
     graph = tx.graph
-    nodes = {node: None for node in subgraph.nodes}
-    relationships = list(subgraph.relationships)
-    for node in nodes:
+    nodes = {}
+    for node in subgraph.nodes:
         if node.graph is graph:
-            tx.entities.append({"_": node})
-            cursor = tx.run("MATCH (_) WHERE id(_) = {x} RETURN _, labels(_)", x=node.identity)
-            nodes[node] = cursor
-    for relationship in relationships:
+            nodes[node.identity] = node
+            # Hydration resolves identities through the cache, so
+            # seating each entity there ensures it is updated in place.
+            graph.node_cache.update(node.identity, node)
+    relationships = {}
+    for relationship in subgraph.relationships:
         if relationship.graph is graph:
-            tx.entities.append({"_": relationship})
-            list(tx.run("MATCH ()-[_]->() WHERE id(_) = {x} RETURN _", x=relationship.identity))
-    for node, cursor in nodes.items():
-        new_labels = cursor.evaluate(1)
-        if new_labels:
+            relationships[relationship.identity] = relationship
+            graph.relationship_cache.update(relationship.identity, relationship)
+    node_cursor = relationship_cursor = None
+    if nodes:
+        node_cursor = tx.run("UNWIND $x AS i MATCH (_) WHERE id(_) = i RETURN id(_), labels(_), _",
+                             x=list(nodes))
+    if relationships:
+        relationship_cursor = tx.run("UNWIND $x AS i MATCH ()-[_]->() WHERE id(_) = i RETURN id(_), _",
+                                     x=list(relationships))
+    if node_cursor is not None:
+        for identity, new_labels, _ in node_cursor:
+            node = nodes.pop(identity)
             node._remote_labels = frozenset(new_labels)
             labels = node._labels
             labels.clear()
             labels.update(new_labels)
+    if relationship_cursor is not None:
+        for identity, _ in relationship_cursor:
+            del relationships[identity]
+    return list(nodes.values()) + list(relationships.values())
+
+
+def node_label_diff_dict(nodes):
+    """
+
+    :param nodes:
+    :return: dict of (frozenset(labels to add), frozenset(labels to remove)) to list(nodes)
+    """
+    d = {}
+    for node in nodes:
+        labels = node._labels
+        remote_labels = node._remote_labels
+        key = (frozenset(labels - remote_labels), frozenset(remote_labels - labels))
+        d.setdefault(key, []).append(node)
+    return d
+
+
+def dirty_properties(entity):
+    """ Return a dictionary of all properties set or removed since the
+    entity was last synchronised, with :const:`None` marking removal.
+    """
+    return {key: dict.get(entity, key) for key in entity._dirty}
+
+
+def push_nodes_query(add_labels, remove_labels):
+    assert isinstance(add_labels, frozenset)
+    assert isinstance(remove_labels, frozenset)
+    clauses = ["UNWIND $x AS data MATCH (_) WHERE id(_) = data[0]", "SET _ += data[1]"]
+    if remove_labels:
+        clauses.append("REMOVE _:%s" % ":".join(map(cypher_escape, sorted(remove_labels))))
+    if add_labels:
+        clauses.append("SET _:%s" % ":".join(map(cypher_escape, sorted(add_labels))))
+    return "\n".join(clauses)
+
+
+def push_relationships_query():
+    return "UNWIND $x AS data MATCH ()-[_]->() WHERE id(_) = data[0] SET _ += data[1]"
 
 
 def push_subgraph(tx, subgraph):
     graph = tx.graph
-    for node in subgraph.nodes:
-        if node.graph is graph:
-            clauses = ["MATCH (_) WHERE id(_) = {x}", "SET _ = {y}"]
-            parameters = {"x": node.identity, "y": dict(node)}
-            old_labels = node._remote_labels - node._labels
-            if old_labels:
-                clauses.append("REMOVE _:%s" % ":".join(map(cypher_escape, old_labels)))
-            new_labels = node._labels - node._remote_labels
-            if new_labels:
-                clauses.append("SET _:%s" % ":".join(map(cypher_escape, new_labels)))
-            tx.run("\n".join(clauses), parameters)
-    for relationship in subgraph.relationships:
-        if relationship.graph is graph:
-            clauses = ["MATCH ()-[_]->() WHERE id(_) = {x}", "SET _ = {y}"]
-            parameters = {"x": relationship.identity, "y": dict(relationship)}
-            tx.run("\n".join(clauses), parameters)
+    for (add_labels, remove_labels), nodes in node_label_diff_dict(n for n in subgraph.nodes
+                                                                   if n.graph is graph).items():
+        if not add_labels and not remove_labels:
+            # Nodes without label changes need only be pushed if
+            # their properties have changed.
+            nodes = [n for n in nodes if n._dirty]
+            if not nodes:
+                continue
+        tx.run(push_nodes_query(add_labels, remove_labels), x=[[n.identity, dirty_properties(n)] for n in nodes])
+        for node in nodes:
+            node._remote_labels = frozenset(node._labels)
+            node._dirty.clear()
+    relationships = [r for r in subgraph.relationships if r.graph is graph and r._dirty]
+    if relationships:
+        tx.run(push_relationships_query(), x=[[r.identity, dirty_properties(r)] for r in relationships])
+        for relationship in relationships:
+            relationship._dirty.clear()
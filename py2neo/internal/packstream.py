@@ -23,64 +23,232 @@ from collections import namedtuple
 from neo4j.packstream.structure import Structure
 from neo4j.v1.types import PackStreamHydrator as _PackStreamHydrator
 
-from py2neo.internal.hydration import hydrate_node, hydrate_relationship
+from py2neo.data import LiteNode, LiteRelationship
+from py2neo.internal.collections import round_robin
+from py2neo.internal.compat import atomic_types
+from py2neo.internal.hydration import StaleNodeSet, hydrate_node, hydrate_nodes, hydrate_relationship, \
+    hydrate_relationships
 
 
 _unbound_relationship = namedtuple("UnboundRelationship", ["id", "type", "properties"])
 
+SCALAR_TYPES = frozenset(atomic_types + (type(None),))
+
 
 class PackStreamHydrator(_PackStreamHydrator):
+    """ Hydrator for values received over Bolt.
+
+    A hydration plan is compiled from the first record of a result,
+    holding one function per column that is specialised for the kind of
+    value seen there: scalar, node, relationship or container. Later
+    records are hydrated by applying these functions directly, each of
+    which falls back to general hydration if a value turns out to have
+    a different shape. Rows made up entirely of scalars are passed
+    through without any per-value work, and rows with several node or
+    relationship columns hydrate those in bulk, taking each cache lock
+    only once.
+    """
 
-    def __init__(self, graph, keys, entities=None):
+    def __init__(self, graph, keys, entities=None, lite=False):
         super(PackStreamHydrator, self).__init__(2)  # maximum known protocol version
         self.graph = graph
         self.keys = keys
         self.entities = entities or {}
+        self.lite = lite
+        self.stale_nodes = StaleNodeSet(graph)
+        self._plan = None
+        self._scalar_plan = False
+        self._batch = None
 
     def hydrate(self, values):
         """ Hydrate values from raw PackStream representations into client objects.
         """
+        plan = self._plan
+        if plan is None or len(plan) != len(values):
+            plan = self._plan = self._compile_plan(values)
+        elif self._scalar_plan and SCALAR_TYPES.issuperset(map(type, values)):
+            return tuple(values)
+        if self._batch is not None:
+            return self._batch(values)
+        return tuple(f(value) for f, value in zip(plan, values))
+
+    def _compile_plan(self, values):
+        """ Build a hydration function for each column, based on the
+        values in the first record.
+        """
         graph = self.graph
         entities = self.entities
         keys = self.keys
+        stale_nodes = self.stale_nodes
+        lite = self.lite
+        hydrate_ = self._value_hydrator()
+
+        def hydrate_properties(properties):
+            if SCALAR_TYPES.issuperset(map(type, properties.values())):
+                return properties
+            return hydrate_(properties)
+
+        def hydrate_scalar(obj):
+            if type(obj) in SCALAR_TYPES:
+                return obj
+            return hydrate_(obj)
+
+        def hydrate_node_column(obj):
+            if type(obj) is Structure and obj.tag == b"N":
+                fields = obj.fields
+                return hydrate_node(graph, fields[0], metadata={"labels": list(fields[1])},
+                                    data=hydrate_properties(fields[2]))
+            return hydrate_(obj)
+
+        def hydrate_relationship_column(obj):
+            if type(obj) is Structure and obj.tag == b"R":
+                fields = obj.fields
+                return hydrate_relationship(graph, fields[0], stale_set=stale_nodes,
+                                            start=fields[1], end=fields[2],
+                                            type=fields[3], data=hydrate_properties(fields[4]))
+            return hydrate_(obj)
+
+        def hydrate_list_column(obj):
+            if type(obj) is list and SCALAR_TYPES.issuperset(map(type, obj)):
+                return obj
+            return hydrate_(obj)
+
+        def hydrate_dict_column(obj):
+            if type(obj) is dict and SCALAR_TYPES.issuperset(map(type, obj.values())):
+                return obj
+            return hydrate_(obj)
+
+        def hydrate_entity_column(inst):
+            return lambda obj: hydrate_(obj, inst)
+
+        plan = []
+        for i, value in enumerate(values):
+            inst = entities.get(keys[i]) if entities and i < len(keys) else None
+            if inst is not None:
+                plan.append(hydrate_entity_column(inst))
+            elif type(value) in SCALAR_TYPES:
+                plan.append(hydrate_scalar)
+            elif type(value) is Structure and value.tag == b"N" and not lite:
+                plan.append(hydrate_node_column)
+            elif type(value) is Structure and value.tag == b"R" and not lite:
+                plan.append(hydrate_relationship_column)
+            elif type(value) is list:
+                plan.append(hydrate_list_column)
+            elif type(value) is dict:
+                plan.append(hydrate_dict_column)
+            else:
+                plan.append(hydrate_)
+        self._scalar_plan = all(f is hydrate_scalar for f in plan)
+
+        def hydrate_batch(values):
+            hydrated = list(values)
+            node_columns = []
+            node_rows = []
+            relationship_columns = []
+            relationship_rows = []
+            for i, f in enumerate(plan):
+                obj = values[i]
+                if f is hydrate_node_column and type(obj) is Structure and obj.tag == b"N":
+                    fields = obj.fields
+                    node_columns.append(i)
+                    node_rows.append((fields[0], fields[1], hydrate_properties(fields[2])))
+                elif f is hydrate_relationship_column and type(obj) is Structure and obj.tag == b"R":
+                    fields = obj.fields
+                    relationship_columns.append(i)
+                    relationship_rows.append((fields[0], fields[1], fields[2], fields[3],
+                                              hydrate_properties(fields[4])))
+                else:
+                    hydrated[i] = f(obj)
+            if node_rows:
+                for i, node in zip(node_columns, hydrate_nodes(graph, node_rows, stale_set=stale_nodes)):
+                    hydrated[i] = node
+            if relationship_rows:
+                for i, relationship in zip(relationship_columns,
+                                           hydrate_relationships(graph, relationship_rows, stale_set=stale_nodes)):
+                    hydrated[i] = relationship
+            return tuple(hydrated)
+
+        if sum(f is hydrate_node_column or f is hydrate_relationship_column for f in plan) > 1:
+            # A single entity column gains nothing from batching
+            self._batch = hydrate_batch
+        else:
+            self._batch = None
+        return plan
+
+    def _value_hydrator(self):
+        """ Return a function for hydrating any single value.
+        """
+        graph = self.graph
+        stale_nodes = self.stale_nodes
+        lite = self.lite
+        hydrate_structure = super(PackStreamHydrator, self).hydrate
+
+        def hydrate_lite(obj):
+            tag = obj.tag
+            fields = obj.fields
+            if tag == b"N":
+                return LiteNode(graph, fields[0], frozenset(fields[1]), hydrate_(fields[2]))
+            elif tag == b"R":
+                return LiteRelationship(graph, fields[0], fields[3], LiteNode(graph, fields[1]),
+                                        LiteNode(graph, fields[2]), hydrate_(fields[4]))
+            else:
+                nodes = [hydrate_lite(node) for node in fields[0]]
+                u_rels = [_unbound_relationship(*map(hydrate_, r)) for r in fields[1]]
+                sequence = fields[2]
+                last_node = nodes[0]
+                steps = [last_node]
+                for i, rel_index in enumerate(sequence[::2]):
+                    next_node = nodes[sequence[2 * i + 1]]
+                    if rel_index > 0:
+                        u_rel = u_rels[rel_index - 1]
+                        rel = LiteRelationship(graph, u_rel.id, u_rel.type, last_node, next_node, u_rel.properties)
+                    else:
+                        u_rel = u_rels[-rel_index - 1]
+                        rel = LiteRelationship(graph, u_rel.id, u_rel.type, next_node, last_node, u_rel.properties)
+                    steps.append(rel)
+                    steps.append(next_node)
+                    last_node = next_node
+                return tuple(steps)
 
         def hydrate_(obj, inst=None):
             if isinstance(obj, Structure):
                 tag = obj.tag
                 fields = obj.fields
-                if tag == b"N":
+                if lite and tag in (b"N", b"R", b"P"):
+                    return hydrate_lite(obj)
+                elif tag == b"N":
                     return hydrate_node(graph, fields[0], inst=inst,
                                         metadata={"labels": list(fields[1])}, data=hydrate_(fields[2]))
                 elif tag == b"R":
-                    return hydrate_relationship(graph, fields[0], inst=inst,
+                    return hydrate_relationship(graph, fields[0], inst=inst, stale_set=stale_nodes,
                                                 start=fields[1], end=fields[2],
                                                 type=fields[3], data=hydrate_(fields[4]))
                 elif tag == b"P":
                     from py2neo.data import Path
-                    nodes = [hydrate_(node) for node in fields[0]]
+                    nodes = hydrate_nodes(graph, [(node.fields[0], node.fields[1], hydrate_(node.fields[2]))
+                                                  for node in fields[0]], stale_set=stale_nodes)
                     u_rels = [_unbound_relationship(*map(hydrate_, r)) for r in fields[1]]
                     sequence = fields[2]
                     last_node = nodes[0]
-                    steps = [last_node]
+                    path_nodes = [last_node]
+                    relationship_rows = []
                     for i, rel_index in enumerate(sequence[::2]):
                         next_node = nodes[sequence[2 * i + 1]]
                         if rel_index > 0:
                             u_rel = u_rels[rel_index - 1]
-                            rel = hydrate_relationship(graph, u_rel.id,
-                                                       start=last_node.identity, end=next_node.identity,
-                                                       type=u_rel.type, data=u_rel.properties)
+                            start, end = last_node, next_node
                         else:
                             u_rel = u_rels[-rel_index - 1]
-                            rel = hydrate_relationship(graph, u_rel.id,
-                                                       start=next_node.identity, end=last_node.identity,
-                                                       type=u_rel.type, data=u_rel.properties)
-                        steps.append(rel)
-                        steps.append(next_node)
+                            start, end = next_node, last_node
+                        relationship_rows.append((u_rel.id, start.identity, end.identity,
+                                                  u_rel.type, u_rel.properties))
+                        path_nodes.append(next_node)
                         last_node = next_node
-                    return Path(*steps)
+                    relationships = hydrate_relationships(graph, relationship_rows, stale_set=stale_nodes)
+                    return Path(*round_robin(path_nodes, relationships))
                 else:
                     # Defer everything else to the official driver
-                    return super(PackStreamHydrator, self).hydrate([obj])[0]
+                    return hydrate_structure([obj])[0]
             elif isinstance(obj, list):
                 return list(map(hydrate_, obj))
             elif isinstance(obj, dict):
@@ -88,4 +256,4 @@ class PackStreamHydrator(_PackStreamHydrator):
             else:
                 return obj
 
-        return tuple(hydrate_(value, entities.get(keys[i])) for i, value in enumerate(values))
+        return hydrate_
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections import deque
+from os import getpid
+from threading import Condition, Lock, RLock
+from timeit import default_timer as timer
+from weakref import WeakKeyDictionary
+
+
+DEFAULT_SESSION_POOL_SIZE = 8
+DEFAULT_SESSION_IDLE_TIMEOUT = 60.0
+
+
+# Process that owns the connections held by each driver connection pool
+_connection_pool_pids = WeakKeyDictionary()
+
+
+def _forget_inherited_connections(driver):
+    """ Empty the connection pool of a driver that was created in a
+    parent process, so that the child opens connections of its own
+    instead of sharing sockets with the parent.
+
+    The inherited connections are closed, which releases this process's
+    copies of their sockets without affecting the parent. The pool's
+    locks are replaced too, as another thread may have been holding
+    them at the time of the fork.
+    """
+    pool = getattr(driver, "_pool", None)
+    if pool is None:
+        return
+    pid = getpid()
+    if _connection_pool_pids.setdefault(pool, pid) == pid:
+        return
+    _connection_pool_pids[pool] = pid
+    inherited = [connection for connections in pool.connections.values() for connection in connections]
+    pool.lock = RLock()
+    pool.cond = Condition(pool.lock)
+    pool.connections = {}
+    if hasattr(pool, "refresh_lock"):
+        pool.refresh_lock = Lock()
+    for connection in inherited:
+        try:
+            connection.close()
+        except IOError:
+            pass
+
+
+class SessionPool(object):
+    """ Bounded pool of driver sessions that can be borrowed and returned
+    by transactions instead of being opened and closed for each one.
+
+    Idle sessions are held in last-in-first-out order, so that the most
+    recently used (and therefore warmest) session is handed out first.
+    Sessions that have been idle for longer than `idle_timeout` seconds
+    are closed instead of being reused. A pool of size zero disables
+    pooling entirely.
+
+    After a fork, idle sessions inherited from the parent process are
+    dropped and the driver's connection pool is emptied, so that the
+    child never sends traffic over a socket that the parent is using.
+    Sessions and transactions that were in use at the time of the fork
+    still belong to the parent and must not be used by the child.
+    """
+
+    def __init__(self, driver, max_size=DEFAULT_SESSION_POOL_SIZE, idle_timeout=DEFAULT_SESSION_IDLE_TIMEOUT):
+        self.driver = driver
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._lock = Lock()
+        self._idle = deque()
+        self._pid = getpid()
+        _forget_inherited_connections(driver)
+
+    def __len__(self):
+        return len(self._idle)
+
+    def _check_pid(self):
+        pid = getpid()
+        if pid != self._pid:
+            self._lock = Lock()
+            self._idle = deque()
+            self._pid = pid
+            _forget_inherited_connections(self.driver)
+
+    def acquire(self):
+        """ Borrow a session from the pool, creating a new one if no
+        usable idle session is available.
+        """
+        self._check_pid()
+        expired = []
+        session = None
+        with self._lock:
+            idle = self._idle
+            now = timer()
+            while idle:
+                released_at, candidate = idle.pop()
+                if self.idle_timeout is not None and now - released_at > self.idle_timeout:
+                    expired.append(candidate)
+                    # Everything below this entry was released even earlier
+                    expired.extend(s for _, s in idle)
+                    idle.clear()
+                elif candidate.closed():
+                    continue
+                else:
+                    session = candidate
+                    break
+        for s in expired:
+            s.close()
+        if session is None:
+            session = self.driver.session()
+        return session
+
+    def release(self, session):
+        """ Return a borrowed session to the pool. Sessions that are
+        closed, still carry an open transaction, or for which there is
+        no room in the pool, are closed and discarded instead.
+
+        A pooled session hands its connection back to the driver and
+        forgets its bookmarks, so that an idle session neither pins a
+        connection nor chains unrelated work onto earlier transactions.
+        """
+        self._check_pid()
+        if session.closed():
+            return
+        if not session.has_transaction():
+            session._disconnect(sync=True)
+            session._bookmarks = ()
+            with self._lock:
+                if len(self._idle) < self.max_size:
+                    self._idle.append((timer(), session))
+                    return
+        session.close()
+
+    def close(self):
+        """ Close all idle sessions held by the pool.
+        """
+        self._check_pid()
+        with self._lock:
+            sessions = [s for _, s in self._idle]
+            self._idle.clear()
+        for s in sessions:
+            s.close()
@@ -24,8 +24,9 @@ Low-level graph data storage classes.
 from collections import namedtuple, Sequence, Set, Mapping
 from functools import reduce
 from operator import and_ as and_operator, xor as xor_operator
-from threading import RLock
+from threading import Lock, RLock
 from uuid import uuid4
+from weakref import WeakValueDictionary
 
 from py2neo.internal.compat import integer_types, string_types, ustr
 from py2neo.internal.collections import ReactiveSet, iter_items
@@ -35,33 +36,116 @@ NodeEntry = namedtuple("NodeEntry", ["labels", "properties"])
 RelationshipEntry = namedtuple("RelationshipEntry", ["type", "nodes", "properties"])
 
 
+class RecordSchema(object):
+    """ Interned, immutable description of the keys of a :class:`.Record`.
+
+    Every record created with the same sequence of keys shares a single
+    schema, which holds the key tuple along with a key-to-index map, so
+    that records themselves carry only their values and key lookups can
+    be carried out in constant time. Schemas are held weakly and are
+    discarded once no records refer to them.
+    """
+
+    __slots__ = ("keys", "index", "_record_classes", "__weakref__")
+
+    _instances = WeakValueDictionary()
+    _instances_lock = Lock()
+
+    @classmethod
+    def get(cls, keys):
+        """ Return the shared schema for a sequence of keys.
+        """
+        keys = tuple(keys)
+        try:
+            return cls._instances[keys]
+        except KeyError:
+            with cls._instances_lock:
+                return cls._instances.setdefault(keys, cls(keys))
+
+    def __init__(self, keys):
+        self.keys = keys
+        index = {}
+        for i, key in enumerate(keys):
+            index.setdefault(key, i)
+        self.index = index
+        self._record_classes = {}
+
+    def __repr__(self):
+        return "<%s keys=%r>" % (self.__class__.__name__, self.keys)
+
+    def record_class(self, base=None):
+        """ Return the subclass of `base` (by default, :class:`.Record`)
+        bound to this schema.
+        """
+        if base is None:
+            base = Record
+        try:
+            return self._record_classes[base]
+        except KeyError:
+            record_class = type(base.__name__, (base,), {
+                "__slots__": (),
+                "__module__": base.__module__,
+                "_schema": self,
+                "_record_base": base,
+            })
+            return self._record_classes.setdefault(base, record_class)
+
+    def record(self, values, base=None):
+        """ Create a record with this schema from a sequence of values,
+        without any further copying of keys.
+        """
+        return tuple.__new__(self.record_class(base), values)
+
+
+def record_zipper():
+    """ Return a function that zips keys and values into a
+    :class:`.Record`, suitable for use as the `zipper` of a driver
+    result. The schema for the most recent keys is remembered so that
+    successive records from the same result can skip the intern lookup.
+    """
+    last = [None, None]
+
+    def zipper(keys, values):
+        if keys is not last[0]:
+            last[1] = RecordSchema.get(keys)
+            last[0] = keys
+        return last[1].record(values)
+
+    return zipper
+
+
 class Record(tuple, Mapping):
     """ A :class:`.Record` is an immutable ordered collection of key-value
     pairs. It is generally closer to a :py:class:`namedtuple` than to a
     :py:class:`OrderedDict` inasmuch as iteration of the collection will
     yield values rather than keys.
+
+    Records store only their values; keys are held in a
+    :class:`.RecordSchema` shared between all records with the same keys.
     """
 
-    __keys = None
+    __slots__ = ()
+
+    _schema = None
+    _record_base = None
 
     def __new__(cls, iterable):
-        from neo4j.v1.types import iter_items, Record as _Record
-        if isinstance(iterable, _Record):
-            inst = tuple.__new__(cls, iterable.values())
-            inst.__keys = tuple(iterable.keys())
-            return inst
+        base = cls._record_base or cls
+        if isinstance(iterable, Record):
+            return iterable._schema.record(iterable, base)
         keys = []
         values = []
         for key, value in iter_items(iterable):
             keys.append(key)
             values.append(value)
-        inst = tuple.__new__(cls, values)
-        inst.__keys = tuple(keys)
-        return inst
+        return RecordSchema.get(keys).record(values, base)
+
+    def __reduce__(self):
+        return self._record_base or self.__class__, (list(self.items()),)
 
     def __repr__(self):
         return "<%s %s>" % (self.__class__.__name__,
-                            " ".join("%s=%r" % (field, self[i]) for i, field in enumerate(self.__keys)))
+                            " ".join("%s=%r" % (field, self[i]) for i, field in enumerate(self._schema.keys)))
 
     def __eq__(self, other):
         return dict(self) == dict(other)
@@ -74,42 +158,36 @@ class Record(tuple, Mapping):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            keys = self.__keys[key]
-            values = super(Record, self).__getitem__(key)
+            keys = self._schema.keys[key]
+            values = tuple.__getitem__(self, key)
             return self.__class__(zip(keys, values))
-        index = self.index(key)
-        if 0 <= index < len(self):
-            return super(Record, self).__getitem__(index)
-        else:
-            return None
+        return tuple.__getitem__(self, self.index(key))
 
     def __getslice__(self, start, stop):
-        key = slice(start, stop)
-        keys = self.__keys[key]
-        values = tuple(self)[key]
-        return self.__class__(zip(keys, values))
+        return self.__getitem__(slice(start, stop))
 
     def get(self, key, default=None):
+        index = self._schema.index
         try:
-            index = self.__keys.index(ustr(key))
-        except ValueError:
-            return default
-        if 0 <= index < len(self):
-            return super(Record, self).__getitem__(index)
-        else:
-            return default
+            i = index[key]
+        except (KeyError, TypeError):
+            try:
+                i = index[ustr(key)]
+            except KeyError:
+                return default
+        return tuple.__getitem__(self, i)
 
     def index(self, key):
         """ Return the index of the given item.
         """
         if isinstance(key, integer_types):
-            if 0 <= key < len(self.__keys):
+            if 0 <= key < len(self):
                 return key
             raise IndexError(key)
         elif isinstance(key, string_types):
             try:
-                return self.__keys.index(key)
-            except ValueError:
+                return self._schema.index[key]
+            except KeyError:
                 raise KeyError(key)
         else:
             raise TypeError(key)
@@ -135,7 +213,7 @@ class Record(tuple, Mapping):
 
         :return: list of key names
         """
-        return list(self.__keys)
+        return list(self._schema.keys)
 
     def values(self, *keys):
         """ Return the values of the record, optionally filtering to
@@ -170,9 +248,9 @@ class Record(tuple, Mapping):
                 except KeyError:
                     d.append((key, None))
                 else:
-                    d.append((self.__keys[i], self[i]))
+                    d.append((self._schema.keys[i], self[i]))
             return d
-        return list((self.__keys[i], super(Record, self).__getitem__(i)) for i in range(len(self)))
+        return list(zip(self._schema.keys, tuple.__iter__(self)))
 
     def data(self, *keys):
         """ Return the keys and values of this record as a dictionary,
@@ -194,7 +272,7 @@ class Record(tuple, Mapping):
                 except KeyError:
                     d[key] = None
                 else:
-                    d[self.__keys[i]] = self[i]
+                    d[self._schema.keys[i]] = self[i]
             return d
         return dict(self)
 
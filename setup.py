@@ -56,6 +56,12 @@ package_metadata = {
         "urllib3[secure]",
     ],
     "extras_require": {
+        "arrow": [
+            "pyarrow",
+        ],
+        "json": [
+            "orjson; python_version >= '3.6'",
+        ],
         "sci": [
             "numpy",
             "pandas",
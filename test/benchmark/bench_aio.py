@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark measuring the throughput of concurrent queries issued
+from a single thread through the asyncio interface. Requires a running
+server, located via NEO4J_URI (an HTTP URI exercises the non-blocking
+client)::
+
+    python -m test.benchmark.bench_aio
+
+"""
+
+
+from __future__ import print_function
+
+from asyncio import gather, get_event_loop
+from timeit import default_timer as timer
+
+from py2neo.experimental.aio import AsyncGraph
+
+
+async def queries_per_second(graph, concurrency, count):
+    t0 = timer()
+    for _ in range(count // concurrency):
+        await gather(*[graph.evaluate("RETURN 1") for _ in range(concurrency)])
+    return count / (timer() - t0)
+
+
+async def run(count):
+    graph = AsyncGraph()
+    try:
+        await graph.evaluate("RETURN 1")  # warm up
+        for concurrency in (1, 10, 100, 500):
+            qps = await queries_per_second(graph, concurrency, count)
+            print("Concurrency %3d: %10.1f queries/s" % (concurrency, qps))
+    finally:
+        graph.close()
+
+
+def main(count=5000):
+    get_event_loop().run_until_complete(run(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing hydration of nodes and relationships one at
+a time with hydration of the same entities in bulk. Each run hydrates
+into fresh caches, then hydrates the same entities again to measure
+the cached case. No server is required::
+
+    python -m test.benchmark.bench_bulk_hydration
+
+"""
+
+
+from __future__ import print_function
+
+from gc import collect, disable, enable
+from timeit import default_timer as timer
+
+from py2neo.internal.hydration import hydrate_node, hydrate_nodes, hydrate_relationship, hydrate_relationships
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+def node_rows(count):
+    return [(i, ["Person"], {"name": u"Person %d" % i, "age": i % 100}) for i in range(count)]
+
+
+def relationship_rows(count):
+    return [(i, i, i + 1, "KNOWS", {"since": 1999}) for i in range(count)]
+
+
+def one_at_a_time(graph, nodes, relationships):
+    for identity, labels, properties in nodes:
+        hydrate_node(graph, identity, data=properties, metadata={"labels": labels})
+    for identity, start, end, type_, properties in relationships:
+        hydrate_relationship(graph, identity, start=start, end=end, type=type_, data=properties)
+
+
+def in_bulk(graph, nodes, relationships):
+    hydrate_nodes(graph, nodes)
+    hydrate_relationships(graph, relationships)
+
+
+def measure(hydrate, nodes, relationships):
+    graph = StandInGraph()
+    collect()
+    disable()
+    try:
+        t0 = timer()
+        hydrate(graph, nodes, relationships)
+        t1 = timer()
+        hydrate(graph, nodes, relationships)
+        t2 = timer()
+    finally:
+        enable()
+    return t1 - t0, t2 - t1
+
+
+def main(count=100000):
+    nodes = node_rows(count)
+    relationships = relationship_rows(count)
+    before = measure(one_at_a_time, nodes, relationships)
+    after = measure(in_bulk, nodes, relationships)
+    for i, name in enumerate(["new", "cached"]):
+        print("%-8s one at a time %10.1f entities/s   bulk %10.1f entities/s   (%.1fx)" %
+              (name + ":", 2 * count / before[i], 2 * count / after[i], before[i] / after[i]))
+
+
+if __name__ == "__main__":
+    main()
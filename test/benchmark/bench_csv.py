@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing CSV export through a :class:`.Table` with
+streaming CSV export straight from a :class:`.Cursor`, over a stand-in
+result so that no server is required::
+
+    python -m test.benchmark.bench_csv
+
+"""
+
+
+from __future__ import print_function
+
+from io import StringIO
+from timeit import default_timer as timer
+
+from py2neo.data import Table
+from py2neo.database import Cursor
+
+from test.fixtures.stand_ins import StandInResult
+
+
+KEYS = ("id", "name", "score", "tags")
+
+
+def stand_in_result(count):
+    return StandInResult(KEYS, [(i, u"Person, %d" % i, i / 7.0, [u"a", u"b"]) for i in range(count)])
+
+
+def table_csv(count):
+    cursor = Cursor(stand_in_result(count))
+    t0 = timer()
+    out = StringIO()
+    Table(cursor).write_csv(out, header=True)
+    return timer() - t0, out.getvalue()
+
+
+def cursor_csv(count):
+    cursor = Cursor(stand_in_result(count))
+    t0 = timer()
+    out = StringIO()
+    cursor.write_csv(out, header=True)
+    return timer() - t0, out.getvalue()
+
+
+def main(count=200000):
+    table_time, table_output = table_csv(count)
+    cursor_time, cursor_output = cursor_csv(count)
+    assert table_output == cursor_output
+    print("Table.write_csv:  %10.1f records/s" % (count / table_time))
+    print("Cursor.write_csv: %10.1f records/s" % (count / cursor_time))
+
+
+if __name__ == "__main__":
+    main()
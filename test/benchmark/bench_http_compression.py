@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Benchmark measuring the bytes saved and the client CPU spent by
+compressing HTTP request and response bodies, against a local
+stand-in for the transactional endpoint so that no server is
+required::
+
+    python -m test.benchmark.bench_http_compression
+
+"""
+
+
+from __future__ import print_function
+
+from gzip import GzipFile
+from io import BytesIO
+from json import dumps as json_dumps, loads as json_loads
+from threading import Thread
+from timeit import default_timer as timer
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+try:
+    from time import thread_time
+except ImportError:
+    thread_time = timer
+
+from py2neo.internal.http import HTTP, HTTPSession
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+ROWS = 10000
+REQUESTS = 5
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+
+    bytes_received = 0
+    bytes_sent = 0
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers["Content-Length"]))
+        StandInHandler.bytes_received += len(data)
+        if self.headers.get("Content-Encoding") == "gzip":
+            data = GzipFile(fileobj=BytesIO(data)).read()
+        rows = json_loads(data.decode("utf-8"))["statements"][0]["parameters"]["rows"]
+        body = json_dumps({"results": [{
+            "columns": ["id", "name", "score"],
+            "data": [{"row": [row["id"], row["name"], row["score"]], "meta": [None, None, None]} for row in rows],
+            "stats": {},
+        }], "errors": []}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            out = BytesIO()
+            with GzipFile(fileobj=out, mode="wb") as f:
+                f.write(body)
+            body = out.getvalue()
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        StandInHandler.bytes_sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(port, compression):
+    StandInHandler.bytes_received = StandInHandler.bytes_sent = 0
+    http = HTTP("http://127.0.0.1:%d/db/data/" % port, {}, False, compression=compression)
+    rows = [{"id": i, "name": "Person %d" % i, "score": i / 7.0} for i in range(ROWS)]
+    cpu = 0.0
+    for _ in range(REQUESTS):
+        session = HTTPSession(StandInGraph(), http)
+        t0 = thread_time()
+        result = session.run("UNWIND $rows AS row RETURN row.id AS id, row.name AS name, row.score AS score",
+                             rows=rows)
+        session.sync()
+        assert len(list(result)) == ROWS
+        cpu += thread_time() - t0
+    http.close()
+    return StandInHandler.bytes_received, StandInHandler.bytes_sent, cpu
+
+
+def main():
+    server = HTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        port = server.server_address[1]
+        print("%d requests of %d rows" % (REQUESTS, ROWS))
+        for compression in (False, True):
+            sent, received, cpu = run(port, compression)
+            print("compression=%-5s  sent %10d bytes  received %10d bytes  client CPU %7.1f ms" %
+                  (compression, sent, received, 1000 * cpu))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
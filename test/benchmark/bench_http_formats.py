@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing the size and hydration cost of the "REST"
+and "row" + "graph" result formats of the HTTP transactional endpoint,
+over synthetic responses so that no server is required::
+
+    python -m test.benchmark.bench_http_formats
+
+"""
+
+
+from __future__ import print_function
+
+from json import dumps, loads
+from timeit import default_timer as timer
+
+from py2neo.internal.json import JSONHydrator
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+BASE = "http://localhost:7474/db/data"
+KEYS = ("a", "r", "b")
+
+
+def rest_node(identity):
+    uri = "%s/node/%d" % (BASE, identity)
+    return {
+        "self": uri,
+        "labels": uri + "/labels",
+        "properties": uri + "/properties",
+        "property": uri + "/properties/{key}",
+        "relationships": uri + "/relationships",
+        "all_relationships": uri + "/relationships/all",
+        "all_typed_relationships": uri + "/relationships/all/{-list|&|types}",
+        "incoming_relationships": uri + "/relationships/in",
+        "incoming_typed_relationships": uri + "/relationships/in/{-list|&|types}",
+        "outgoing_relationships": uri + "/relationships/out",
+        "outgoing_typed_relationships": uri + "/relationships/out/{-list|&|types}",
+        "create_relationship": uri + "/relationships",
+        "traverse": uri + "/traverse/{returnType}",
+        "paged_traverse": uri + "/paged/traverse/{returnType}{?pageSize,leaseTime}",
+        "extensions": {},
+        "metadata": {"id": identity, "labels": ["Person"]},
+        "data": {"name": "Person %d" % identity, "age": identity % 90},
+    }
+
+
+def rest_relationship(identity, start, end):
+    uri = "%s/relationship/%d" % (BASE, identity)
+    return {
+        "self": uri,
+        "start": "%s/node/%d" % (BASE, start),
+        "end": "%s/node/%d" % (BASE, end),
+        "type": "KNOWS",
+        "properties": uri + "/properties",
+        "property": uri + "/properties/{key}",
+        "extensions": {},
+        "metadata": {"id": identity, "type": "KNOWS"},
+        "data": {"since": 1900 + identity % 100},
+    }
+
+
+def graph_node(identity):
+    return {"id": str(identity), "labels": ["Person"],
+            "properties": {"name": "Person %d" % identity, "age": identity % 90}}
+
+
+def graph_relationship(identity, start, end):
+    return {"id": str(identity), "type": "KNOWS", "startNode": str(start), "endNode": str(end),
+            "properties": {"since": 1900 + identity % 100}}
+
+
+def rest_response(count):
+    data = [{"rest": [rest_node(2 * i), rest_relationship(i, 2 * i, 2 * i + 1), rest_node(2 * i + 1)]}
+            for i in range(count)]
+    return dumps({"results": [{"columns": list(KEYS), "data": data}], "errors": []})
+
+
+def row_graph_response(count):
+    data = []
+    for i in range(count):
+        a, b = graph_node(2 * i), graph_node(2 * i + 1)
+        r = graph_relationship(i, 2 * i, 2 * i + 1)
+        data.append({
+            "row": [a["properties"], r["properties"], b["properties"]],
+            "meta": [{"id": 2 * i, "type": "node", "deleted": False},
+                     {"id": i, "type": "relationship", "deleted": False},
+                     {"id": 2 * i + 1, "type": "node", "deleted": False}],
+            "graph": {"nodes": [a, b], "relationships": [r]},
+        })
+    return dumps({"results": [{"columns": list(KEYS), "data": data}], "errors": []})
+
+
+def hydrate_rest(content):
+    hydrant = JSONHydrator(StandInGraph(), KEYS)
+    t0 = timer()
+    for item in loads(content)["results"][0]["data"]:
+        hydrant.hydrate(item["rest"])
+    return timer() - t0
+
+
+def hydrate_row_graph(content):
+    hydrant = JSONHydrator(StandInGraph(), KEYS)
+    t0 = timer()
+    for item in loads(content)["results"][0]["data"]:
+        hydrant.hydrate_row(item["row"], item["meta"], item["graph"])
+    return timer() - t0
+
+
+def main(count=20000):
+    rest = rest_response(count)
+    row_graph = row_graph_response(count)
+    rest_time = hydrate_rest(rest)
+    row_graph_time = hydrate_row_graph(row_graph)
+    print("REST:        %10d bytes  %10.1f records/s" % (len(rest.encode("utf-8")), count / rest_time))
+    print("row + graph: %10d bytes  %10.1f records/s" % (len(row_graph.encode("utf-8")), count / row_graph_time))
+
+
+if __name__ == "__main__":
+    main()
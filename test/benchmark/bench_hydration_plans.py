@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing per-value hydration of PackStream records,
+as performed before hydration plans were introduced, with hydration
+through a compiled per-column plan. Synthetic PackStream structures
+are used, so no server is required::
+
+    python -m test.benchmark.bench_hydration_plans
+
+"""
+
+
+from __future__ import print_function
+
+from timeit import default_timer as timer
+
+from neo4j.packstream.structure import Structure
+
+from py2neo.internal.packstream import PackStreamHydrator
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+def wide_scalar_records(count, width=20):
+    return [[i, i / 7.0, u"name %d" % i, True, None] * (width // 5) for i in range(count)]
+
+
+def node_records(count):
+    return [[Structure(b"N", i, ["Person"], {"name": u"Person %d" % i, "age": i % 100}),
+             Structure(b"R", i, i, i + 1, "KNOWS", {"since": 1999}),
+             Structure(b"N", i + 1, ["Person"], {"name": u"Person %d" % (i + 1), "age": i % 100})]
+            for i in range(count)]
+
+
+def mixed_records(count):
+    return [[i, u"name %d" % i, Structure(b"N", i, ["Person"], {"name": u"Person %d" % i}),
+             [1, 2, 3], {"x": i}] for i in range(count)]
+
+
+def per_value(records):
+    hydrator = PackStreamHydrator(StandInGraph(), ())
+    t0 = timer()
+    for values in records:
+        tuple(map(hydrator._value_hydrator(), values))
+    return timer() - t0
+
+
+def planned(records):
+    hydrator = PackStreamHydrator(StandInGraph(), ())
+    t0 = timer()
+    for values in records:
+        hydrator.hydrate(values)
+    return timer() - t0
+
+
+def main(count=100000):
+    for name, records in [("wide scalar", wide_scalar_records(count)),
+                          ("node/relationship", node_records(count)),
+                          ("mixed", mixed_records(count))]:
+        before = per_value(records)
+        after = planned(records)
+        print("%-18s per-value %10.1f records/s   planned %10.1f records/s   (%.1fx)" %
+              (name + ":", count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main()
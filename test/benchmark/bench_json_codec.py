@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing the cost of encoding statement parameters
+and decoding results for the HTTP transport, using the original
+dehydrate-then-encode path and streaming decoder against the plain
+parameter check, the fastest installed JSON codec and whole response
+decoding, over batches of the size typically sent with ``UNWIND``::
+
+    python -m test.benchmark.bench_json_codec
+
+"""
+
+
+from __future__ import print_function
+
+from gc import collect, disable, enable
+from json import dumps as json_dumps
+from timeit import default_timer as timer
+
+from py2neo.internal.http import HTTPResultLoader, HTTPResultStream, fix_parameters
+from py2neo.internal.json import JSONDehydrator, StandardJSONCodec, get_json_codec
+
+
+BATCH_SIZES = (1000, 10000, 100000)
+
+
+class StandInResponse(object):
+
+    def __init__(self, data, chunk_size=65536):
+        self.data = data
+        self.chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    def stream(self, amt):
+        return iter(self.chunks)
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def batch(size):
+    return {u"rows": [{u"id": i, u"name": u"Person %d" % i, u"score": i / 7.0,
+                       u"active": i % 2 == 0, u"tags": [u"a", u"b"]} for i in range(size)]}
+
+
+def response(size):
+    data = [{u"row": [i, u"Person %d" % i, i / 7.0], u"meta": [None, None, None]} for i in range(size)]
+    return json_dumps({u"results": [{u"columns": [u"id", u"name", u"score"], u"data": data,
+                                     u"stats": {}}], u"errors": []}).encode("utf-8")
+
+
+def encode_original(parameters):
+    t0 = timer()
+    dehydrated, = JSONDehydrator().dehydrate([parameters])
+    json_dumps({u"statements": [{u"parameters": dehydrated}]}).encode("utf-8")
+    return timer() - t0
+
+
+def encode_codec(parameters, codec):
+    t0 = timer()
+    codec.dumps({u"statements": [{u"parameters": fix_parameters(parameters)}]}, default=JSONDehydrator().default)
+    return timer() - t0
+
+
+def decode(data, codec):
+    t0 = timer()
+    HTTPResultStream(StandInResponse(data), [HTTPResultLoader()], json_codec=codec).drain()
+    return timer() - t0
+
+
+def main():
+    # Collection pauses dominate at larger batch sizes, so are kept
+    # out of the measurements, as :mod:`timeit` does.
+    collect()
+    disable()
+    try:
+        run()
+    finally:
+        enable()
+
+
+def run():
+    codec = get_json_codec()
+    print("Fastest installed codec: %s" % codec.name)
+    for size in BATCH_SIZES:
+        parameters = batch(size)
+        data = response(size)
+        print("%d rows" % size)
+        print("  encode  original:       %8.1f ms" % (1000 * encode_original(parameters)))
+        print("  encode  %-16s %8.1f ms" % (StandardJSONCodec.name + ":", 1000 * encode_codec(parameters, StandardJSONCodec())))
+        print("  encode  %-16s %8.1f ms" % (codec.name + ":", 1000 * encode_codec(parameters, codec)))
+        print("  decode  streamed:       %8.1f ms" % (1000 * decode(data, None)))
+        print("  decode  %-16s %8.1f ms" % (StandardJSONCodec.name + ":", 1000 * decode(data, StandardJSONCodec())))
+        print("  decode  %-16s %8.1f ms" % (codec.name + ":", 1000 * decode(data, codec)))
+
+
+if __name__ == "__main__":
+    main()
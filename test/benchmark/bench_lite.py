@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing hydration of full and lite nodes from raw
+PackStream structures, measuring hydration rate and the memory retained
+per million nodes. No server is required::
+
+    python -m test.benchmark.bench_lite
+
+"""
+
+
+from __future__ import print_function
+
+from gc import collect
+from timeit import default_timer as timer
+from tracemalloc import start, stop, take_snapshot
+
+from neo4j.packstream.structure import Structure
+
+from py2neo.internal.packstream import PackStreamHydrator
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+def raw_values(count):
+    return [[Structure(b"N", i, ["Person"], {"name": "Person %d" % i, "age": i % 100})] for i in range(count)]
+
+
+def hydrate(values, lite):
+    hydrant = PackStreamHydrator(StandInGraph(), ("a",), lite=lite)
+    return [hydrant.hydrate(v)[0] for v in values]
+
+
+def hydration_rate(count, lite):
+    values = raw_values(count)
+    t0 = timer()
+    hydrate(values, lite)
+    return count / (timer() - t0)
+
+
+def memory_per_million(count, lite):
+    values = raw_values(count)
+    collect()
+    start()
+    base = take_snapshot()
+    nodes = hydrate(values, lite)
+    retained = sum(stat.size_diff for stat in take_snapshot().compare_to(base, "filename"))
+    stop()
+    assert len(nodes) == count
+    return retained * 1000000 // count
+
+
+def main(count=200000):
+    for name, lite in [("Full", False), ("Lite", True)]:
+        rate = hydration_rate(count, lite)
+        memory = memory_per_million(count, lite)
+        print("%s: %10.1f nodes/s, %8.1f MB per million nodes" % (name, rate, memory / 1048576.0))
+
+
+if __name__ == "__main__":
+    main()
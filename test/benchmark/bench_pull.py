@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing the former one-statement-per-entity subgraph
+pull with the batched pull. Requires a running server, located via
+NEO4J_URI::
+
+    python -m test.benchmark.bench_pull
+
+"""
+
+
+from __future__ import print_function
+
+from timeit import default_timer as timer
+
+from py2neo import Graph, Node, Relationship, Subgraph
+from py2neo.internal.operations import pull_subgraph
+
+
+def pull_subgraph_per_entity(tx, subgraph):
+    graph = tx.graph
+    statements = 0
+    for node in subgraph.nodes:
+        tx.entities.append({"_": node})
+        tx.run("MATCH (_) WHERE id(_) = {x} RETURN _, labels(_)", x=node.identity)
+        statements += 1
+    for relationship in subgraph.relationships:
+        if relationship.graph is graph:
+            tx.entities.append({"_": relationship})
+            tx.run("MATCH ()-[_]->() WHERE id(_) = {x} RETURN _", x=relationship.identity)
+            statements += 1
+    return statements
+
+
+def pull_subgraph_batched(tx, subgraph):
+    pull_subgraph(tx, subgraph)
+    return int(bool(subgraph.nodes)) + int(bool(subgraph.relationships))
+
+
+def timed_pull(graph, subgraph, pull):
+    t0 = timer()
+    with graph.begin() as tx:
+        statements = pull(tx, subgraph)
+    return statements, timer() - t0
+
+
+def main(size=10000):
+    graph = Graph()
+    nodes = [Node("BenchPull", number=i) for i in range(size)]
+    relationships = [Relationship(nodes[i], "NEXT", nodes[i + 1]) for i in range(size - 1)]
+    subgraph = Subgraph(nodes, relationships)
+    graph.create(subgraph)
+    try:
+        for name, pull in [("Per entity", pull_subgraph_per_entity), ("Batched", pull_subgraph_batched)]:
+            statements, elapsed = timed_pull(graph, subgraph, pull)
+            print("%-10s: %6d statements in %8.3fs" % (name, statements, elapsed))
+    finally:
+        graph.delete(subgraph)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Micro-benchmark comparing autocommit query throughput with and without
+session pooling. Requires a running server, located via NEO4J_URI::
+
+    python -m test.benchmark.bench_session_pool
+
+"""
+
+
+from __future__ import print_function
+
+from timeit import default_timer as timer
+
+from py2neo import Graph
+
+
+def queries_per_second(graph, count):
+    t0 = timer()
+    for _ in range(count):
+        graph.evaluate("RETURN 1")
+    return count / (timer() - t0)
+
+
+def main(count=5000):
+    graph = Graph()
+    graph.evaluate("RETURN 1")  # warm up
+    pool = graph.session_pool
+    pool_size = pool.max_size
+    try:
+        pool.close()
+        pool.max_size = 0
+        before = queries_per_second(graph, count)
+        pool.max_size = pool_size
+        after = queries_per_second(graph, count)
+    finally:
+        pool.max_size = pool_size
+    print("Without session pool: %10.1f queries/s" % before)
+    print("With session pool:    %10.1f queries/s" % after)
+    print("Speed-up:             %10.2fx" % (after / before))
+
+
+if __name__ == "__main__":
+    main()
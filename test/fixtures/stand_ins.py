@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from py2neo.internal.caching import EntityCache
+from py2neo.storage import RecordSchema
+
+
+class StandInGraph(object):
+    """ Graph with entity caches but no database, for hydrating
+    values without a server.
+    """
+
+    database = None
+    name = "data"
+
+    def __init__(self):
+        self.node_cache = EntityCache()
+        self.relationship_cache = EntityCache()
+
+
+class StandInResult(object):
+    """ Result that serves a fixed list of rows to a :class:`.Cursor`.
+    """
+
+    def __init__(self, keys, values):
+        self._keys = keys
+        schema = RecordSchema.get(keys)
+        self._records = iter([schema.record(v) for v in values])
+
+    def keys(self):
+        return list(self._keys)
+
+    def fetch(self):
+        return next(self._records, None)
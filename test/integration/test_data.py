@@ -16,7 +16,7 @@
 # limitations under the License.
 
 
-from py2neo.data import order, size, Node, Relationship, Path
+from py2neo.data import order, size, Node, Relationship, Path, Subgraph
 from py2neo.internal.compat import long
 from py2neo.testing import IntegrationTestCase
 
@@ -182,24 +182,24 @@ class RelationshipTestCase(IntegrationTestCase):
         got = self.graph.relationships.get(r.identity)
         assert got.identity == r.identity
 
-    def test_relationship_cache_is_thread_local(self):
+    def test_relationship_cache_is_shared_between_threads(self):
         import threading
         a = Node()
         b = Node()
         r = Relationship(a, "TO", b)
         self.graph.create(r)
         assert r.identity in self.graph.relationship_cache
-        other_relationship_cache_keys = []
+        other_relationships = []
 
-        def check_cache():
-            other_relationship_cache_keys.extend(self.graph.relationship_cache.keys())
+        def get_relationship():
+            other_relationships.append(self.graph.relationships.get(r.identity))
 
-        thread = threading.Thread(target=check_cache)
+        thread = threading.Thread(target=get_relationship)
         thread.start()
         thread.join()
 
         assert r.identity in self.graph.relationship_cache
-        assert r.identity not in other_relationship_cache_keys
+        assert other_relationships[0] is r
 
     def test_cannot_get_relationship_by_id_when_id_does_not_exist(self):
         a = Node()
@@ -211,6 +211,30 @@ class RelationshipTestCase(IntegrationTestCase):
         with self.assertRaises(KeyError):
             _ = self.graph.relationships[rel_id]
 
+    def test_stale_endpoints_are_loaded_together(self):
+        a = Node(name="Alice")
+        others = [Node(name=name) for name in ["Bob", "Carol", "Dave"]]
+        self.graph.create(Subgraph([a] + others, [Relationship(a, "KNOWS", b) for b in others]))
+        self.graph.node_cache.clear()
+        relationships = list(self.graph.run("MATCH (a)-[ab:KNOWS]->() WHERE id(a) = {x} RETURN ab",
+                                            x=a.identity).to_subgraph().relationships)
+        assert all("properties" in r.end_node._stale for r in relationships)
+        assert relationships[0].end_node["name"] is not None
+        assert not any(r.end_node._stale for r in relationships)
+        assert {r.end_node["name"] for r in relationships} == {"Bob", "Carol", "Dave"}
+
+    def test_can_prefetch_endpoints(self):
+        a = Node(name="Alice")
+        b = Node(name="Bob")
+        self.graph.create(Relationship(a, "KNOWS", b))
+        self.graph.node_cache.clear()
+        cursor = self.graph.run("MATCH (a)-[ab:KNOWS]->() WHERE id(a) = {x} RETURN ab", x=a.identity)
+        assert cursor.prefetch_endpoints() == 2
+        relationship = cursor.evaluate()
+        assert not relationship.start_node._stale
+        assert not relationship.end_node._stale
+        assert relationship.end_node["name"] == "Bob"
+
     def test_getting_no_relationships(self):
         alice = Node(name="Alice")
         self.graph.create(alice)
@@ -829,6 +853,28 @@ class PullTestCase(IntegrationTestCase):
         assert set(alice_1.labels) == set(alice_2.labels)
         assert dict(alice_1) == dict(alice_2)
 
+    def test_can_pull_many_nodes(self):
+        nodes = [Node("Thing", number=i) for i in range(100)]
+        subgraph = Subgraph(nodes)
+        self.graph.create(subgraph)
+        self.graph.run("MATCH (a:Thing) WHERE id(a) IN {x} SET a.number = a.number * 2, a:Even",
+                       x=[node.identity for node in nodes])
+        deleted = self.graph.pull(subgraph)
+        assert deleted == []
+        for i, node in enumerate(nodes):
+            assert node["number"] == 2 * i
+            assert set(node.labels) == {"Thing", "Even"}
+
+    def test_pull_reports_deleted_entities(self):
+        a = Node(name="Alice")
+        b = Node(name="Bob")
+        ab = Relationship(a, "KNOWS", b)
+        self.graph.create(ab)
+        self.graph.run("MATCH (a) WHERE id(a) = {x} DETACH DELETE a", x=b.identity)
+        deleted = self.graph.pull(ab)
+        assert set(deleted) == {b, ab}
+        assert a["name"] == "Alice"
+
     def test_can_pull_path(self):
         alice = Node(name="Alice")
         bob = Node(name="Bob")
@@ -928,6 +974,50 @@ class PushTestCase(IntegrationTestCase):
         assert set(alice_1.labels) == set(alice_2.labels)
         assert dict(alice_1) == dict(alice_2)
 
+    def test_can_push_many_nodes_with_different_label_changes(self):
+        nodes = [Node("Thing", number=i) for i in range(30)]
+        self.graph.create(Subgraph(nodes))
+        for i, node in enumerate(nodes):
+            node["number"] = -i
+            if i % 3 == 1:
+                node.add_label("One")
+            elif i % 3 == 2:
+                node.remove_label("Thing")
+                node.add_label("Two")
+        self.graph.push(Subgraph(nodes))
+        for i, node in enumerate(nodes):
+            record = self.graph.run("MATCH (a) WHERE id(a)={x} RETURN a.number, labels(a)", x=node.identity).next()
+            assert record[0] == -i
+            assert set(record[1]) == [{"Thing"}, {"Thing", "One"}, {"Two"}][i % 3]
+            assert node._remote_labels == frozenset(node.labels)
+
+    def test_push_sends_only_changed_properties(self):
+        a = Node(name="Alice", age=33)
+        self.graph.create(a)
+        self.graph.run("MATCH (a) WHERE id(a)={x} SET a.age = 34", x=a.identity)
+        a["name"] = "Alicia"
+        self.graph.push(a)
+        record = self.graph.run("MATCH (a) WHERE id(a)={x} RETURN a.name, a.age", x=a.identity).next()
+        assert record[0] == "Alicia"
+        assert record[1] == 34
+        assert a.dirty_keys() == set()
+
+    def test_push_removes_deleted_properties(self):
+        a = Node(name="Alice", age=33)
+        self.graph.create(a)
+        del a["age"]
+        self.graph.push(a)
+        value = self.graph.evaluate("MATCH (a) WHERE id(a)={x} RETURN a.age", x=a.identity)
+        assert value is None
+
+    def test_push_skips_clean_entities(self):
+        a = Node(name="Alice")
+        self.graph.create(a)
+        self.graph.run("MATCH (a) WHERE id(a)={x} SET a.name = 'Bob'", x=a.identity)
+        self.graph.push(a)
+        value = self.graph.evaluate("MATCH (a) WHERE id(a)={x} RETURN a.name", x=a.identity)
+        assert value == "Bob"
+
     def test_can_push_relationship(self):
         a = Node()
         b = Node()
@@ -23,7 +23,7 @@ from unittest import TestCase
 from neo4j.exceptions import ConstraintError, CypherSyntaxError
 
 from py2neo import Graph
-from py2neo.data import Node, Relationship, Path, order, size
+from py2neo.data import Node, Relationship, Path, LiteNode, LiteRelationship, order, size
 from py2neo.database import Database, GraphError, TransactionFinished
 from py2neo.internal.json import JSONHydrator
 from py2neo.storage import Record
@@ -189,6 +189,17 @@ class GraphObjectTestCase(IntegrationTestCase):
         got = self.graph.nodes.get(node.identity)
         assert got.identity == node.identity
 
+    def test_cache_stats(self):
+        self.graph.cache_stats(reset=True)
+        node = Node()
+        self.graph.create(node)
+        _ = self.graph.nodes.get(node.identity)
+        stats = self.graph.cache_stats()
+        assert stats["nodes"]["inserts"] >= 1
+        assert stats["nodes"]["hits"] >= 1
+        assert stats["nodes"]["size"] >= 1
+        assert self.graph.database.cache_stats()[self.graph.__name__]["nodes"]["hits"] >= 1
+
     def test_get_non_existent_node_by_id(self):
         node = Node()
         self.graph.create(node)
@@ -584,6 +595,64 @@ class TransactionRunTestCase(IntegrationTestCase):
         else:
             assert False
 
+    def test_can_run_statements_through_pipeline(self):
+        tx = self.graph.begin()
+        with tx.pipeline() as pipeline:
+            for i in range(3):
+                pipeline.run("RETURN $x", x=i)
+        tx.commit()
+        assert [cursor.evaluate() for cursor in pipeline.cursors] == [0, 1, 2]
+        assert pipeline.round_trips_saved == 2
+
+    def test_cannot_pipeline_autocommit_transaction(self):
+        tx = self.graph.begin(autocommit=True)
+        with self.assertRaises(TypeError):
+            tx.pipeline()
+
+    def test_can_run_batch(self):
+        cursors = self.graph.run_batch(["RETURN 1", ("RETURN $x", {"x": 2})])
+        assert [cursor.evaluate() for cursor in cursors] == [1, 2]
+
+    def test_can_run_lite(self):
+        tx = self.graph.begin(autocommit=True, lite=True)
+        cursor = tx.run("CREATE p=(a:Person {name:'Alice'})-[ab:KNOWS {since:1999}]->(b:Person {name:'Bob'}) "
+                        "RETURN a, ab, p")
+        a, ab, p = cursor.next()
+        assert isinstance(a, LiteNode)
+        assert a.labels == {"Person"}
+        assert a["name"] == "Alice"
+        assert a.identity not in self.graph.node_cache
+        assert isinstance(ab, LiteRelationship)
+        assert ab.type == "KNOWS"
+        assert ab["since"] == 1999
+        assert ab.start_node.identity == a.identity
+        assert isinstance(p, tuple)
+        assert len(p) == 3
+        assert p[0] == a
+        assert p[1] == ab
+
+    def test_streamed_autocommit_finishes_when_cursor_exhausted(self):
+        tx = self.graph.begin(autocommit=True, stream=True)
+        cursor = tx.run("UNWIND range(1, 3) AS n RETURN n")
+        assert not tx.finished()
+        assert [record[0] for record in cursor] == [1, 2, 3]
+        assert tx.finished()
+
+    def test_streamed_autocommit_finishes_when_cursor_closed(self):
+        tx = self.graph.begin(autocommit=True, stream=True)
+        cursor = tx.run("UNWIND range(1, 1000) AS n RETURN n")
+        assert cursor.evaluate() == 1
+        assert not tx.finished()
+        cursor.close()
+        assert tx.finished()
+
+    def test_cannot_run_twice_in_streamed_autocommit(self):
+        tx = self.graph.begin(autocommit=True, stream=True)
+        cursor = tx.run("RETURN 1")
+        with self.assertRaises(TransactionFinished):
+            tx.run("RETURN 2")
+        cursor.close()
+
 
 class TransactionCreateTestCase(IntegrationTestCase):
 
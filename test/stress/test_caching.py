@@ -19,7 +19,7 @@
 from platform import python_implementation
 from unittest import TestCase, skipIf
 
-from py2neo.internal.caching import ThreadLocalEntityCache
+from py2neo.internal.caching import EntityCache
 
 
 IMPLEMENTATION = python_implementation()
@@ -35,7 +35,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_value_constructor_where_key_does_not_exist(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
 
         # When
         key = "X"
@@ -47,7 +47,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_value_constructor_where_key_already_exists(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
         old_value = Entity()
         cache._dict[key] = old_value
@@ -61,7 +61,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_value_where_key_does_not_exist(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
 
         # When
@@ -74,7 +74,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_value_where_key_already_exists(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
         old_value = Entity()
         cache._dict[key] = old_value
@@ -89,7 +89,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_none_where_key_does_not_exist(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
 
         # When
@@ -100,7 +100,7 @@ class EntityCacheTestCase(TestCase):
 
     def test_update_with_none_where_key_already_exists(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
         value = Entity()
         cache._dict[key] = value
@@ -114,7 +114,7 @@ class EntityCacheTestCase(TestCase):
     @skipIf(IMPLEMENTATION == "PyPy", "Test not supported in PyPy yet")
     def test_implicit_removal_by_value_deletion(self):
         # Given
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
         key = "X"
         value = Entity()
         cache._dict[key] = value
@@ -125,13 +125,113 @@ class EntityCacheTestCase(TestCase):
         # Then the key should no longer exist in the cache
         assert key not in cache._dict
 
+    @skipIf(IMPLEMENTATION == "PyPy", "Test not supported in PyPy yet")
+    def test_recent_values_survive_deletion(self):
+        # Given
+        cache = EntityCache(max_size=2)
+        for key in "XYZ":
+            cache.update(key, Entity())
+
+        # Then only the most recently used values should remain
+        assert "X" not in cache._dict
+        assert "Y" in cache._dict
+        assert "Z" in cache._dict
+
+    @skipIf(IMPLEMENTATION == "PyPy", "Test not supported in PyPy yet")
+    def test_extraction_refreshes_recency(self):
+        # Given
+        cache = EntityCache(max_size=2)
+        cache.update("X", Entity())
+        cache.update("Y", Entity())
+
+        # When
+        cache.update("X", Entity)
+        cache.update("Z", Entity())
+
+        # Then the least recently used value should have been released
+        assert "X" in cache._dict
+        assert "Y" not in cache._dict
+        assert "Z" in cache._dict
+
+    def test_values_are_shared_between_threads(self):
+        from threading import Thread
+
+        # Given
+        cache = EntityCache()
+        key = "X"
+        value = Entity()
+        cache.update(key, value)
+
+        # When
+        extracted = []
+        thread = Thread(target=lambda: extracted.append(cache.update(key, Entity)))
+        thread.start()
+        thread.join()
+
+        # Then the other thread should see the same value
+        assert extracted == [value]
+
+    def test_lookup_takes_no_lock_without_strong_tier(self):
+        # Given
+        cache = EntityCache()
+        value = cache.update("X", Entity)
+
+        # When the lock is held elsewhere
+        with cache.lock:
+            extracted = cache["X"]
+
+        # Then the lookup should still succeed, and be counted
+        assert extracted is value
+        assert cache.stats()["hits"] == 1
+
+    def test_stats(self):
+        # Given
+        cache = EntityCache(max_size=1)
+        x = cache.update("X", Entity)
+        y = cache.update("Y", Entity())
+        cache.update("X", Entity)
+        cache.update("Y", None)
+        try:
+            _ = cache["Z"]
+        except KeyError:
+            pass
+
+        # When
+        stats = cache.stats()
+
+        # Then
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["inserts"] == 2
+        assert stats["removals"] == 1
+        assert stats["evictions"] == 2
+        assert stats["size"] == 1
+        assert stats["strong_size"] == 1
+        assert stats["estimated_memory"] > 0
+        assert x and y
+
+    def test_stats_can_be_reset(self):
+        # Given
+        cache = EntityCache()
+        value = cache.update("X", Entity)
+
+        # When
+        before = cache.stats(reset=True)
+        after = cache.stats()
+
+        # Then
+        assert before["inserts"] == 1
+        assert after["inserts"] == 0
+        assert after["size"] == 1
+        assert value
+
     @skipIf(IMPLEMENTATION == "PyPy", "Test not supported in PyPy yet")
     def test_threaded_usage(self):
         from random import choice, randint
         from threading import Event, Lock, Thread
         from time import time
 
-        cache = ThreadLocalEntityCache()
+        cache = EntityCache()
 
         keys = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
         values = []
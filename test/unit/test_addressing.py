@@ -29,7 +29,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'bolt',
@@ -45,7 +52,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'bolt+routing',
@@ -61,7 +75,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'http',
@@ -77,7 +98,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'https',
@@ -93,7 +121,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'https',
@@ -109,7 +144,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'https',
@@ -125,7 +167,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'http',
@@ -141,7 +190,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'http',
@@ -157,7 +213,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'other',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 9999,
             'scheme': 'bolt',
@@ -173,7 +236,14 @@ class AddressingTestCase(TestCase):
         del data["hash"]
         self.assertEqual(data, {
             'auth': ('neo4j', 'password'),
+            'compression': False,
             'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
             'password': 'password',
             'port': 8888,
             'scheme': 'bolt',
@@ -183,3 +253,37 @@ class AddressingTestCase(TestCase):
             'user': 'neo4j',
             'user_agent': bolt_user_agent(),
         })
+
+    def test_http_uri_and_compression(self):
+        data = get_connection_data("http://host:9999", compression=True)
+        del data["hash"]
+        self.assertEqual(data, {
+            'auth': ('neo4j', 'password'),
+            'compression': True,
+            'host': 'host',
+            'http_connect_timeout': None,
+            'http_keep_alive': None,
+            'http_pool_block': False,
+            'http_pool_size': 10,
+            'http_read_timeout': None,
+            'http_retries': 3,
+            'password': 'password',
+            'port': 9999,
+            'scheme': 'http',
+            'secure': False,
+            'verified': False,
+            'uri': 'http://host:9999',
+            'user': 'neo4j',
+            'user_agent': http_user_agent(),
+        })
+
+    def test_http_uri_and_pool_settings(self):
+        data = get_connection_data("http://host:9999", http_pool_size=32, http_pool_block=True,
+                                   http_connect_timeout=2.0, http_read_timeout=30.0, http_retries=0,
+                                   http_keep_alive=60.0)
+        self.assertEqual(data["http_pool_size"], 32)
+        self.assertEqual(data["http_pool_block"], True)
+        self.assertEqual(data["http_connect_timeout"], 2.0)
+        self.assertEqual(data["http_read_timeout"], 30.0)
+        self.assertEqual(data["http_retries"], 0)
+        self.assertEqual(data["http_keep_alive"], 60.0)
@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from json import dumps as json_dumps, loads as json_loads
+from sys import version_info
+from unittest import SkipTest, TestCase
+
+if version_info < (3, 5):
+    raise SkipTest("The asyncio interface requires Python 3.5 or above")
+
+from asyncio import Protocol, new_event_loop, set_event_loop
+
+from neo4j.exceptions import AuthError
+
+from py2neo.data import Node, Relationship
+from py2neo.database import GraphError, TransactionFinished
+from py2neo.experimental.aio import AsyncGraph, AsyncHTTP
+
+
+def http_response(status, body=None, headers=(), framing="length", chunk_size=7):
+    """ Build an HTTP response, with the body delimited by a
+    Content-Length header, chunked transfer encoding or the end of the
+    connection.
+    """
+    reasons = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found"}
+    lines = ["HTTP/1.1 %d %s" % (status, reasons[status])]
+    lines.extend("%s: %s" % item for item in headers)
+    payload = b"" if body is None else json_dumps(body).encode("utf-8")
+    if framing == "length":
+        lines.append("Content-Length: %d" % len(payload))
+    elif framing == "chunked":
+        lines.append("Transfer-Encoding: chunked")
+        chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+        payload = b"".join(b"%x;ext=1\r\n%s\r\n" % (len(chunk), chunk) for chunk in chunks)
+        payload += b"0\r\nX-Trailer: yes\r\n\r\n"
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+class StandInServerProtocol(Protocol):
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connection_count += 1
+
+    def data_received(self, data):
+        self.buffer += data
+        while True:
+            head, sep, rest = self.buffer.partition(b"\r\n\r\n")
+            if not sep:
+                return
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ")
+            headers = {}
+            for line in lines[1:]:
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+            if len(rest) < length:
+                return
+            body, self.buffer = rest[:length], rest[length:]
+            content = json_loads(body.decode("utf-8")) if body else None
+            self.server.requests.append((method, path, content))
+            response, close = self.server.handler(method, path, content)
+            if response:
+                self.transport.write(response)
+            if close:
+                self.transport.close()
+                return
+
+
+class StandInServer(object):
+    """ Local HTTP server whose responses are produced by a `handler`
+    function, called with the method, path and decoded JSON body of
+    each request and returning a 2-tuple of response bytes and whether
+    to close the connection afterwards.
+    """
+
+    def __init__(self, loop, handler):
+        self.handler = handler
+        self.requests = []
+        self.connection_count = 0
+        self._server = loop.run_until_complete(loop.create_server(lambda: StandInServerProtocol(self),
+                                                                  "127.0.0.1", 0))
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def close(self):
+        self._server.close()
+
+
+class AsyncTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+        set_event_loop(self.loop)
+        self.server = None
+
+    def tearDown(self):
+        if self.server:
+            self.server.close()
+        self.loop.close()
+        set_event_loop(None)
+
+    def serve(self, handler):
+        self.server = StandInServer(self.loop, handler)
+        return self.server
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+
+class AsyncHTTPTestCase(AsyncTestCase):
+
+    def http(self):
+        return AsyncHTTP("http://127.0.0.1:%d/db/data/" % self.server.port, {"X-Test": "yes"}, False)
+
+    def test_can_read_content_length_response(self):
+        self.serve(lambda method, path, body: (http_response(200, {"hello": "world"}), False))
+        http = self.http()
+        status, headers, data = self.run_async(http.request("POST", "transaction", {"statements": []}))
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["content-length"], str(len(data)))
+        self.assertEqual(json_loads(data.decode("utf-8")), {"hello": "world"})
+        self.assertEqual(self.server.requests, [("POST", "/db/data/transaction", {"statements": []})])
+        http.close()
+
+    def test_can_read_chunked_response(self):
+        body = {"values": list(range(20))}
+        self.serve(lambda method, path, _: (http_response(200, body, framing="chunked"), False))
+        http = self.http()
+        status, headers, data = self.run_async(http.request("GET", "", None))
+        self.assertEqual(status, 200)
+        self.assertEqual(json_loads(data.decode("utf-8")), body)
+        http.close()
+
+    def test_can_read_response_delimited_by_connection_close(self):
+        self.serve(lambda method, path, _: (http_response(200, {"x": 1}, framing="close"), True))
+        http = self.http()
+        _, _, data = self.run_async(http.request("GET", "", None))
+        self.assertEqual(json_loads(data.decode("utf-8")), {"x": 1})
+        _, _, data = self.run_async(http.request("GET", "", None))
+        self.assertEqual(json_loads(data.decode("utf-8")), {"x": 1})
+        self.assertEqual(self.server.connection_count, 2)
+        self.assertFalse(http._idle)
+
+    def test_connection_is_reused(self):
+        self.serve(lambda method, path, _: (http_response(200, {}), False))
+        http = self.http()
+        for _ in range(3):
+            self.run_async(http.request("GET", "", None))
+        self.assertEqual(self.server.connection_count, 1)
+        self.assertEqual(len(http._idle), 1)
+        http.close()
+        self.assertFalse(http._idle)
+
+    def test_connection_close_header_prevents_reuse(self):
+        self.serve(lambda method, path, _: (http_response(200, {}, headers=[("Connection", "close")]), False))
+        http = self.http()
+        self.run_async(http.request("GET", "", None))
+        self.assertFalse(http._idle)
+
+    def test_request_is_retried_when_idle_connection_was_dropped(self):
+        # The server drops each connection after one response, without
+        # saying so, as it might after a keep-alive timeout
+        self.serve(lambda method, path, _: (http_response(200, {"n": len(self.server.requests)}), True))
+        http = self.http()
+        _, _, data = self.run_async(http.request("GET", "", None))
+        self.assertEqual(json_loads(data.decode("utf-8")), {"n": 1})
+        _, _, data = self.run_async(http.request("GET", "", None))
+        self.assertEqual(json_loads(data.decode("utf-8")), {"n": 2})
+        self.assertEqual(self.server.connection_count, 2)
+        http.close()
+
+    def test_request_on_new_connection_is_not_retried(self):
+        self.serve(lambda method, path, _: (None, True))
+        http = self.http()
+        with self.assertRaises(ConnectionError):
+            self.run_async(http.request("GET", "", None))
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_post_decodes_json(self):
+        self.serve(lambda method, path, _: (http_response(201, {"a": [1, 2]}, headers=[("Location", "x")]), False))
+        http = self.http()
+        status, headers, content = self.run_async(http.post("transaction", {}, expected=(201,)))
+        self.assertEqual(status, 201)
+        self.assertEqual(headers["location"], "x")
+        self.assertEqual(content, {"a": [1, 2]})
+        http.close()
+
+    def test_unexpected_status_raises_graph_error(self):
+        self.serve(lambda method, path, _: (http_response(400, {"message": "Oops", "exception": "BadThing"}), False))
+        http = self.http()
+        with self.assertRaises(GraphError) as context:
+            self.run_async(http.post("transaction", {}, expected=(200,)))
+        self.assertEqual(context.exception.args[0], "Oops")
+        self.assertEqual(context.exception.http_status_code, 400)
+        http.close()
+
+    def test_unauthorized_raises_auth_error(self):
+        self.serve(lambda method, path, _: (http_response(401), False))
+        http = self.http()
+        with self.assertRaises(AuthError):
+            self.run_async(http.delete("transaction/1", expected=(200,)))
+        http.close()
+
+
+class StandInTransactionalEndpoint(object):
+    """ Imitation of the transactional HTTP endpoint. Each statement is
+    answered by the `results` function, which returns a dictionary
+    holding "columns" and "data" (in row format, with meta and graph
+    entries) or, for a failed statement, "error".
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.next_transaction = 1
+
+    def __call__(self, method, path, body):
+        path = path[len("/db/data/"):]
+        if method == "DELETE":
+            return http_response(200, {"results": [], "errors": []}), False
+        headers = []
+        status = 200
+        if path == "transaction":
+            status = 201
+            headers.append(("Location", "http://127.0.0.1/db/data/transaction/%d" % self.next_transaction))
+            self.next_transaction += 1
+        results = []
+        errors = []
+        for statement in body["statements"]:
+            result = self.results(statement["statement"], statement["parameters"])
+            if "error" in result:
+                errors.append(result["error"])
+                break
+            result.setdefault("stats", {"nodes_created": 0, "contains_updates": False})
+            results.append(result)
+        return http_response(status, {"results": results, "errors": errors}, headers=headers), False
+
+
+def node_row(identity, labels, properties):
+    return {
+        "row": [properties],
+        "meta": [{"id": identity, "type": "node", "deleted": False}],
+        "graph": {
+            "nodes": [{"id": str(identity), "labels": labels, "properties": properties}],
+            "relationships": [],
+        },
+    }
+
+
+def value_row(*values):
+    return {"row": list(values), "meta": [None] * len(values), "graph": {"nodes": [], "relationships": []}}
+
+
+class AsyncTransactionTestCase(AsyncTestCase):
+
+    def setUp(self):
+        super(AsyncTransactionTestCase, self).setUp()
+        self.statements = []
+        self.endpoint = StandInTransactionalEndpoint(self.result)
+        self.serve(self.endpoint)
+        self.graph = AsyncGraph("http://127.0.0.1:%d" % self.server.port)
+
+    def tearDown(self):
+        self.graph.close()
+        super(AsyncTransactionTestCase, self).tearDown()
+
+    def result(self, statement, parameters):
+        self.statements.append(statement)
+        if statement.startswith("RETURN"):
+            return {"columns": ["x"], "data": [value_row(parameters.get("x", 1))]}
+        elif statement == "FAIL":
+            return {"error": {"code": "Neo.ClientError.Statement.ArithmeticError", "message": "/ by zero"}}
+        else:
+            return {"columns": ["n"], "data": []}
+
+    def paths(self):
+        return [(method, path) for method, path, _ in self.server.requests]
+
+    def test_autocommit_run_is_sent_straight_away(self):
+        cursor = self.run_async(self.graph.run("RETURN $x AS x", x=42))
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction/commit")])
+        _, _, body = self.server.requests[0]
+        statement, = body["statements"]
+        self.assertEqual(statement["resultDataContents"], ["row", "graph", "rest"])
+        self.assertEqual(statement["parameters"], {"x": 42})
+        self.assertEqual(cursor.keys(), ["x"])
+        self.assertEqual(self.run_async(cursor.evaluate()), 42)
+
+    def test_autocommit_transaction_finishes_after_run(self):
+        tx = self.graph.begin(autocommit=True)
+        self.run_async(tx.run("RETURN 1"))
+        self.assertTrue(tx.finished())
+        with self.assertRaises(TransactionFinished):
+            self.run_async(tx.run("RETURN 1"))
+
+    def test_statements_are_queued_until_results_are_needed(self):
+        tx = self.graph.begin()
+        c1 = self.run_async(tx.run("RETURN 1 AS x"))
+        c2 = self.run_async(tx.run("RETURN 2 AS x", x=2))
+        self.assertEqual(self.server.requests, [])
+        self.assertIsNone(c1.keys())
+        self.assertEqual(self.run_async(c2.evaluate()), 2)
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction")])
+        self.assertEqual(len(self.server.requests[0][2]["statements"]), 2)
+        self.assertEqual(c1.keys(), ["x"])
+        self.assertEqual(self.run_async(c1.evaluate()), 1)
+        self.run_async(tx.commit())
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction"),
+                                        ("POST", "/db/data/transaction/1/commit")])
+        self.assertEqual(self.server.requests[1][2], {"statements": []})
+
+    def test_statements_unread_before_commit_are_sent_with_it(self):
+        tx = self.graph.begin()
+        self.run_async(tx.run("CREATE (a)"))
+        cursor = self.run_async(tx.run("RETURN 1 AS x"))
+        self.run_async(tx.commit())
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction/commit")])
+        self.assertEqual(len(self.server.requests[0][2]["statements"]), 2)
+        self.assertEqual(self.run_async(cursor.evaluate()), 1)
+
+    def test_statements_queued_after_transaction_opened_are_sent_with_commit(self):
+        tx = self.graph.begin()
+        self.run_async(self.run_async(tx.run("RETURN 1 AS x")).forward())
+        self.run_async(tx.run("CREATE (a)"))
+        self.run_async(tx.commit())
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction"),
+                                        ("POST", "/db/data/transaction/1/commit")])
+        self.assertEqual(len(self.server.requests[1][2]["statements"]), 1)
+
+    def test_empty_transaction_sends_nothing(self):
+        tx = self.graph.begin()
+        self.run_async(tx.commit())
+        self.assertEqual(self.server.requests, [])
+
+    def test_rollback_of_unopened_transaction_sends_nothing(self):
+        tx = self.graph.begin()
+        cursor = self.run_async(tx.run("RETURN 1 AS x"))
+        self.run_async(tx.rollback())
+        self.assertEqual(self.server.requests, [])
+        self.assertIsNone(self.run_async(cursor.evaluate()))
+
+    def test_rollback_of_opened_transaction(self):
+        tx = self.graph.begin()
+        self.run_async(self.run_async(tx.run("RETURN 1 AS x")).forward())
+        self.run_async(tx.run("CREATE (a)"))
+        self.run_async(tx.rollback())
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction"),
+                                        ("DELETE", "/db/data/transaction/1")])
+        self.assertEqual(self.statements, ["RETURN 1 AS x"])
+
+    # The context manager protocol is driven by hand, as "async with"
+    # cannot be parsed by the older Pythons that collect this module.
+
+    def test_context_manager_commits(self):
+        tx = self.run_async(self.graph.begin().__aenter__())
+        self.run_async(tx.run("CREATE (a)"))
+        self.run_async(tx.__aexit__(None, None, None))
+        self.assertTrue(tx.finished())
+        self.assertEqual(self.paths(), [("POST", "/db/data/transaction/commit")])
+
+    def test_context_manager_rolls_back_on_error(self):
+        tx = self.run_async(self.graph.begin().__aenter__())
+        self.run_async(tx.run("CREATE (a)"))
+        error = ValueError()
+        self.assertFalse(self.run_async(tx.__aexit__(ValueError, error, None)))
+        self.assertTrue(tx.finished())
+        self.assertEqual(self.server.requests, [])
+
+    def test_error_is_raised_by_reading_and_later_results_are_empty(self):
+        tx = self.graph.begin()
+        c1 = self.run_async(tx.run("FAIL"))
+        c2 = self.run_async(tx.run("RETURN 1 AS x"))
+        with self.assertRaises(GraphError) as context:
+            self.run_async(c1.forward())
+        self.assertEqual(context.exception.code, "Neo.ClientError.Statement.ArithmeticError")
+        self.assertIsNone(self.run_async(c2.evaluate()))
+
+    def test_stats(self):
+        cursor = self.run_async(self.graph.run("CREATE (a)"))
+        stats = self.run_async(cursor.stats())
+        self.assertEqual(stats["nodes_created"], 0)
+        self.assertFalse(stats["contains_updates"])
+
+
+class AsyncEntityTestCase(AsyncTestCase):
+
+    def setUp(self):
+        super(AsyncEntityTestCase, self).setUp()
+        self.next_id = 100
+        self.people = {1: {"name": "Alice"}, 2: {"name": "Bob"}}
+        self.serve(StandInTransactionalEndpoint(self.result))
+        self.graph = AsyncGraph("http://127.0.0.1:%d" % self.server.port)
+        self.graph.node_cache.clear()
+        self.graph.relationship_cache.clear()
+
+    def tearDown(self):
+        self.graph.close()
+        super(AsyncEntityTestCase, self).tearDown()
+
+    def new_ids(self, parameters):
+        ids = list(range(self.next_id, self.next_id + len(parameters["x"])))
+        self.next_id += len(ids)
+        return {"columns": ["id(_)"], "data": [value_row(identity) for identity in ids]}
+
+    def result(self, statement, parameters):
+        if statement.startswith("UNWIND"):
+            return self.new_ids(parameters)
+        elif "count(_)" in statement:
+            return {"columns": ["count(_)"], "data": [value_row(len(self.people))]}
+        elif "MATCH" in statement:
+            rows = [node_row(identity, ["Person"], properties) for identity, properties in sorted(self.people.items())
+                    if "id(_) = 2" not in statement or identity == 2]
+            return {"columns": ["_"], "data": rows}
+        raise AssertionError("Unexpected statement %r" % statement)
+
+    def test_create_binds_nodes_and_relationships(self):
+        alice = Node("Person", name="Alice")
+        bob = Node("Person", name="Bob")
+        knows = Relationship(alice, "KNOWS", bob, since=1999)
+        self.run_async(self.graph.create(alice | bob | knows))
+        graph = self.graph.graph
+        for entity in (alice, bob, knows):
+            self.assertIs(entity.graph, graph)
+            self.assertFalse(entity.dirty_keys())
+        self.assertEqual({alice.identity, bob.identity}, {100, 101})
+        self.assertEqual(knows.identity, 102)
+        self.assertEqual(alice._remote_labels, frozenset({"Person"}))
+        self.assertIs(graph.node_cache[alice.identity], alice)
+        self.assertIs(graph.relationship_cache[knows.identity], knows)
+        self.assertEqual([path for _, path, _ in self.server.requests],
+                         ["/db/data/transaction", "/db/data/transaction/1", "/db/data/transaction/1/commit"])
+
+    def test_merge_binds_nodes(self):
+        alice = Node("Person", name="Alice")
+        self.run_async(self.graph.merge(alice, "Person", "name"))
+        self.assertEqual(alice.identity, 100)
+        self.assertFalse(alice.dirty_keys())
+        self.assertIs(self.graph.node_cache[100], alice)
+
+    def test_merge_requires_primary_label_and_key(self):
+        with self.assertRaises(ValueError):
+            self.run_async(self.graph.merge(Node("Person", name="Alice")))
+
+    def test_match_first(self):
+        node = self.run_async(self.graph.nodes.match("Person").first())
+        self.assertEqual(node.identity, 1)
+        self.assertEqual(dict(node), {"name": "Alice"})
+        self.assertTrue(node.has_label("Person"))
+
+    def test_match_count(self):
+        self.assertEqual(self.run_async(self.graph.nodes.match("Person").count()), 2)
+
+    def test_match_iteration(self):
+        iterator = self.graph.nodes.match("Person").__aiter__()
+        nodes = [self.run_async(iterator.__anext__()), self.run_async(iterator.__anext__())]
+        self.assertEqual([dict(node) for node in nodes], [{"name": "Alice"}, {"name": "Bob"}])
+        with self.assertRaises(StopAsyncIteration):
+            self.run_async(iterator.__anext__())
+
+    def test_match_cannot_be_iterated_synchronously(self):
+        match = self.graph.nodes.match("Person")
+        with self.assertRaises(TypeError):
+            iter(match)
+        with self.assertRaises(TypeError):
+            len(match)
+
+    def test_get_by_identity(self):
+        node = self.run_async(self.graph.nodes.get(2))
+        self.assertEqual(dict(node), {"name": "Bob"})
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_get_from_cache(self):
+        node = self.run_async(self.graph.nodes.get(2))
+        self.assertIs(self.run_async(self.graph.nodes.get(2)), node)
+        self.assertEqual(len(self.server.requests), 1)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from json import loads as json_loads
+from os.path import join as path_join
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import SkipTest, TestCase
+
+try:
+    import pyarrow
+    from pyarrow.parquet import ParquetFile, read_table
+except ImportError:
+    raise SkipTest("Pyarrow is not installed")
+
+from py2neo.data import Node, Path, Relationship, Table
+from py2neo.database import Cursor
+
+from test.fixtures.stand_ins import StandInResult
+
+
+def node(identity, *labels, **properties):
+    n = Node(*labels, **properties)
+    n.identity = identity
+    return n
+
+
+def relationship(identity, start_node, type_, end_node, **properties):
+    r = Relationship(start_node, type_, end_node, **properties)
+    r.identity = identity
+    return r
+
+
+def batch_data(batches):
+    data = {}
+    for batch in batches:
+        for key, values in batch.to_pydict().items():
+            data.setdefault(key, []).extend(values)
+    return data
+
+
+class ArrowTestCase(TestCase):
+
+    def to_arrow(self, values, keys=("a",), batch_size=1):
+        batches = list(Table(values, keys=list(keys)).to_arrow(batch_size=batch_size))
+        schemas = set(batch.schema for batch in batches)
+        self.assertEqual(len(schemas), 1)
+        return batches
+
+    def test_scalar_columns(self):
+        batches = self.to_arrow([[1, "x"], [None, "y"], [3, None]], keys=["n", "s"])
+        self.assertEqual(batches[0].schema, pyarrow.schema([("n", pyarrow.int64()), ("s", pyarrow.string())]))
+        self.assertEqual(batch_data(batches), {"n": [1, None, 3], "s": ["x", "y", None]})
+
+    def test_node_column_is_flattened(self):
+        batches = self.to_arrow([[node(1, "Person", "Employee", name="Alice")], [None]])
+        self.assertEqual(batches[0].schema.names, ["a.id", "a.labels", "a.properties"])
+        data = batch_data(batches)
+        self.assertEqual(data["a.id"], [1, None])
+        self.assertEqual(data["a.labels"], [["Employee", "Person"], None])
+        self.assertEqual(json_loads(data["a.properties"][0]), {"name": "Alice"})
+        self.assertIsNone(data["a.properties"][1])
+
+    def test_relationship_column_is_flattened(self):
+        alice = node(1, name="Alice")
+        bob = node(2, name="Bob")
+        batches = self.to_arrow([[relationship(7, alice, "KNOWS", bob, since=1999)]])
+        self.assertEqual(batch_data(batches), {"a.id": [7], "a.type": ["KNOWS"], "a.start": [1], "a.end": [2],
+                                               "a.properties": ['{"since":1999}']})
+
+    def test_path_column_is_flattened(self):
+        alice = node(1)
+        bob = node(2)
+        carol = node(3)
+        path = Path(alice, relationship(7, alice, "KNOWS", bob), bob, relationship(8, carol, "KNOWS", bob), carol)
+        batches = self.to_arrow([[path]])
+        self.assertEqual(batch_data(batches), {"a.nodes": [[1, 2, 3]], "a.relationships": [[7, 8]]})
+
+    def test_property_keys_missing_from_first_batch_are_kept(self):
+        batches = self.to_arrow([[node(1, name="Alice")], [node(2, name="Bob", age=33)]])
+        properties = [json_loads(p) for p in batch_data(batches)["a.properties"]]
+        self.assertEqual(properties, [{"name": "Alice"}, {"name": "Bob", "age": 33}])
+
+    def test_properties_are_kept_after_first_batch_without_any(self):
+        batches = self.to_arrow([[node(1)], [node(2, name="Bob")]])
+        self.assertEqual(batch_data(batches)["a.properties"], ['{}', '{"name":"Bob"}'])
+
+    def test_property_types_can_vary_between_rows(self):
+        values = [[node(1, x=1)], [node(2, x="one")], [node(3, x=[1.5])], [node(4, x=True)]]
+        for batch_size in (1, 4):
+            batches = self.to_arrow(values, batch_size=batch_size)
+            properties = [json_loads(p)["x"] for p in batch_data(batches)["a.properties"]]
+            self.assertEqual(properties, [1, "one", [1.5], True])
+
+    def test_mixed_scalar_types_are_kept_as_json(self):
+        batches = self.to_arrow([[1], ["a"], [None]], batch_size=3)
+        self.assertEqual(batches[0].schema, pyarrow.schema([("a", pyarrow.string())]))
+        self.assertEqual(batch_data(batches)["a"], ["1", '"a"', None])
+
+    def test_integers_beyond_64_bits_are_kept_as_json(self):
+        batches = self.to_arrow([[2 ** 64], [1]], batch_size=2)
+        self.assertEqual([json_loads(v) for v in batch_data(batches)["a"]], [2 ** 64, 1])
+
+    def test_map_keys_can_vary_between_rows(self):
+        for batch_size in (1, 2):
+            batches = self.to_arrow([[{"a": 1}], [{"b": 2}]], batch_size=batch_size)
+            self.assertEqual([json_loads(v) for v in batch_data(batches)["a"]], [{"a": 1}, {"b": 2}])
+
+    def test_list_element_types_can_vary_between_rows(self):
+        batches = self.to_arrow([[[1, 2]], [["x", None]]])
+        self.assertEqual([json_loads(v) for v in batch_data(batches)["a"]], [[1, 2], ["x", None]])
+
+    def test_entities_after_first_batch_of_nulls_are_kept_as_json(self):
+        alice = node(1, "Person", name="Alice")
+        batches = self.to_arrow([[None], [alice], [[alice, 2]]])
+        self.assertEqual(batches[0].schema, pyarrow.schema([("a", pyarrow.string())]))
+        data = batch_data(batches)["a"]
+        self.assertIsNone(data[0])
+        self.assertEqual(json_loads(data[1]), {"id": 1, "labels": ["Person"], "properties": {"name": "Alice"}})
+        self.assertEqual(json_loads(data[2]), [{"id": 1, "labels": ["Person"], "properties": {"name": "Alice"}}, 2])
+
+    def test_labels_are_kept_after_first_batch_without_any(self):
+        batches = self.to_arrow([[node(1)], [node(2, "Person")]])
+        self.assertEqual(batch_data(batches)["a.labels"], [[], ["Person"]])
+
+    def test_batch_size(self):
+        batches = self.to_arrow([[i] for i in range(5)], batch_size=2)
+        self.assertEqual([batch.num_rows for batch in batches], [2, 2, 1])
+        self.assertEqual(batch_data(batches), {"a": [0, 1, 2, 3, 4]})
+
+    def test_explicit_schema_decides_layout(self):
+        schema = pyarrow.schema([("a.id", pyarrow.int64()), ("a.labels", pyarrow.list_(pyarrow.string())),
+                                 ("a.properties", pyarrow.string())])
+        batches = list(Table([[None], [node(1, "Person")]], keys=["a"]).to_arrow(batch_size=1, schema=schema))
+        self.assertTrue(all(batch.schema == schema for batch in batches))
+        self.assertEqual(batch_data(batches)["a.id"], [None, 1])
+
+    def test_cursor_to_arrow(self):
+        cursor = Cursor(StandInResult(["a", "n"], [[node(1, "Person", name="Alice"), 1], [None, 2]]))
+        batches = list(cursor.to_arrow(batch_size=1))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batch_data(batches)["n"], [1, 2])
+        self.assertEqual(batch_data(batches)["a.id"], [1, None])
+
+
+class ParquetTestCase(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = path_join(self.directory, "test.parquet")
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_round_trip(self):
+        alice = node(1, "Person", name="Alice")
+        bob = node(2, "Person", name="Bob", age=33)
+        values = [[alice, relationship(7, alice, "KNOWS", bob), 1.5], [bob, None, None], [None, None, 3.5]]
+        cursor = Cursor(StandInResult(["a", "r", "x"], values))
+        count = cursor.write_parquet(self.path, batch_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual(ParquetFile(self.path).num_row_groups, 2)
+        data = read_table(self.path).to_pydict()
+        self.assertEqual(data["a.id"], [1, 2, None])
+        self.assertEqual([json_loads(p) if p else None for p in data["a.properties"]],
+                         [{"name": "Alice"}, {"name": "Bob", "age": 33}, None])
+        self.assertEqual(data["r.type"], ["KNOWS", None, None])
+        self.assertEqual(data["x"], [1.5, None, 3.5])
+
+    def test_round_trip_matches_arrow_batches(self):
+        values = [[None, 1], [node(1, "Person"), 2], [node(2, name="Bob"), 3]]
+        table = Table(values, keys=["a", "n"])
+        table.write_parquet(self.path, batch_size=1)
+        expected = pyarrow.Table.from_batches(list(table.to_arrow(batch_size=1)))
+        self.assertTrue(read_table(self.path).equals(expected))
+        self.assertEqual(ParquetFile(self.path).num_row_groups, 3)
+
+    def test_empty_result(self):
+        cursor = Cursor(StandInResult(["a", "b"], []))
+        count = cursor.write_parquet(self.path)
+        self.assertEqual(count, 0)
+        table = read_table(self.path)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["a", "b"])
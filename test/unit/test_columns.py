@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from array import array
+from unittest import TestCase
+
+from py2neo.internal.columns import Column, ColumnSet
+
+
+class ColumnTestCase(TestCase):
+
+    def test_empty_column(self):
+        column = Column()
+        assert len(column) == 0
+        assert not column.is_typed()
+        assert column.values() == []
+
+    def test_integer_column_is_typed(self):
+        column = Column()
+        for value in [1, 2, 3]:
+            column.append(value)
+        assert column.is_typed()
+        assert isinstance(column.buffer, array)
+        assert column.values() == [1, 2, 3]
+
+    def test_float_column_is_typed(self):
+        column = Column()
+        for value in [1.5, 2, 3.5]:
+            column.append(value)
+        assert column.is_typed()
+        assert column.buffer.typecode == "d"
+        assert column.values() == [1.5, 2.0, 3.5]
+
+    def test_integer_column_widens_to_float(self):
+        column = Column()
+        for value in [1, 2, 3.5]:
+            column.append(value)
+        assert column.is_typed()
+        assert column.buffer.typecode == "d"
+        assert column.values() == [1.0, 2.0, 3.5]
+
+    def test_null_downgrades_to_list(self):
+        column = Column()
+        for value in [1, None, 3]:
+            column.append(value)
+        assert not column.is_typed()
+        assert column.values() == [1, None, 3]
+
+    def test_boolean_column_is_not_typed(self):
+        column = Column()
+        for value in [True, 1]:
+            column.append(value)
+        assert not column.is_typed()
+        assert column.values() == [True, 1]
+
+    def test_boolean_downgrades_float_column(self):
+        column = Column()
+        for value in [1.0, True]:
+            column.append(value)
+        assert not column.is_typed()
+        assert column.values() == [1.0, True]
+
+    def test_string_column_is_not_typed(self):
+        column = Column()
+        for value in [u"a", u"b"]:
+            column.append(value)
+        assert not column.is_typed()
+        assert column.values() == [u"a", u"b"]
+
+    def test_integer_overflow_downgrades_to_list(self):
+        column = Column()
+        for value in [1, 2 ** 80]:
+            column.append(value)
+        assert not column.is_typed()
+        assert column.values() == [1, 2 ** 80]
+
+
+class ColumnSetTestCase(TestCase):
+
+    def test_append_rows(self):
+        columns = ColumnSet(["a", "b"])
+        columns.append((1, u"x"))
+        columns.append((2, u"y"))
+        assert len(columns) == 2
+        assert columns.columns[0].is_typed()
+        assert columns.columns[0].values() == [1, 2]
+        assert columns.columns[1].values() == [u"x", u"y"]
+
+    def test_extend(self):
+        columns = ColumnSet(["a"])
+        columns.extend([(1,), (2,), (3,)])
+        assert len(columns) == 3
+        assert columns.columns[0].values() == [1, 2, 3]
@@ -20,7 +20,10 @@ from io import StringIO
 from unittest import TestCase
 
 from py2neo.console import Console
+from py2neo.data import Table
+from py2neo.database import Cursor
 from py2neo.meta import __version__
+from py2neo.storage import Record
 
 
 class CapturedConsole(Console):
@@ -38,6 +41,44 @@ class CapturedConsole(Console):
         return self.scripted_input.pop(0)
 
 
+class OfflineConsole(CapturedConsole):
+    """ Console that writes results without connecting to a server.
+    """
+
+    def __init__(self):
+        self.output_file = StringIO()
+        self.result_writer = Table.write
+        self.captured_output = []
+        self.scripted_input = []
+
+
+class InterruptedResult(object):
+    """ Result of 120 records, of which only the first 60 can be
+    fetched before the user presses Ctrl-C.
+    """
+
+    def __init__(self, close_interrupted=False):
+        self.close_interrupted = close_interrupted
+        self.fetch_count = 0
+        self.closed = False
+
+    def keys(self):
+        return ["x"]
+
+    def fetch(self):
+        self.fetch_count += 1
+        if self.fetch_count == 61:
+            raise KeyboardInterrupt()
+        if self.fetch_count > 120:
+            return None
+        return Record(zip(["x"], [self.fetch_count]))
+
+    def close(self):
+        self.closed = True
+        if self.close_interrupted:
+            raise KeyboardInterrupt()
+
+
 class ConsoleTestCase(TestCase):
 
     def assertPrologue(self, console):
@@ -67,3 +108,40 @@ class ConsoleTestCase(TestCase):
         self.assertEqual(console.captured_output.pop(0), "\r\n")
         self.assertTrue(console.captured_output.pop(0).startswith("(1 record from "))
         self.assertFalse(console.captured_output)
+
+    def test_can_run_query_with_several_pages(self):
+        console = CapturedConsole()
+        console.scripted_input = ["UNWIND range(1, 120) AS x RETURN x\n", "/x\n"]
+        with self.assertRaises(SystemExit):
+            console.loop()
+        self.assertPrologue(console)
+        output = console.output_file.getvalue()
+        self.assertEqual(output.count(u"-----\r\n"), 3)
+        self.assertTrue(output.startswith(u"   x \r\n-----\r\n   1 \r\n"))
+        self.assertTrue(output.endswith(u" 120 \r\n"))
+        for _ in range(3):
+            self.assertEqual(console.captured_output.pop(0), "\r\n")
+        self.assertTrue(console.captured_output.pop(0).startswith("(120 records from "))
+        self.assertFalse(console.captured_output)
+
+
+class WriteResultTestCase(TestCase):
+
+    def test_interrupt_discards_remaining_records(self):
+        console = OfflineConsole()
+        result = InterruptedResult()
+        record_count = console.write_result(Cursor(result), page_size=50)
+        self.assertEqual(record_count, 50)
+        self.assertEqual(result.fetch_count, 61)
+        self.assertTrue(result.closed)
+        self.assertEqual(console.captured_output.pop(0), "\r\n")
+        self.assertEqual(console.captured_output.pop(0), "Interrupted; discarding remaining records")
+        self.assertFalse(console.captured_output)
+
+    def test_interrupt_while_discarding_is_ignored(self):
+        console = OfflineConsole()
+        result = InterruptedResult(close_interrupted=True)
+        record_count = console.write_result(Cursor(result), page_size=50)
+        self.assertEqual(record_count, 50)
+        self.assertEqual(result.fetch_count, 61)
+        self.assertTrue(result.closed)
@@ -19,7 +19,8 @@
 from io import StringIO
 from unittest import TestCase
 
-from py2neo.data import Table, Subgraph, Walkable, Node, Relationship, PropertyDict, Path, walk, order, size
+from py2neo.data import Table, Subgraph, Walkable, Node, Relationship, PropertyDict, Path, walk, order, size, \
+    LiteNode, LiteRelationship
 
 
 KNOWS = Relationship.type("KNOWS")
@@ -162,6 +163,41 @@ class DataListTestCase(TestCase):
                               u' Carol |  55 \r\n'
                               u' Dave  |  66 \r\n')
 
+    def test_field_metadata_is_computed_on_demand(self):
+        table = Table([
+            ["Alice", 33],
+            ["Bob", None],
+        ], keys=["name", "age"])
+        self.assertEqual(table._fields, [None, None])
+        age_field = table.field("age")
+        self.assertEqual(age_field["optional"], True)
+        self.assertEqual(table._fields, [None, age_field])
+
+    def test_repr_of_long_table(self):
+        table = Table([[i] for i in range(10)], keys=["n"])
+        table.repr_rows = 4
+        out = repr(table)
+        self.assertEqual(out, u'   n \r\n'
+                              u'-----\r\n'
+                              u'   0 \r\n'
+                              u'   1 \r\n'
+                              u' ... \r\n'
+                              u'   8 \r\n'
+                              u'   9 \r\n'
+                              u'(10 rows)\r\n')
+
+    def test_repr_html_of_long_table(self):
+        table = Table([[i] for i in range(10)], keys=["n"])
+        table.repr_rows = 2
+        out = table._repr_html_()
+        self.assertEqual(out, u'<table>'
+                              u'<tr><th style="text-align:right">n</th></tr>'
+                              u'<tr><td style="text-align:right">0</td></tr>'
+                              u'<tr><td style="text-align:right">...</td></tr>'
+                              u'<tr><td style="text-align:right">9</td></tr>'
+                              u'</table>'
+                              u'<p>10 rows</p>')
+
     def test_write(self):
         table = Table([
             ["Alice", 33],
@@ -912,6 +948,107 @@ class RelationshipTestCase(TestCase):
         assert alice_knows_bob != Foo()
 
 
+class DirtyTrackingTestCase(TestCase):
+
+    def test_new_node_properties_are_dirty(self):
+        a = Node(name="Alice", age=33)
+        assert a.dirty_keys() == {"name", "age"}
+
+    def test_setting_property_marks_key_dirty(self):
+        a = Node(name="Alice", age=33)
+        a._dirty.clear()
+        a["age"] = 34
+        assert a.dirty_keys() == {"age"}
+
+    def test_removing_property_marks_key_dirty(self):
+        a = Node(name="Alice", age=33)
+        a._dirty.clear()
+        a["age"] = None
+        del a["name"]
+        assert a.dirty_keys() == {"name", "age"}
+
+    def test_clearing_properties_marks_all_keys_dirty(self):
+        a = Node(name="Alice", age=33)
+        a._dirty.clear()
+        a.clear()
+        assert a.dirty_keys() == {"name", "age"}
+
+    def test_pop_marks_key_dirty(self):
+        a = Node(name="Alice", age=33)
+        a._dirty.clear()
+        assert a.pop("age") == 33
+        assert a.dirty_keys() == {"age"}
+
+    def test_setdefault_marks_only_new_keys_dirty(self):
+        a = Node(name="Alice")
+        a._dirty.clear()
+        a.setdefault("name", "Bob")
+        a.setdefault("age", 33)
+        assert a.dirty_keys() == {"age"}
+
+    def test_relationship_properties_are_tracked(self):
+        r = Relationship(Node(), "KNOWS", Node(), since=1999)
+        r._dirty.clear()
+        r["since"] = 2000
+        assert r.dirty_keys() == {"since"}
+
+
+class RelationshipTypeTestCase(TestCase):
+
+    def test_type_is_reused(self):
+        assert Relationship.type("LIKES") is LIKES
+
+    def test_subclass_is_found(self):
+
+        class DEFINED_HERE(Relationship):
+            pass
+
+        assert Relationship.type("DEFINED_HERE") is DEFINED_HERE
+
+    def test_new_type_is_registered(self):
+        t = Relationship.type("BRAND_NEW")
+        assert t.__name__ == "BRAND_NEW"
+        assert Relationship.type("BRAND_NEW") is t
+
+
+class LiteEntityTestCase(TestCase):
+
+    def test_lite_node(self):
+        a = LiteNode(None, 1, frozenset(["Person"]), {"name": "Alice"})
+        assert a.identity == 1
+        assert a.has_label("Person")
+        assert a["name"] == "Alice"
+        assert a["age"] is None
+        assert dict(a.items()) == {"name": "Alice"}
+        assert len(a) == 1
+        assert "name" in a
+
+    def test_lite_node_has_no_instance_dict(self):
+        a = LiteNode(None, 1)
+        with self.assertRaises(AttributeError):
+            a.foo = "bar"
+
+    def test_lite_node_uuid_is_lazy_and_stable(self):
+        a = LiteNode(None, 1)
+        assert a._uuid is None
+        uuid = a.__uuid__
+        assert a.__uuid__ == uuid
+
+    def test_lite_node_equality(self):
+        assert LiteNode(None, 1) == LiteNode(None, 1)
+        assert LiteNode(None, 1) != LiteNode(None, 2)
+        assert hash(LiteNode(None, 1)) == hash(LiteNode(None, 1))
+
+    def test_lite_relationship(self):
+        a = LiteNode(None, 1)
+        b = LiteNode(None, 2)
+        ab = LiteRelationship(None, 10, "KNOWS", a, b, {"since": 1999})
+        assert ab.type == "KNOWS"
+        assert ab.nodes == (a, b)
+        assert ab["since"] == 1999
+        assert ab != a
+
+
 class RelationshipLoopTestCase(TestCase):
 
     loop = Relationship(alice, "LIKES", alice)
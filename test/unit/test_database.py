@@ -14,3 +14,336 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+
+from collections import deque
+from io import StringIO
+from unittest import TestCase
+
+from neo4j.bolt.response import Response
+from neo4j.v1 import BoltStatementResult
+
+from py2neo.data import Table
+from py2neo.database import Cursor, Graph, Pipeline, Result
+from py2neo.storage import Record
+
+from test.fixtures.stand_ins import StandInResult
+
+
+class CursorWriteTestCase(TestCase):
+
+    keys = ["name", "age"]
+    values = [
+        ["Alice", 33],
+        ["Bob", None],
+        ["Smith, Carol", 55.5],
+        ['Dave "The Rave"', True],
+        ["Line\r\nbreak", [1, 2]],
+    ]
+
+    def cursor(self):
+        return Cursor(StandInResult(self.keys, self.values))
+
+    def table(self):
+        return Table(self.values, keys=self.keys)
+
+    def test_write_csv_matches_table(self):
+        expected = StringIO()
+        self.table().write_csv(expected, header=True)
+        out = StringIO()
+        count = self.cursor().write_csv(out, header=True)
+        assert out.getvalue() == expected.getvalue()
+        assert count == 5
+
+    def test_write_tsv_matches_table(self):
+        expected = StringIO()
+        self.table().write_tsv(expected)
+        out = StringIO()
+        self.cursor().write_tsv(out)
+        assert out.getvalue() == expected.getvalue()
+
+    def test_write_csv_formats_numbers_as_table(self):
+        values = [[0.1, 1.0 / 3], [-0.0, 1e100], [123456789.123456789, 2.5e-08], [2 ** 62, -7],
+                  [float("inf"), float("-inf")]]
+        expected = StringIO()
+        Table(values, keys=["x", "y"]).write_csv(expected)
+        out = StringIO()
+        Cursor(StandInResult(["x", "y"], values)).write_csv(out)
+        assert out.getvalue() == expected.getvalue()
+
+    def test_write_csv_quoting(self):
+        out = StringIO()
+        self.cursor().write_csv(out)
+        self.assertEqual(out.getvalue(), u'Alice,33\r\n'
+                                         u'Bob,\r\n'
+                                         u'"Smith, Carol",55.5\r\n'
+                                         u'"Dave ""The Rave""",true\r\n'
+                                         u'"Line\r\nbreak",[1, 2]\r\n')
+
+    def test_write_csv_with_skip_and_limit(self):
+        out = StringIO()
+        count = self.cursor().write_csv(out, header=True, skip=1, limit=2)
+        self.assertEqual(out.getvalue(), u'name,age\r\n'
+                                         u'Bob,\r\n'
+                                         u'"Smith, Carol",55.5\r\n')
+        assert count == 2
+
+    def test_write_csv_in_small_blocks(self):
+        expected = StringIO()
+        self.table().write_csv(expected)
+        out = StringIO()
+        self.cursor().write_separated_values(u",", out, buffer_size=2)
+        assert out.getvalue() == expected.getvalue()
+
+    def test_write_csv_with_no_records(self):
+        out = StringIO()
+        count = Cursor(StandInResult(self.keys, [])).write_csv(out, header=True)
+        assert out.getvalue() == u""
+        assert count == 0
+
+
+class StandInConnection(object):
+
+    def __init__(self):
+        self.responses = deque([Response(self)])
+        self.reset_count = 0
+        self.closed = False
+
+    def reset(self):
+        self.reset_count += 1
+        self.responses.clear()
+
+    def close(self):
+        self.closed = True
+
+
+class StandInBoltSession(object):
+    """ Session that streams an endless sequence of records, one
+    for each fetch, into the result attached to it.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        self._connection = StandInConnection()
+        self.fetch_count = 0
+
+    def closed(self):
+        return False
+
+    def send(self):
+        pass
+
+    def fetch(self):
+        self.fetch_count += 1
+        self.result._records.append(self.result.zipper(("x",), (self.fetch_count,)))
+        return 1
+
+    def _disconnect(self, sync):
+        assert not sync
+        self._connection = None
+
+
+class StandInBoltResult(BoltStatementResult):
+
+    def __init__(self):
+        self._session = StandInBoltSession(self)
+        self._keys = ("x",)
+        self._records = deque()
+        self._summary = None
+
+
+class StreamedResultTestCase(TestCase):
+
+    def setUp(self):
+        self.finish_count = 0
+        self.bolt_result = StandInBoltResult()
+        self.session = self.bolt_result.session
+        self.connection = self.session._connection
+        self.result = Result(None, {}, self.bolt_result, finish=self.finish, pipelined=True)
+
+    def finish(self):
+        self.finish_count += 1
+
+    def test_records_are_pulled_as_they_are_fetched(self):
+        self.assertEqual(self.result.fetch(), Record(zip(["x"], [1])))
+        self.assertEqual(self.result.fetch(), Record(zip(["x"], [2])))
+        self.assertEqual(self.session.fetch_count, 2)
+        self.assertEqual(self.finish_count, 0)
+
+    def test_close_resets_connection_instead_of_draining(self):
+        self.result.fetch()
+        self.result.close()
+        self.assertEqual(self.session.fetch_count, 1)
+        self.assertEqual(self.connection.reset_count, 1)
+        self.assertFalse(self.connection.closed)
+        self.assertIsNone(self.session._connection)
+        self.assertEqual(self.finish_count, 1)
+
+    def test_no_records_are_fetched_after_close(self):
+        self.result.fetch()
+        self.result.close()
+        self.assertIsNone(self.result.fetch())
+        self.assertEqual(self.session.fetch_count, 1)
+        self.assertEqual(self.finish_count, 1)
+
+    def test_records_in_flight_are_not_hydrated_after_close(self):
+        response = self.connection.responses[0]
+        self.result.close()
+        response.on_records([[1]])
+        response.on_success({})
+        self.assertFalse(self.bolt_result._records)
+
+    def test_close_via_cursor(self):
+        cursor = Cursor(self.result)
+        cursor.forward()
+        cursor.close()
+        self.assertEqual(self.session.fetch_count, 1)
+        self.assertEqual(self.connection.reset_count, 1)
+        self.assertEqual(self.finish_count, 1)
+
+    def test_garbage_collection_closes_connection_without_network_io(self):
+        self.result.fetch()
+        self.result.__del__()
+        self.assertEqual(self.session.fetch_count, 1)
+        self.assertEqual(self.connection.reset_count, 0)
+        self.assertTrue(self.connection.closed)
+        self.assertEqual(self.finish_count, 1)
+
+    def test_close_is_idempotent(self):
+        self.result.close()
+        self.result.close()
+        self.assertEqual(self.connection.reset_count, 1)
+        self.assertEqual(self.finish_count, 1)
+
+    def test_interrupted_reset_closes_connection(self):
+
+        def interrupted_reset():
+            raise KeyboardInterrupt()
+
+        self.connection.reset = interrupted_reset
+        with self.assertRaises(KeyboardInterrupt):
+            self.result.close()
+        self.assertTrue(self.connection.closed)
+        self.assertIsNone(self.session._connection)
+        self.assertEqual(self.finish_count, 1)
+
+
+class StandInPipelinedResult(StandInResult):
+
+    def __init__(self, cypher, parameters, awaited_header):
+        super(StandInPipelinedResult, self).__init__(["cypher", "parameters"], [[cypher, parameters]])
+        self.awaited_header = awaited_header
+
+
+class StandInTransaction(object):
+
+    def __init__(self):
+        self._pipelined = False
+        self.statements = []
+        self.process_count = 0
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.committed = exc_type is None
+
+    def pipeline(self):
+        return Pipeline(self)
+
+    def run(self, cypher, parameters=None, **kwparameters):
+        parameters = dict(parameters or {}, **kwparameters)
+        self.statements.append((cypher, parameters))
+        return Cursor(StandInPipelinedResult(cypher, parameters, awaited_header="entity" in parameters))
+
+    def process(self):
+        self.process_count += 1
+
+
+class StandInGraph(object):
+
+    run_batch = Graph.__dict__["run_batch"]
+
+    def __init__(self):
+        self.transactions = []
+
+    def begin(self):
+        tx = StandInTransaction()
+        self.transactions.append(tx)
+        return tx
+
+
+class PipelineTestCase(TestCase):
+
+    def test_flush_processes_queued_statements_together(self):
+        tx = StandInTransaction()
+        with tx.pipeline() as pipeline:
+            self.assertTrue(tx._pipelined)
+            pipeline.run("RETURN 1")
+            pipeline.run("RETURN 2")
+            pipeline.run("RETURN 3")
+            self.assertEqual(len(pipeline), 3)
+        self.assertFalse(tx._pipelined)
+        self.assertEqual(tx.process_count, 1)
+        self.assertEqual(len(pipeline), 0)
+        self.assertEqual(pipeline.round_trips, 1)
+        self.assertEqual(pipeline.round_trips_saved, 2)
+
+    def test_flush_returns_cursors_for_statements_flushed(self):
+        tx = StandInTransaction()
+        pipeline = tx.pipeline()
+        c1 = pipeline.run("RETURN 1")
+        self.assertEqual(pipeline.flush(), [c1])
+        c2 = pipeline.run("RETURN 2")
+        self.assertEqual(pipeline.flush(), [c2])
+        self.assertEqual(pipeline.flush(), [])
+        self.assertEqual(pipeline.cursors, [c1, c2])
+        self.assertEqual(tx.process_count, 2)
+
+    def test_header_round_trips_are_not_counted_as_saved(self):
+        tx = StandInTransaction()
+        with tx.pipeline() as pipeline:
+            pipeline.run("RETURN 1")
+            pipeline.run("RETURN $entity", entity=1)
+            pipeline.run("RETURN 3")
+        self.assertEqual(pipeline.round_trips, 2)
+        self.assertEqual(pipeline.round_trips_saved, 1)
+
+    def test_round_trips_saved_is_never_negative(self):
+        tx = StandInTransaction()
+        with tx.pipeline() as pipeline:
+            pipeline.run("RETURN $entity", entity=1)
+        self.assertEqual(pipeline.round_trips, 2)
+        self.assertEqual(pipeline.round_trips_saved, 0)
+
+    def test_error_leaves_pipeline_mode_without_flushing(self):
+        tx = StandInTransaction()
+        with self.assertRaises(ValueError):
+            with tx.pipeline() as pipeline:
+                pipeline.run("RETURN 1")
+                raise ValueError()
+        self.assertFalse(tx._pipelined)
+        self.assertEqual(tx.process_count, 0)
+
+
+class RunBatchTestCase(TestCase):
+
+    def test_can_run_strings_and_pairs(self):
+        graph = StandInGraph()
+        cursors = graph.run_batch(["RETURN 1", ("RETURN $x", {"x": 2}), ["RETURN $y", {"y": 3}]])
+        tx, = graph.transactions
+        self.assertEqual(tx.statements, [("RETURN 1", {}), ("RETURN $x", {"x": 2}), ("RETURN $y", {"y": 3})])
+        self.assertEqual(tx.process_count, 1)
+        self.assertTrue(tx.committed)
+        self.assertEqual([cursor.evaluate() for cursor in cursors], ["RETURN 1", "RETURN $x", "RETURN $y"])
+
+    def test_can_run_generator(self):
+        graph = StandInGraph()
+        cursors = graph.run_batch("RETURN %d" % i for i in range(3))
+        self.assertEqual(len(cursors), 3)
+
+    def test_cannot_run_malformed_statement(self):
+        graph = StandInGraph()
+        with self.assertRaises(ValueError):
+            graph.run_batch([("RETURN $x", {"x": 1}, "extra")])
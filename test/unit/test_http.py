@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from gzip import GzipFile
+from io import BytesIO
+from json import dumps as json_dumps, loads as json_loads
+from unittest import TestCase
+
+from neo4j.exceptions import CypherSyntaxError
+from urllib3 import HTTPResponse
+
+from py2neo.internal.http import HTTP, HTTPResultStream, HTTPResultLoader, HTTPSession, \
+    MonitoredHTTPConnectionPool, fix_parameters
+from py2neo.internal.json import ResultDataFormat, StandardJSONCodec
+
+
+class StandInResponse(object):
+
+    def __init__(self, content, chunk_size=7):
+        data = json_dumps(content).encode("utf-8")
+        self.chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        self.released = False
+        self.closed = False
+
+    @property
+    def data(self):
+        return b"".join(self.chunks)
+
+    def stream(self, amt):
+        for chunk in self.chunks:
+            yield chunk
+
+    def release_conn(self):
+        self.released = True
+
+    def close(self):
+        self.closed = True
+
+
+class RecordingResultLoader(HTTPResultLoader):
+
+    def __init__(self):
+        self.events = []
+
+    def load_columns(self, columns):
+        self.events.append(("columns", columns))
+
+    def load_row(self, data):
+        self.events.append(("row", data))
+
+    def load_summary(self, result):
+        self.events.append(("summary", result))
+
+    def fail(self):
+        self.events.append(("fail",))
+
+
+class HTTPResultStreamTestCase(TestCase):
+
+    content = {
+        "results": [
+            {"columns": ["a"], "data": [{"row": [1]}, {"row": [2]}], "stats": {"nodes_created": 0}},
+            {"columns": ["b", "c"], "data": [{"row": ["x", [1, 2]]}], "stats": {"nodes_created": 1}},
+        ],
+        "errors": [],
+    }
+
+    def test_rows_are_passed_to_loaders_one_at_a_time(self):
+        loaders = [RecordingResultLoader(), RecordingResultLoader()]
+        stream = HTTPResultStream(StandInResponse(self.content), loaders)
+        assert stream.advance()
+        self.assertEqual(loaders[0].events, [("columns", ["a"])])
+        assert stream.advance()
+        self.assertEqual(loaders[0].events[-1], ("row", {"row": [1]}))
+        assert stream.advance()
+        self.assertEqual(loaders[0].events[-1], ("row", {"row": [2]}))
+        self.assertEqual(loaders[1].events, [])
+
+    def test_drain_loads_everything(self):
+        loaders = [RecordingResultLoader(), RecordingResultLoader()]
+        response = StandInResponse(self.content)
+        stream = HTTPResultStream(response, loaders)
+        stream.drain()
+        self.assertEqual(loaders[0].events[:4], [
+            ("columns", ["a"]),
+            ("row", {"row": [1]}),
+            ("row", {"row": [2]}),
+            ("summary", {"columns": ["a"], "stats": {"nodes_created": 0}}),
+        ])
+        self.assertEqual(loaders[1].events[:3], [
+            ("columns", ["b", "c"]),
+            ("row", {"row": ["x", [1, 2]]}),
+            ("summary", {"columns": ["b", "c"], "stats": {"nodes_created": 1}}),
+        ])
+        assert stream.closed
+        assert response.released
+        assert not response.closed
+
+    def test_data_before_columns(self):
+        content = {"results": [{"data": [{"row": [1]}], "columns": ["a"], "stats": {}}], "errors": []}
+        loader = RecordingResultLoader()
+        HTTPResultStream(StandInResponse(content), [loader]).drain()
+        self.assertEqual(loader.events[:2], [("columns", ["a"]), ("row", {"row": [1]})])
+
+    def test_errors_are_raised_at_end_of_stream(self):
+        content = {"results": [], "errors": [{"code": "Neo.ClientError.Statement.SyntaxError",
+                                              "message": "Invalid input"}]}
+        loader = RecordingResultLoader()
+        stream = HTTPResultStream(StandInResponse(content), [loader])
+        with self.assertRaises(CypherSyntaxError):
+            stream.drain()
+        self.assertEqual(loader.events, [("fail",)])
+
+    def test_broken_response_is_discarded(self):
+        response = StandInResponse(self.content)
+        response.chunks = response.chunks[:3]
+        loader = RecordingResultLoader()
+        stream = HTTPResultStream(response, [loader])
+        with self.assertRaises(ValueError):
+            stream.drain()
+        assert response.closed
+        self.assertEqual(loader.events[-1], ("fail",))
+
+    def test_discarded_response_frees_pool_slot(self):
+        pool = MonitoredHTTPConnectionPool("localhost", 7474, maxsize=1, block=True)
+        connection = pool._get_conn()
+        response = HTTPResponse(BytesIO(json_dumps(self.content).encode("utf-8")), preload_content=False,
+                                pool=pool, connection=connection)
+        stream = HTTPResultStream(response, [RecordingResultLoader()])
+        assert stream.advance()
+        self.assertEqual(pool.stats()["in_use"], 1)
+        stream.close(discard=True)
+        assert response.closed
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+        self.assertIs(pool._get_conn(timeout=0), connection)
+
+    def test_drain_with_codec_decodes_whole_response(self):
+        loaders = [RecordingResultLoader(), RecordingResultLoader()]
+        response = StandInResponse(self.content)
+        response.stream = None
+        HTTPResultStream(response, loaders, json_codec=StandardJSONCodec()).drain()
+        self.assertEqual(loaders[0].events[:3], [
+            ("columns", ["a"]),
+            ("row", {"row": [1]}),
+            ("row", {"row": [2]}),
+        ])
+        self.assertEqual(loaders[1].events[:2], [
+            ("columns", ["b", "c"]),
+            ("row", {"row": ["x", [1, 2]]}),
+        ])
+        assert response.released
+
+    def test_drain_with_codec_after_streaming_has_started(self):
+        loader = RecordingResultLoader()
+        stream = HTTPResultStream(StandInResponse(self.content), [loader, RecordingResultLoader()],
+                                  json_codec=StandardJSONCodec())
+        stream.advance()
+        stream.drain()
+        self.assertEqual(loader.events[:3], [
+            ("columns", ["a"]),
+            ("row", {"row": [1]}),
+            ("row", {"row": [2]}),
+        ])
+
+
+class FixParametersTestCase(TestCase):
+
+    def test_parameters_are_passed_through(self):
+        parameters = {u"rows": [{u"name": u"Alice", u"age": 33, u"score": 0.5, u"ok": True, u"x": None}]}
+        assert fix_parameters(parameters) is parameters
+
+    def test_no_parameters(self):
+        self.assertEqual(fix_parameters(None), {})
+
+
+class StandInConnectionPool(object):
+
+    pool = None
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, fields=None, headers=None, **urlopen_kw):
+        self.requests.append((method, url, headers, urlopen_kw.get("body")))
+        response = StandInResponse({"results": [], "errors": []})
+        response.status = 200
+        return response
+
+
+class HTTPCompressionTestCase(TestCase):
+
+    def post(self, body, **settings):
+        http = HTTP("http://localhost:7474/db/data/", {}, False, **settings)
+        http._http = pool = StandInConnectionPool()
+        http.post("transaction/commit", body, expected=(200,))
+        _, _, headers, data = pool.requests[0]
+        return headers, data
+
+    def test_unsupported_parameters_are_rejected_while_encoding(self):
+        with self.assertRaises(TypeError) as context:
+            self.post({"statements": [{"statement": "RETURN $x", "parameters": {"x": [object()]}}]})
+        self.assertEqual(str(context.exception), "Parameters of type object are not supported")
+
+    def test_compression_is_off_by_default(self):
+        headers, data = self.post({"statements": []})
+        assert "Accept-Encoding" not in headers
+        assert "Content-Encoding" not in headers
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(json_loads(data.decode("utf-8")), {"statements": []})
+
+    def test_small_request_is_not_compressed(self):
+        headers, data = self.post({"statements": []}, compression=True)
+        self.assertEqual(headers["Accept-Encoding"], "gzip")
+        assert "Content-Encoding" not in headers
+        self.assertEqual(json_loads(data.decode("utf-8")), {"statements": []})
+
+    def test_large_request_is_compressed(self):
+        body = {"statements": [{"statement": "RETURN 1"}] * 1000}
+        headers, data = self.post(body, compression=True)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json_loads(GzipFile(fileobj=BytesIO(data)).read().decode("utf-8")), body)
+
+    def test_threshold_can_be_lowered(self):
+        headers, data = self.post({"statements": []}, compression=True, compression_threshold=0)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+
+
+class ConnectionPoolMonitorTestCase(TestCase):
+
+    def test_counters(self):
+        pool = MonitoredHTTPConnectionPool("localhost", 7474, maxsize=1)
+        first = pool._get_conn()
+        second = pool._get_conn()
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 2)
+        self.assertEqual(stats["peak_in_use"], 2)
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["max_size"], 1)
+        pool._put_conn(first)
+        pool._put_conn(second)
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["acquisitions"], 2)
+        self.assertEqual(stats["discarded"], 1)
+
+    def test_reset(self):
+        pool = MonitoredHTTPConnectionPool("localhost", 7474, maxsize=1)
+        pool._put_conn(pool._get_conn())
+        pool.stats(reset=True)
+        stats = pool.stats()
+        self.assertEqual(stats["acquisitions"], 0)
+        self.assertEqual(stats["created"], 0)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_idle_connection_expires(self):
+        pool = MonitoredHTTPConnectionPool("localhost", 7474, maxsize=1, keep_alive=10.0)
+        conn = pool._get_conn()
+        pool._put_conn(conn)
+        conn.released_at -= 20.0
+        self.assertIs(pool._get_conn(), conn)
+        self.assertEqual(pool.stats()["expired"], 1)
+
+    def test_recent_connection_does_not_expire(self):
+        pool = MonitoredHTTPConnectionPool("localhost", 7474, maxsize=1, keep_alive=10.0)
+        pool._put_conn(pool._get_conn())
+        pool._get_conn()
+        self.assertEqual(pool.stats()["expired"], 0)
+
+    def test_http_settings_are_applied_to_pool(self):
+        http = HTTP("http://localhost:7474/db/data/", {}, False, pool_size=32, pool_block=True,
+                    connect_timeout=2.0, read_timeout=30.0, retries=0)
+        pool = http._http
+        self.assertEqual(pool.pool.maxsize, 32)
+        assert pool.block
+        self.assertEqual(pool.timeout.connect_timeout, 2.0)
+        self.assertEqual(pool.timeout.read_timeout, 30.0)
+        self.assertEqual(http.pool_stats()["max_size"], 32)
+
+
+class StandInHTTP(object):
+
+    json_codec = StandardJSONCodec()
+
+    def __init__(self):
+        self.requests = []
+        self.result_format = ResultDataFormat()
+
+    def post(self, ref, json, expected, preload_content=True):
+        self.requests.append(("POST", ref, len(json["statements"])))
+        response = StandInResponse({
+            "results": [{"columns": ["n"], "data": [{"row": [i], "meta": [None]}], "stats": {}}
+                        for i, _ in enumerate(json["statements"])],
+            "errors": [],
+        })
+        if ref == "transaction":
+            response.status = 201
+            response.headers = {"Location": "http://localhost:7474/db/data/transaction/5"}
+        else:
+            response.status = 200
+        return response
+
+    def delete(self, ref, expected):
+        self.requests.append(("DELETE", ref, 0))
+
+
+class HTTPTransactionTestCase(TestCase):
+
+    def setUp(self):
+        self.http = StandInHTTP()
+        self.session = HTTPSession(None, self.http)
+
+    def test_commit_without_reading_results_sends_one_request(self):
+        tx = self.session.begin_transaction()
+        first = tx.run("RETURN 0 AS n")
+        second = tx.run("RETURN 1 AS n")
+        tx.success = True
+        tx.close()
+        self.assertEqual(self.http.requests, [("POST", "transaction/commit", 2)])
+        self.assertEqual([record[0] for record in first], [0])
+        self.assertEqual([record[0] for record in second], [1])
+        assert not self.session.has_transaction()
+
+    def test_commit_after_reading_results(self):
+        tx = self.session.begin_transaction()
+        first = tx.run("RETURN 0 AS n")
+        self.assertEqual([record[0] for record in first], [0])
+        second = tx.run("RETURN 0 AS n")
+        tx.success = True
+        tx.close()
+        self.assertEqual(self.http.requests, [
+            ("POST", "transaction", 1),
+            ("POST", "transaction/5/commit", 1),
+        ])
+        self.assertEqual([record[0] for record in second], [0])
+        self.assertEqual(self.session.ref, "transaction/commit")
+
+    def test_rollback_without_reading_results_sends_nothing(self):
+        tx = self.session.begin_transaction()
+        result = tx.run("RETURN 0 AS n")
+        tx.success = False
+        tx.close()
+        self.assertEqual(self.http.requests, [])
+        self.assertEqual(list(result), [])
+
+    def test_rollback_after_reading_results(self):
+        tx = self.session.begin_transaction()
+        list(tx.run("RETURN 0 AS n"))
+        tx.run("RETURN 1 AS n")
+        tx.success = False
+        tx.close()
+        self.assertEqual(self.http.requests, [
+            ("POST", "transaction", 1),
+            ("DELETE", "transaction/5", 0),
+        ])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from py2neo.data import Node
+from py2neo.internal.hydration import StaleNodeSet, hydrate_node, hydrate_nodes, hydrate_relationship, \
+    hydrate_relationships
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+class PullingGraph(StandInGraph):
+
+    def __init__(self):
+        super(PullingGraph, self).__init__()
+        self.pulled = []
+
+    def pull(self, subgraph):
+        nodes = list(subgraph.nodes)
+        self.pulled.append(nodes)
+        for node in nodes:
+            hydrate_node(self, node.identity, inst=node, data={"id": node.identity}, metadata={"labels": []})
+
+
+class StaleNodeSetTestCase(TestCase):
+
+    def setUp(self):
+        self.graph = PullingGraph()
+        self.stale_nodes = StaleNodeSet(self.graph)
+
+    def test_endpoints_are_added_as_stale(self):
+        r = hydrate_relationship(self.graph, 1, start=10, end=11, type="KNOWS", data={},
+                                 stale_set=self.stale_nodes)
+        assert len(self.stale_nodes) == 2
+        assert r.start_node._stale_set is self.stale_nodes
+        assert r.end_node._stale_set is self.stale_nodes
+
+    def test_fresh_nodes_are_not_added(self):
+        hydrate_node(self.graph, 10, data={}, metadata={"labels": []}, stale_set=self.stale_nodes)
+        assert len(self.stale_nodes) == 0
+
+    def test_touching_one_node_pulls_all(self):
+        relationships = [hydrate_relationship(self.graph, i, start=10 + i, end=20 + i, type="KNOWS", data={},
+                                              stale_set=self.stale_nodes) for i in range(5)]
+        assert relationships[3].end_node["id"] == 23
+        assert len(self.graph.pulled) == 1
+        assert len(self.graph.pulled[0]) == 10
+        for r in relationships:
+            assert not r.start_node._stale
+            assert not r.end_node._stale
+            assert r.start_node._stale_set is None
+        assert len(self.stale_nodes) == 0
+
+    def test_explicit_pull(self):
+        for i in range(3):
+            hydrate_node(self.graph, i, stale_set=self.stale_nodes)
+        assert self.stale_nodes.pull() == 3
+        assert self.stale_nodes.pull() == 0
+        assert len(self.graph.pulled) == 1
+
+    def test_unbound_node_is_pulled_alone(self):
+        a = Node()
+        a.graph = self.graph
+        a.identity = 99
+        a._stale.add("properties")
+        assert a["id"] == 99
+        assert self.graph.pulled == [[a]]
+
+
+class BulkHydrationTestCase(TestCase):
+
+    def setUp(self):
+        self.graph = PullingGraph()
+        self.stale_nodes = StaleNodeSet(self.graph)
+
+    def test_can_hydrate_nodes(self):
+        nodes = hydrate_nodes(self.graph, [(1, ["Person"], {"name": "Alice"}),
+                                           (2, ["Person", "Employee"], {"name": "Bob"})])
+        assert [node.identity for node in nodes] == [1, 2]
+        assert set(nodes[0].labels) == {"Person"}
+        assert set(nodes[1].labels) == {"Person", "Employee"}
+        assert dict(nodes[1]) == {"name": "Bob"}
+        assert not nodes[0]._stale
+        assert not nodes[0]._dirty
+
+    def test_nodes_come_from_cache(self):
+        a = hydrate_node(self.graph, 1, data={"name": "Alice"}, metadata={"labels": ["Person"]})
+        nodes = hydrate_nodes(self.graph, [(1, ["Person"], {"name": "Alicia"}), (1, None, None)])
+        assert nodes[0] is a
+        assert nodes[1] is a
+        assert a["name"] == "Alicia"
+        stats = self.graph.node_cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_missing_node_data_is_stale(self):
+        nodes = hydrate_nodes(self.graph, [(1, None, {"name": "Alice"}), (2, None, None)],
+                              stale_set=self.stale_nodes)
+        assert nodes[0]._stale == {"labels"}
+        assert nodes[1]._stale == {"labels", "properties"}
+        assert len(self.stale_nodes) == 2
+
+    def test_can_hydrate_relationships(self):
+        relationships = hydrate_relationships(self.graph, [(7, 1, 2, "KNOWS", {"since": 1999}),
+                                                           (8, 2, 1, "LIKES", {})],
+                                              stale_set=self.stale_nodes)
+        knows, likes = relationships
+        assert type(knows).__name__ == "KNOWS"
+        assert knows.identity == 7
+        assert knows["since"] == 1999
+        assert knows.start_node is likes.end_node
+        assert knows.end_node is likes.start_node
+        assert knows.start_node is hydrate_node(self.graph, 1)
+        assert len(self.stale_nodes) == 2
+
+    def test_endpoints_are_hydrated_in_one_batch(self):
+        hydrate_relationships(self.graph, [(i, 10 + i, 11 + i, "NEXT", {}) for i in range(5)])
+        stats = self.graph.node_cache.stats()
+        assert stats["misses"] == 6
+        assert stats["hits"] == 0
+
+    def test_cached_relationship_properties_are_refreshed(self):
+        r = hydrate_relationship(self.graph, 7, start=1, end=2, type="KNOWS", data={"since": 1999})
+        relationships = hydrate_relationships(self.graph, [(7, 1, 2, "KNOWS", {"since": 2000})])
+        assert relationships[0] is r
+        assert r["since"] == 2000
+        assert not r._dirty
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from json import dumps as json_dumps
+from unittest import TestCase
+
+from py2neo.data import Node, Path, Relationship
+from py2neo.internal.json import JSONDehydrator, JSONDocumentReader, JSONHydrator, JSONStreamReader, \
+    ResultDataFormat, StandardJSONCodec, get_json_codec
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+def chunked(data, size):
+    data = data.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class JSONStreamReaderTestCase(TestCase):
+
+    document = u'{"a": [1, 23456, -7.5e3, true, null], "b": {"c": "d\\u00e9\\"f"}, "e": "üñî", "f": []}'
+
+    def read(self, chunks):
+        reader = JSONStreamReader(chunks)
+        content = {}
+        for key in reader.iter_object():
+            if key == "a":
+                content[key] = [reader.read_value() for _ in reader.iter_array()]
+            else:
+                content[key] = reader.read_value()
+        return content
+
+    def test_can_read_whole_document(self):
+        content = self.read(chunked(self.document, 1000))
+        self.assertEqual(content, {
+            "a": [1, 23456, -7500.0, True, None],
+            "b": {"c": u"dé\"f"},
+            "e": u"üñî",
+            "f": [],
+        })
+
+    def test_can_read_document_in_single_byte_chunks(self):
+        self.assertEqual(self.read(chunked(self.document, 1)), self.read(chunked(self.document, 1000)))
+
+    def test_can_read_document_in_small_chunks(self):
+        for size in range(2, 12):
+            self.assertEqual(self.read(chunked(self.document, size)), self.read(chunked(self.document, 1000)))
+
+    def test_value_spanning_many_chunks_is_decoded_once(self):
+        value = {u"s": u"x\\\"" * 1000, u"n": list(range(1000)), u"m": [{u"a": u"]}"}] * 100}
+        reader = JSONStreamReader(chunked(json_dumps([value, 12345678]), 7))
+        raw_decode = reader._raw_decode
+        decoded = []
+
+        def counting_raw_decode(text, start):
+            decoded.append(len(text) - start)
+            return raw_decode(text, start)
+
+        reader._raw_decode = counting_raw_decode
+        self.assertEqual([reader.read_value() for _ in reader.iter_array()], [value, 12345678])
+        self.assertEqual(len(decoded), 2)
+
+    def test_escape_at_end_of_chunk(self):
+        for size in range(1, 8):
+            reader = JSONStreamReader(chunked(u'["a\\\\", "b\\"c"]', size))
+            self.assertEqual([reader.read_value() for _ in reader.iter_array()], [u"a\\", u"b\"c"])
+
+    def test_number_at_end_of_stream(self):
+        reader = JSONStreamReader([b"12", b"34"])
+        self.assertEqual(reader.read_value(), 1234)
+
+    def test_invalid_literal(self):
+        reader = JSONStreamReader([b"[tru", b"ly]"])
+        with self.assertRaises(ValueError):
+            for _ in reader.iter_array():
+                reader.read_value()
+
+    def test_empty_object(self):
+        reader = JSONStreamReader([b" { } "])
+        self.assertEqual(list(reader.iter_object()), [])
+
+    def test_empty_array(self):
+        reader = JSONStreamReader([b"[", b"]"])
+        self.assertEqual(list(reader.iter_array()), [])
+
+    def test_unexpected_end_of_stream(self):
+        reader = JSONStreamReader([b'{"a": [1, 2'])
+        with self.assertRaises(ValueError):
+            for _ in reader.iter_object():
+                for _ in reader.iter_array():
+                    reader.read_value()
+
+    def test_unexpected_character(self):
+        reader = JSONStreamReader([b'{"a" 1}'])
+        with self.assertRaises(ValueError):
+            for _ in reader.iter_object():
+                reader.read_value()
+
+
+class JSONDocumentReaderTestCase(TestCase):
+
+    def test_can_navigate_document(self):
+        reader = JSONDocumentReader({u"a": [1, 2, {u"b": None}], u"c": u"d"})
+        content = {}
+        for key in reader.iter_object():
+            if key == u"a":
+                content[key] = [reader.read_value() for _ in reader.iter_array()]
+            else:
+                content[key] = reader.read_value()
+        self.assertEqual(content, {u"a": [1, 2, {u"b": None}], u"c": u"d"})
+
+    def test_unexpected_type(self):
+        reader = JSONDocumentReader([1, 2])
+        with self.assertRaises(ValueError):
+            list(reader.iter_object())
+
+
+class JSONCodecTestCase(TestCase):
+
+    value = {u"a": [1, 2.5, u"\u00e9", None, True], u"b": {u"c": -7}}
+
+    def test_standard_codec_round_trip(self):
+        codec = StandardJSONCodec()
+        data = codec.dumps(self.value)
+        assert isinstance(data, bytes)
+        self.assertEqual(codec.loads(data), self.value)
+
+    def test_default_codec_round_trip(self):
+        codec = get_json_codec()
+        self.assertEqual(codec.loads(codec.dumps(self.value)), self.value)
+
+    def test_orjson_codec_encodes_non_string_keys(self):
+        try:
+            codec = get_json_codec("orjson")
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        value = {1: u"a", None: u"b", 2.5: u"c"}
+        self.assertEqual(codec.dumps(value), StandardJSONCodec().dumps(value))
+        self.assertEqual(codec.loads(codec.dumps(value)), {u"1": u"a", u"null": u"b", u"2.5": u"c"})
+
+    def test_orjson_codec_falls_back_for_large_integers(self):
+        try:
+            codec = get_json_codec("orjson")
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        value = {u"x": [2 ** 64, -(2 ** 70)]}
+        self.assertEqual(codec.dumps(value), StandardJSONCodec().dumps(value))
+        self.assertEqual(StandardJSONCodec().loads(codec.dumps(value)), value)
+
+    def test_named_codec(self):
+        assert isinstance(get_json_codec("json"), StandardJSONCodec)
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            get_json_codec("xml")
+
+
+class DehydrationHookTestCase(TestCase):
+
+    class Point(object):
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    def codecs(self):
+        yield StandardJSONCodec()
+        try:
+            yield get_json_codec("orjson")
+        except ImportError:
+            pass
+
+    def test_native_values_are_encoded_without_hook(self):
+        dehydrator = JSONDehydrator()
+        value = {u"rows": [{u"a": [1, 2.5, u"x", None, True], u"t": (1, 2)}]}
+        for codec in self.codecs():
+            data = codec.dumps(value, default=dehydrator.default)
+            self.assertEqual(codec.loads(data), {u"rows": [{u"a": [1, 2.5, u"x", None, True], u"t": [1, 2]}]})
+
+    def test_dehydration_functions_are_applied_while_encoding(self):
+        dehydrator = JSONDehydrator()
+        dehydrator.dehydration_functions[self.Point] = lambda point: [point.x, point.y]
+        for codec in self.codecs():
+            data = codec.dumps({u"p": [self.Point(1, 2)]}, default=dehydrator.default)
+            self.assertEqual(codec.loads(data), {u"p": [[1, 2]]})
+
+    def test_unsupported_values_are_rejected(self):
+        dehydrator = JSONDehydrator()
+        for codec in self.codecs():
+            with self.assertRaises(TypeError):
+                codec.dumps({u"x": [object()]}, default=dehydrator.default)
+            with self.assertRaises(TypeError):
+                codec.dumps({u"x": {1, 2}}, default=dehydrator.default)
+
+
+class RowHydrationTestCase(TestCase):
+
+    graph_data = {
+        "nodes": [
+            {"id": "1", "labels": ["Person"], "properties": {"name": "Alice"}},
+            {"id": "2", "labels": ["Person"], "properties": {"name": "Bob"}},
+        ],
+        "relationships": [
+            {"id": "7", "type": "KNOWS", "startNode": "2", "endNode": "1", "properties": {"since": 1999}},
+        ],
+    }
+    alice_meta = {"id": 1, "type": "node", "deleted": False}
+    bob_meta = {"id": 2, "type": "node", "deleted": False}
+    knows_meta = {"id": 7, "type": "relationship", "deleted": False}
+
+    def hydrate(self, keys, row, meta, lite=False):
+        return JSONHydrator(StandInGraph(), keys, lite=lite).hydrate_row(row, meta, self.graph_data)
+
+    def test_scalars(self):
+        values = self.hydrate(("a", "b", "c"), [1, "x", None], [None, None, None])
+        self.assertEqual(values, (1, "x", None))
+
+    def test_node(self):
+        a, = self.hydrate(("a",), [{"name": "Alice"}], [self.alice_meta])
+        assert isinstance(a, Node)
+        self.assertEqual(a.identity, 1)
+        self.assertEqual(set(a.labels), {"Person"})
+        self.assertEqual(dict(a), {"name": "Alice"})
+
+    def test_relationship(self):
+        r, = self.hydrate(("r",), [{"since": 1999}], [self.knows_meta])
+        assert isinstance(r, Relationship)
+        self.assertEqual(r.identity, 7)
+        self.assertEqual(type(r).__name__, "KNOWS")
+        self.assertEqual(r.start_node.identity, 2)
+        self.assertEqual(r.end_node.identity, 1)
+        self.assertEqual(dict(r.start_node), {"name": "Bob"})
+        self.assertEqual(dict(r), {"since": 1999})
+
+    def test_path_directions_come_from_graph_data(self):
+        p, = self.hydrate(("p",), [[{"name": "Alice"}, {"since": 1999}, {"name": "Bob"}]],
+                          [[self.alice_meta, self.knows_meta, self.bob_meta]])
+        assert isinstance(p, Path)
+        self.assertEqual([n.identity for n in p.nodes], [1, 2])
+        r = p.relationships[0]
+        self.assertEqual(r.start_node.identity, 2)
+        self.assertEqual(r.end_node.identity, 1)
+        self.assertEqual(dict(p.start_node), {"name": "Alice"})
+
+    def test_list_of_entities_and_scalars(self):
+        (a, x, b), y = self.hydrate(("a", "b"), [[{"name": "Alice"}, 1, {"name": "Bob"}], 2],
+                                    [self.alice_meta, None, self.bob_meta, None])
+        self.assertEqual((a.identity, x, b.identity, y), (1, 1, 2, 2))
+
+    def test_map_containing_node(self):
+        m, = self.hydrate(("m",), [{"person": {"name": "Alice"}, "n": 1}], [self.alice_meta, None])
+        self.assertEqual(set(m), {"person", "n"})
+        self.assertEqual(m["person"].identity, 1)
+        self.assertEqual(m["n"], 1)
+
+    def test_list_of_maps_is_not_mistaken_for_path(self):
+        path_meta = [self.alice_meta, self.knows_meta, self.bob_meta]
+        value = [{"p": [{"name": "Alice"}, {"since": 1999}, {"name": "Bob"}]}, {"x": 1}, {"y": 2}]
+        (first, x, y), = self.hydrate(("m",), [value], [path_meta, None, None])
+        assert isinstance(first["p"], Path)
+        self.assertEqual((x, y), ({"x": 1}, {"y": 2}))
+
+    def test_lite_path(self):
+        p, = self.hydrate(("p",), [[{"name": "Alice"}, {"since": 1999}, {"name": "Bob"}]],
+                          [[self.alice_meta, self.knows_meta, self.bob_meta]], lite=True)
+        a, r, b = p
+        self.assertEqual((a.identity, r.identity, b.identity), (1, 7, 2))
+        self.assertEqual(r.start_node.identity, 2)
+
+
+class ResultDataFormatTestCase(TestCase):
+
+    def hydrate(self, result_format, data):
+        return result_format.hydrate(JSONHydrator(StandInGraph(), ("a",)), data)
+
+    def test_rest_is_requested_until_row_meta_is_seen(self):
+        result_format = ResultDataFormat()
+        self.assertEqual(result_format.contents(), ["row", "graph", "rest"])
+        data = {"row": [{"name": "Alice"}], "meta": [{"id": 1, "type": "node", "deleted": False}],
+                "graph": {"nodes": [{"id": "1", "labels": ["Person"], "properties": {"name": "Alice"}}],
+                          "relationships": []},
+                "rest": [{"self": "http://localhost:7474/db/data/node/1", "data": {"name": "Alice"},
+                          "metadata": {"id": 1, "labels": ["Person"]}}]}
+        a, = self.hydrate(result_format, data)
+        assert isinstance(a, Node)
+        self.assertEqual(a.identity, 1)
+        self.assertEqual(result_format.contents(), ["row", "graph"])
+
+    def test_rest_is_used_when_row_meta_is_missing(self):
+        result_format = ResultDataFormat()
+        data = {"row": [{"name": "Alice"}],
+                "graph": {"nodes": [{"id": "1", "labels": ["Person"], "properties": {"name": "Alice"}}],
+                          "relationships": []},
+                "rest": [{"self": "http://localhost:7474/db/data/node/1", "data": {"name": "Alice"},
+                          "metadata": {"id": 1, "labels": ["Person"]}}]}
+        a, = self.hydrate(result_format, data)
+        assert isinstance(a, Node)
+        self.assertEqual(a.identity, 1)
+        self.assertEqual(set(a.labels), {"Person"})
+        self.assertEqual(result_format.contents(), ["rest"])
+        b, = self.hydrate(result_format, {"rest": [{"name": "Bob"}]})
+        self.assertEqual(b, {"name": "Bob"})
+        self.assertEqual(result_format.contents(), ["rest"])
+
+    def test_row_without_meta_or_rest(self):
+        with self.assertRaises(ValueError):
+            self.hydrate(ResultDataFormat(), {"row": [1]})
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from py2neo.data import Node
+from py2neo.internal.operations import node_label_diff_dict, push_nodes_query
+
+
+class PushNodesTestCase(TestCase):
+
+    def test_nodes_grouped_by_label_diff(self):
+        a = Node("A")
+        a._remote_labels = frozenset(["A"])
+        b = Node("A", "B")
+        b._remote_labels = frozenset(["A"])
+        c = Node("B")
+        c._remote_labels = frozenset(["A"])
+        d = Node("B")
+        d._remote_labels = frozenset(["A"])
+        groups = node_label_diff_dict([a, b, c, d])
+        self.assertEqual(groups, {
+            (frozenset(), frozenset()): [a],
+            (frozenset(["B"]), frozenset()): [b],
+            (frozenset(["B"]), frozenset(["A"])): [c, d],
+        })
+
+    def test_query_without_label_changes(self):
+        query = push_nodes_query(frozenset(), frozenset())
+        self.assertEqual(query, "UNWIND $x AS data MATCH (_) WHERE id(_) = data[0]\n"
+                                "SET _ += data[1]")
+
+    def test_query_with_label_changes(self):
+        query = push_nodes_query(frozenset(["C", "B"]), frozenset(["A"]))
+        self.assertEqual(query, "UNWIND $x AS data MATCH (_) WHERE id(_) = data[0]\n"
+                                "SET _ += data[1]\n"
+                                "REMOVE _:A\n"
+                                "SET _:B:C")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from neo4j.packstream.structure import Structure
+
+from py2neo.data import Node, Path, Relationship
+from py2neo.internal.packstream import PackStreamHydrator
+
+from test.fixtures.stand_ins import StandInGraph
+
+
+def node(identity, name):
+    return Structure(b"N", identity, ["Person"], {"name": name})
+
+
+def relationship(identity, start, end):
+    return Structure(b"R", identity, start, end, "KNOWS", {"since": 1999})
+
+
+class HydrationPlanTestCase(TestCase):
+
+    def setUp(self):
+        self.graph = StandInGraph()
+
+    def hydrator(self, keys, **kwargs):
+        return PackStreamHydrator(self.graph, keys, **kwargs)
+
+    def test_scalar_rows(self):
+        hydrator = self.hydrator(("a", "b", "c"))
+        self.assertEqual(hydrator.hydrate([1, u"x", None]), (1, u"x", None))
+        self.assertEqual(hydrator.hydrate([2, u"y", 3.5]), (2, u"y", 3.5))
+
+    def test_scalar_column_falls_back_for_other_values(self):
+        hydrator = self.hydrator(("a", "b"))
+        hydrator.hydrate([1, 2])
+        a, b = hydrator.hydrate([node(1, u"Alice"), [node(2, u"Bob")]])
+        assert isinstance(a, Node)
+        self.assertEqual(dict(a), {"name": u"Alice"})
+        self.assertEqual(set(a.labels), {"Person"})
+        assert isinstance(b[0], Node)
+
+    def test_node_column(self):
+        hydrator = self.hydrator(("a",))
+        a1, = hydrator.hydrate([node(1, u"Alice")])
+        a2, = hydrator.hydrate([node(2, u"Bob")])
+        self.assertEqual((a1.identity, dict(a1)), (1, {"name": u"Alice"}))
+        self.assertEqual((a2.identity, dict(a2)), (2, {"name": u"Bob"}))
+        self.assertEqual(hydrator.hydrate([None]), (None,))
+
+    def test_relationship_column(self):
+        hydrator = self.hydrator(("r",))
+        hydrator.hydrate([relationship(7, 1, 2)])
+        r, = hydrator.hydrate([relationship(8, 2, 1)])
+        assert isinstance(r, Relationship)
+        self.assertEqual(r.identity, 8)
+        self.assertEqual(type(r).__name__, "KNOWS")
+        self.assertEqual((r.start_node.identity, r.end_node.identity), (2, 1))
+        self.assertEqual(dict(r), {"since": 1999})
+
+    def test_container_columns(self):
+        hydrator = self.hydrator(("l", "m"))
+        self.assertEqual(hydrator.hydrate([[1, 2], {"x": 1}]), ([1, 2], {"x": 1}))
+        l, m = hydrator.hydrate([[node(1, u"Alice")], {"x": node(2, u"Bob")}])
+        self.assertEqual(l[0].identity, 1)
+        self.assertEqual(m["x"].identity, 2)
+
+    def test_path(self):
+        hydrator = self.hydrator(("p",))
+        p, = hydrator.hydrate([Structure(b"P", [node(1, u"Alice"), node(2, u"Bob")],
+                                         [Structure(b"r", 7, "KNOWS", {})], [-1, 1])])
+        assert isinstance(p, Path)
+        r = p.relationships[0]
+        self.assertEqual((r.start_node.identity, r.end_node.identity), (2, 1))
+
+    def test_lite_node_column(self):
+        hydrator = self.hydrator(("a",), lite=True)
+        a, = hydrator.hydrate([node(1, u"Alice")])
+        assert not isinstance(a, Node)
+        self.assertEqual(a.identity, 1)
+
+    def test_pre_bound_entities(self):
+        alice = Node("Person", name=u"Alice")
+        hydrator = self.hydrator(("a", "n"), entities={"a": alice})
+        a, n = hydrator.hydrate([node(1, u"Alice"), 1])
+        self.assertIs(a, alice)
+        self.assertEqual(alice.identity, 1)
+
+    def test_pipelined_result_without_keys(self):
+        hydrator = self.hydrator(())
+        self.assertEqual(hydrator.hydrate([1, 2]), (1, 2))
+
+    def test_record_width_change_recompiles_plan(self):
+        hydrator = self.hydrator(())
+        hydrator.hydrate([1, 2])
+        a, = hydrator.hydrate([node(1, u"Alice")])
+        self.assertEqual(a.identity, 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright 2011-2018, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest import TestCase
+
+from py2neo.internal import pooling
+from py2neo.internal.pooling import SessionPool
+
+
+class FakeSession(object):
+
+    def __init__(self):
+        self._closed = False
+        self._transaction = None
+        self._connection = object()
+        self._bookmarks = ["bookmark:1"]
+
+    def closed(self):
+        return self._closed
+
+    def has_transaction(self):
+        return self._transaction is not None
+
+    def close(self):
+        self._closed = True
+
+    def _disconnect(self, sync):
+        self._connection = None
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self._closed = False
+
+    def close(self):
+        self._closed = True
+
+
+class FakeConnectionPool(object):
+
+    def __init__(self):
+        self.lock = None
+        self.cond = None
+        self.connections = {"localhost:7687": [FakeConnection()]}
+
+
+class FakeDriver(object):
+
+    def __init__(self):
+        self.sessions = []
+        self._pool = FakeConnectionPool()
+
+    def session(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+
+class SessionPoolTestCase(TestCase):
+
+    def test_acquire_creates_new_session_when_pool_is_empty(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        assert driver.sessions == [session]
+
+    def test_released_session_is_reused(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        pool.release(session)
+        assert len(pool) == 1
+        assert pool.acquire() is session
+        assert len(driver.sessions) == 1
+        assert not session.closed()
+
+    def test_released_session_returns_its_connection_to_the_driver(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        pool.release(session)
+        assert session._connection is None
+
+    def test_released_session_forgets_its_bookmarks(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        pool.release(session)
+        assert not session._bookmarks
+
+    def test_most_recently_released_session_is_reused_first(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        s1 = pool.acquire()
+        s2 = pool.acquire()
+        pool.release(s1)
+        pool.release(s2)
+        assert pool.acquire() is s2
+
+    def test_release_beyond_max_size_closes_session(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver, max_size=1)
+        s1 = pool.acquire()
+        s2 = pool.acquire()
+        pool.release(s1)
+        pool.release(s2)
+        assert len(pool) == 1
+        assert not s1.closed()
+        assert s2.closed()
+
+    def test_zero_size_pool_disables_pooling(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver, max_size=0)
+        session = pool.acquire()
+        pool.release(session)
+        assert session.closed()
+        assert pool.acquire() is not session
+
+    def test_session_with_open_transaction_is_not_pooled(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        session._transaction = object()
+        pool.release(session)
+        assert len(pool) == 0
+        assert session.closed()
+
+    def test_closed_session_is_not_pooled(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        session.close()
+        pool.release(session)
+        assert len(pool) == 0
+
+    def test_idle_sessions_expire(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver, idle_timeout=-1)
+        session = pool.acquire()
+        pool.release(session)
+        assert pool.acquire() is not session
+        assert session.closed()
+
+    def test_sessions_from_parent_process_are_abandoned_after_fork(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        pool.release(session)
+        pool._pid = -1
+        assert pool.acquire() is not session
+        assert not session.closed()
+
+    def test_connections_from_parent_process_are_forgotten_after_fork(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        inherited = driver._pool.connections["localhost:7687"][0]
+        pooling._connection_pool_pids[driver._pool] = -1
+        pool._pid = -1
+        pool.acquire()
+        assert driver._pool.connections == {}
+        assert driver._pool.lock is not None
+        assert inherited._closed
+
+    def test_connections_are_forgotten_only_once_per_driver_after_fork(self):
+        driver = FakeDriver()
+        first = SessionPool(driver)
+        second = SessionPool(driver)
+        pooling._connection_pool_pids[driver._pool] = -1
+        first._pid = second._pid = -1
+        first.acquire()
+        own = FakeConnection()
+        driver._pool.connections["localhost:7687"] = [own]
+        second.acquire()
+        assert driver._pool.connections == {"localhost:7687": [own]}
+        assert not own._closed
+
+    def test_close_closes_idle_sessions(self):
+        driver = FakeDriver()
+        pool = SessionPool(driver)
+        session = pool.acquire()
+        pool.release(session)
+        pool.close()
+        assert len(pool) == 0
+        assert session.closed()
@@ -16,9 +16,10 @@
 # limitations under the License.
 
 
+from pickle import dumps, loads
 from unittest import TestCase
 
-from py2neo.storage import FrozenGraphStore, MutableGraphStore
+from py2neo.storage import FrozenGraphStore, MutableGraphStore, PropertyRecord, Record, RecordSchema, record_zipper
 
 
 class GraphStoreTestCase(TestCase):
@@ -334,3 +335,100 @@ class MutableGraphStoreTestCase(TestCase):
         self.assertEqual(set(store.relationships(r_type="KNOWS")), {"ab"})
         self.assertEqual(store.relationship_type("ab"), "KNOWS")
         self.assertEqual(store.relationship_properties("ab"), {"since": 1999})
+
+
+class RecordTestCase(TestCase):
+
+    def test_records_with_same_keys_share_schema(self):
+        r1 = Record([("a", 1), ("b", 2)])
+        r2 = Record([("a", 3), ("b", 4)])
+        assert r1._schema is r2._schema
+        assert type(r1) is type(r2)
+        assert isinstance(r1, Record)
+
+    def test_records_with_different_keys_have_different_schemas(self):
+        r1 = Record([("a", 1), ("b", 2)])
+        r2 = Record([("b", 1), ("a", 2)])
+        assert r1._schema is not r2._schema
+
+    def test_key_lookup(self):
+        r = Record([("a", 1), ("b", 2)])
+        assert r["a"] == 1
+        assert r["b"] == 2
+        assert r[0] == 1
+        assert r[1] == 2
+        assert r.index("b") == 1
+        with self.assertRaises(KeyError):
+            _ = r["c"]
+        with self.assertRaises(IndexError):
+            _ = r[2]
+
+    def test_get(self):
+        r = Record([("a", 1), ("b", 2)])
+        assert r.get("a") == 1
+        assert r.get("c") is None
+        assert r.get("c", 3) == 3
+
+    def test_duplicate_keys_resolve_to_first_occurrence(self):
+        r = Record([("a", 1), ("a", 2)])
+        assert r["a"] == 1
+        assert r.keys() == ["a", "a"]
+        assert list(r) == [1, 2]
+
+    def test_keys_values_items_and_data(self):
+        r = Record([("a", 1), ("b", 2)])
+        assert r.keys() == ["a", "b"]
+        assert r.values() == [1, 2]
+        assert r.items() == [("a", 1), ("b", 2)]
+        assert r.data() == {"a": 1, "b": 2}
+        assert r.data("b", "c") == {"b": 2, "c": None}
+
+    def test_slice(self):
+        r = Record([("a", 1), ("b", 2), ("c", 3)])
+        s = r[1:]
+        assert isinstance(s, Record)
+        assert s.keys() == ["b", "c"]
+        assert list(s) == [2, 3]
+
+    def test_repr(self):
+        r = Record([("a", 1), ("b", "x")])
+        assert repr(r) == "<Record a=1 b='x'>"
+
+    def test_equality_and_hash(self):
+        r1 = Record([("a", 1), ("b", 2)])
+        r2 = Record([("a", 1), ("b", 2)])
+        assert r1 == r2
+        assert hash(r1) == hash(r2)
+
+    def test_record_from_record(self):
+        r1 = Record([("a", 1), ("b", 2)])
+        r2 = Record(r1)
+        assert r2 == r1
+        assert r2._schema is r1._schema
+
+    def test_pickle(self):
+        r1 = Record([("a", 1), ("b", 2)])
+        r2 = loads(dumps(r1))
+        assert r2 == r1
+        assert r2.keys() == ["a", "b"]
+        assert r2._schema is r1._schema
+
+    def test_schema_record(self):
+        schema = RecordSchema.get(("a", "b"))
+        r = schema.record((1, 2))
+        assert r._schema is schema
+        assert r.data() == {"a": 1, "b": 2}
+
+    def test_zipper_reuses_schema_for_same_keys(self):
+        zipper = record_zipper()
+        keys = ("a", "b")
+        r1 = zipper(keys, (1, 2))
+        r2 = zipper(keys, (3, 4))
+        assert r1._schema is r2._schema
+        assert r2.data() == {"a": 3, "b": 4}
+
+    def test_property_record(self):
+        r = PropertyRecord({"b": 2, "a": 1, "c": None})
+        assert isinstance(r, PropertyRecord)
+        assert r.keys() == ["a", "b"]
+        assert repr(r) == "PropertyRecord(a=1, b=2)"